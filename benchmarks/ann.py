@@ -0,0 +1,152 @@
+"""
+Recall and latency of the FAISS vector store index types.
+
+Fills one FAISS store per index type with the same synthetic, clustered vectors, then runs the same
+queries against each of them. For each index type it reports:
+
+- build: time to insert the collection, including training and the flat-to-ANN upgrade
+- search: latency of unfiltered `search` calls
+- filtered_search: latency of `search` calls scoped to one user
+- recall: recall@k of the unfiltered searches against the exact ("flat") results
+
+Results are written as JSON.
+
+Usage:
+    python benchmarks/ann.py [--size 200000] [--dims 128] [--index-types flat,hnsw,ivf_flat,ivf_pq]
+                             [--k 10] [--queries 200] [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from mem0.vector_stores.faiss import FAISS
+
+INSERT_BATCH_SIZE = 10000
+
+
+def _percentile(values, percentile):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _latency_stats(latencies):
+    return {
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+    }
+
+
+def synthetic_vectors(size, dims, seed):
+    """Return `size` vectors drawn around random centers, closer to real embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, size // 1000), dims)).astype(np.float32)
+    vectors = centers[rng.integers(len(centers), size=size)] + 0.3 * rng.normal(size=(size, dims)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def run_index_type(index_type, vectors, queries, args):
+    path = tempfile.mkdtemp(prefix="mem0-ann-benchmark-")
+    try:
+        store = FAISS(
+            collection_name="benchmark",
+            path=path,
+            embedding_model_dims=vectors.shape[1],
+            index_type=index_type,
+            write_log=True,
+            checkpoint_bytes=1 << 40,
+            pq_m=args.pq_m,
+        )
+        start = time.perf_counter()
+        for batch_start in range(0, len(vectors), INSERT_BATCH_SIZE):
+            batch = vectors[batch_start : batch_start + INSERT_BATCH_SIZE]
+            ids = [str(i) for i in range(batch_start, batch_start + len(batch))]
+            payloads = [{"data": f"memory {i}", "user_id": f"user-{int(i) % args.users}"} for i in ids]
+            store.insert(batch, payloads, ids)
+        build_s = time.perf_counter() - start
+
+        results, latencies = [], []
+        for query in queries:
+            start = time.perf_counter()
+            results.append([result.id for result in store.search("", query, limit=args.k)])
+            latencies.append(time.perf_counter() - start)
+
+        filtered_latencies = []
+        for i, query in enumerate(queries):
+            start = time.perf_counter()
+            store.search("", query, limit=args.k, filters={"user_id": f"user-{i % args.users}"})
+            filtered_latencies.append(time.perf_counter() - start)
+
+        info = store.col_info()
+        store.close()
+        return results, {
+            "index": info["index_type"],
+            "build_s": build_s,
+            "search": _latency_stats(latencies),
+            "filtered_search": _latency_stats(filtered_latencies),
+        }
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def recall(results, exact_results):
+    hits = sum(len(set(found) & set(expected)) for found, expected in zip(results, exact_results))
+    return hits / max(1, sum(len(expected) for expected in exact_results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200000, help="Number of vectors in the collection")
+    parser.add_argument("--dims", type=int, default=128, help="Vector dimensions")
+    parser.add_argument("--index-types", default="flat,hnsw,ivf_flat,ivf_pq", help="Comma-separated index types")
+    parser.add_argument("--k", type=int, default=10, help="Results per search")
+    parser.add_argument("--queries", type=int, default=200, help="Number of searches per index type")
+    parser.add_argument("--users", type=int, default=1000, help="Number of users the vectors are spread over")
+    parser.add_argument("--pq-m", type=int, default=16, help="PQ sub-quantizers for ivf_pq")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    # Queries come from the same distribution as the collection, but are not part of it.
+    vectors = synthetic_vectors(args.size + args.queries, args.dims, seed=0)
+    vectors, queries = vectors[: args.size], vectors[args.size :]
+
+    index_types = args.index_types.split(",")
+    if "flat" in index_types:
+        index_types.remove("flat")
+    print("Running flat...", file=sys.stderr)
+    exact_results, flat_stats = run_index_type("flat", vectors, queries, args)
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "size": args.size,
+            "dims": args.dims,
+            "k": args.k,
+        },
+        "results": {"flat": {**flat_stats, "recall": 1.0}},
+    }
+    for index_type in index_types:
+        print(f"Running {index_type}...", file=sys.stderr)
+        index_results, stats = run_index_type(index_type, vectors, queries, args)
+        results["results"][index_type] = {**stats, "recall": recall(index_results, exact_results)}
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Import-time regression check for `import mem0`.
+
+Runs `python -X importtime -c "import mem0"` in fresh interpreters and fails when the cumulative
+import time of the `mem0` package exceeds the budget, or when importing the package alone loads
+modules that should only be imported on first use of `Memory`, `AsyncMemory` or the clients.
+
+Usage:
+    python benchmarks/import_time.py [--max-ms 50] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Modules that `import mem0` must not load.
+LAZY_MODULES = ["mem0.client.main", "mem0.memory.main", "mem0.memory.telemetry", "posthog", "httpx", "openai"]
+
+
+def measure_import_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mem0"], capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "mem0":
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"Could not find mem0 in the -X importtime output:\n{result.stderr}")
+
+
+def eagerly_loaded_modules():
+    code = f"import json, sys, mem0; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-ms", type=float, default=50.0, help="Budget for the median import time")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters to measure")
+    args = parser.parse_args()
+
+    timings = [measure_import_ms() for _ in range(args.repeat)]
+    median = statistics.median(timings)
+    print(f"import mem0: median {median:.2f} ms, min {min(timings):.2f} ms, max {max(timings):.2f} ms")
+
+    failures = []
+    if median > args.max_ms:
+        failures.append(f"median import time {median:.2f} ms exceeds the {args.max_ms:.2f} ms budget")
+    loaded = eagerly_loaded_modules()
+    if loaded:
+        failures.append(f"`import mem0` eagerly loads {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
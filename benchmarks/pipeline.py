@@ -0,0 +1,210 @@
+"""
+Offline benchmark of the Memory add/search pipeline.
+
+Uses the deterministic stand-ins from `stand_ins.py` for the LLM and embedder, the FAISS vector
+store and an in-memory SQLite history. For each collection size, the store is first filled with
+synthetic memories spread over `size / memories-per-user` users. The benchmark then measures:
+
+- add: `Memory.add` with inference, one message per call (throughput and latency)
+- search: `Memory.search` scoped to one user (latency)
+- get_all: `Memory.get_all` scoped to one user (latency)
+- delete_all: `Memory.delete_all` of one user (latency)
+
+Results are written as JSON. When a baseline file is given, every metric is compared with it and
+the script exits with status 1 if any metric regressed by more than the tolerance.
+
+Usage:
+    python benchmarks/pipeline.py [--sizes 1000,100000,1000000] [--index-type flat] [--output results.json]
+                                  [--baseline baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+os.environ.setdefault("MEM0_TELEMETRY", "false")
+
+import pytz  # noqa: E402
+
+from mem0.memory.main import Memory  # noqa: E402
+from stand_ins import HashEmbedding, stand_in_providers  # noqa: E402
+
+EMBEDDING_DIMS = 64
+POPULATE_BATCH_SIZE = 10000
+
+
+def _percentile(values, percentile):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _latency_stats(latencies):
+    return {
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+    }
+
+
+def _timed(call, runs):
+    latencies = []
+    for i in range(runs):
+        start = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def create_memory(path, index_type="flat"):
+    config = {
+        "vector_store": {
+            "provider": "faiss",
+            "config": {
+                "collection_name": "benchmark",
+                "path": path,
+                "embedding_model_dims": EMBEDDING_DIMS,
+                "index_type": index_type,
+            },
+        },
+        "llm": {"provider": "openai", "config": {}},
+        "embedder": {"provider": "openai", "config": {"embedding_dims": EMBEDDING_DIMS}},
+        "history_db_path": ":memory:",
+        "telemetry_vector_store": False,
+    }
+    with stand_in_providers(EMBEDDING_DIMS):
+        return Memory.from_config(config)
+
+
+def populate(memory, size, users):
+    """Insert `size` synthetic memories directly into the vector store, bypassing the LLM."""
+    embedder = HashEmbedding(EMBEDDING_DIMS)
+    created_at = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    for start in range(0, size, POPULATE_BATCH_SIZE):
+        texts = [f"synthetic memory {i}" for i in range(start, min(size, start + POPULATE_BATCH_SIZE))]
+        payloads = [
+            {
+                "data": text,
+                "hash": hashlib.md5(text.encode()).hexdigest(),
+                "user_id": f"user-{(start + i) % users}",
+                "created_at": created_at,
+            }
+            for i, text in enumerate(texts)
+        ]
+        memory.vector_store.insert(
+            vectors=embedder.embed_batch(texts),
+            payloads=payloads,
+            ids=[str(uuid.uuid4()) for _ in texts],
+        )
+
+
+def run_size(size, args):
+    path = tempfile.mkdtemp(prefix="mem0-benchmark-")
+    try:
+        memory = create_memory(path, args.index_type)
+        users = max(1, size // args.memories_per_user)
+        rng = random.Random(size)
+
+        start = time.perf_counter()
+        populate(memory, size, users)
+        populate_s = time.perf_counter() - start
+
+        add_latencies = _timed(
+            lambda i: memory.add(f"new fact {i} for size {size}", user_id=f"user-{rng.randrange(users)}"), args.adds
+        )
+        search_latencies = _timed(
+            lambda i: memory.search(f"synthetic memory {rng.randrange(size)}", user_id=f"user-{rng.randrange(users)}"),
+            args.queries,
+        )
+        get_all_latencies = _timed(
+            lambda i: memory.get_all(user_id=f"user-{rng.randrange(users)}", limit=args.memories_per_user),
+            args.queries,
+        )
+        delete_all_latencies = _timed(lambda i: memory.delete_all(user_id=f"user-{i % users}"), args.delete_alls)
+        memory.close()
+
+        return {
+            "populate_s": populate_s,
+            "add": {"ops_per_s": args.adds / sum(add_latencies), **_latency_stats(add_latencies)},
+            "search": _latency_stats(search_latencies),
+            "get_all": _latency_stats(get_all_latencies),
+            "delete_all": _latency_stats(delete_all_latencies),
+        }
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def compare(results, baseline, tolerance):
+    """Return a description of every metric that regressed by more than `tolerance` against the baseline."""
+    regressions = []
+    for size, operations in results["results"].items():
+        for operation, metrics in operations.items():
+            if not isinstance(metrics, dict):
+                continue
+            for metric, value in metrics.items():
+                reference = baseline.get("results", {}).get(size, {}).get(operation, {}).get(metric)
+                if not reference:
+                    continue
+                higher_is_better = metric == "ops_per_s"
+                change = (reference - value) / reference if higher_is_better else (value - reference) / reference
+                if change > tolerance:
+                    regressions.append(
+                        f"{size} {operation}.{metric}: {value:.3f} vs baseline {reference:.3f} ({change:+.0%} worse)"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="Comma-separated collection sizes")
+    parser.add_argument("--memories-per-user", type=int, default=100, help="Memories per synthetic user")
+    parser.add_argument("--adds", type=int, default=100, help="Number of add calls measured per size")
+    parser.add_argument("--queries", type=int, default=200, help="Number of search and get_all calls per size")
+    parser.add_argument("--delete-alls", type=int, default=3, help="Number of delete_all calls per size")
+    parser.add_argument("--index-type", default="flat", help="FAISS index type (see benchmarks/ann.py for recall)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression per metric")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "embedding_dims": EMBEDDING_DIMS,
+            "memories_per_user": args.memories_per_user,
+            "index_type": args.index_type,
+        },
+        "results": {},
+    }
+    for size in (int(size) for size in args.sizes.split(",")):
+        print(f"Running size {size}...", file=sys.stderr)
+        results["results"][str(size)] = run_size(size, args)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
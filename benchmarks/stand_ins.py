@@ -0,0 +1,71 @@
+"""
+Deterministic local stand-ins for the LLM and embedding providers, so the benchmarks run offline
+and measure mem0 itself rather than network latency.
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from typing import List, Literal, Optional
+
+import numpy as np
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.llms.base import LLMBase
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+
+class HashEmbedding(EmbeddingBase):
+    """
+    Like `MockEmbeddings`, but returns a distinct unit vector per text, derived from its hash, so
+    similarity search has something to rank.
+    """
+
+    def __init__(self, embedding_dims: int = 64):
+        super().__init__()
+        self.config.embedding_dims = embedding_dims
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        vectors = np.empty((len(texts), self.config.embedding_dims), dtype=np.float32)
+        for i, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+            vectors[i] = np.random.default_rng(seed).standard_normal(self.config.embedding_dims)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors.tolist()
+
+
+class CannedLLM(LLMBase):
+    """
+    Answers the fact extraction prompt with one fact per user message, and the update prompt with
+    an ADD action for each of those facts.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._last_facts = []
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        if len(messages) == 2:
+            conversation = messages[-1]["content"].split("Input:\n", 1)[-1]
+            self._last_facts = [
+                line[len("user: ") :] for line in conversation.splitlines() if line.startswith("user: ")
+            ]
+            return json.dumps({"facts": self._last_facts})
+        return json.dumps(
+            {"memory": [{"id": str(i), "text": fact, "event": "ADD"} for i, fact in enumerate(self._last_facts)]}
+        )
+
+
+@contextmanager
+def stand_in_providers(embedding_dims: int = 64):
+    """Make the embedder and LLM factories return the stand-ins, whatever provider is configured."""
+    embedder_create, llm_create = EmbedderFactory.__dict__["create"], LlmFactory.__dict__["create"]
+    EmbedderFactory.create = staticmethod(lambda *args, **kwargs: HashEmbedding(embedding_dims))
+    LlmFactory.create = staticmethod(lambda *args, **kwargs: CannedLLM())
+    try:
+        yield
+    finally:
+        EmbedderFactory.create, LlmFactory.create = embedder_create, llm_create
@@ -0,0 +1,82 @@
+"""
+Break down the cost of `Memory.from_config` by component.
+
+Times the embedder, vector store, LLM and history database creation done by `Memory.__init__`, the
+remainder (graph store, telemetry setup...) as "other", and separately the creation of the
+"mem0migrations" telemetry store, which `Memory` defers to the first telemetry event.
+
+Usage:
+    python benchmarks/startup.py --config config.json [--repeat 5]
+
+`config.json` holds the dict passed to `Memory.from_config`.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+
+import mem0.memory.main as memory_main
+from mem0.memory.main import Memory
+
+
+@contextmanager
+def _timed(owner, name, label, timings):
+    original = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings[label] += time.perf_counter() - start
+
+    setattr(owner, name, wrapper)
+    try:
+        yield
+    finally:
+        setattr(owner, name, original)
+
+
+def measure_startup(config_dict):
+    timings = defaultdict(float)
+    with ExitStack() as stack:
+        stack.enter_context(_timed(memory_main.EmbedderFactory, "create", "embedder", timings))
+        stack.enter_context(_timed(memory_main.VectorStoreFactory, "create", "vector_store", timings))
+        stack.enter_context(_timed(memory_main.LlmFactory, "create", "llm", timings))
+        stack.enter_context(_timed(memory_main, "_create_history_db", "history_db", timings))
+        start = time.perf_counter()
+        memory = Memory.from_config(config_dict)
+        total = time.perf_counter() - start
+
+    timings["other"] = total - sum(timings.values())
+    timings["total"] = total
+
+    start = time.perf_counter()
+    memory._get_telemetry_vector_store()
+    timings["telemetry_vector_store (deferred)"] = time.perf_counter() - start
+
+    memory.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", required=True, help="JSON file with the Memory.from_config dict")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of Memory instances to create")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config_dict = json.load(f)
+
+    runs = [measure_startup(config_dict) for _ in range(args.repeat)]
+    print(f"{'component':<36}{'mean ms':>10}{'min ms':>10}{'max ms':>10}")
+    for label in runs[0]:
+        values = [run[label] * 1000 for run in runs]
+        print(f"{label:<36}{statistics.mean(values):>10.2f}{min(values):>10.2f}{max(values):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
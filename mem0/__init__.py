@@ -1,6 +1,41 @@
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING
 
-# __version__ = importlib.metadata.version("mem0ai")
+if TYPE_CHECKING:
+    from mem0.client.main import AsyncMemoryClient, MemoryClient  # noqa
+    from mem0.memory.main import AsyncMemory, Memory  # noqa
 
-from mem0.client.main import AsyncMemoryClient, MemoryClient  # noqa
-from mem0.memory.main import AsyncMemory, Memory  # noqa
+# The public classes are imported on first access, so `import mem0` does not pull in the clients,
+# the providers or telemetry.
+_LAZY_ATTRIBUTES = {
+    "Memory": "mem0.memory.main",
+    "AsyncMemory": "mem0.memory.main",
+    "MemoryClient": "mem0.client.main",
+    "AsyncMemoryClient": "mem0.client.main",
+}
+
+__all__ = ["AsyncMemory", "AsyncMemoryClient", "Memory", "MemoryClient", "__version__"]
+
+
+def _get_version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("mem0ai")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _get_version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,33 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class HistoryDbConfig(BaseModel):
+    write_behind: bool = Field(
+        description="Buffer history rows and commit them in batches from a background thread",
+        default=False,
+    )
+    flush_interval: float = Field(
+        description="Seconds between two commits of buffered history rows in write-behind mode",
+        default=0.1,
+    )
+    batch_size: int = Field(
+        description="Number of buffered history rows that triggers a commit before the flush interval elapses",
+        default=100,
+    )
+    wal: bool = Field(
+        description="Open file databases in WAL mode, letting reads run alongside writes",
+        default=True,
+    )
+    synchronous: str = Field(
+        description="SQLite synchronous setting of the writer connection: OFF, NORMAL, FULL or EXTRA",
+        default="NORMAL",
+    )
+    read_connections: int = Field(
+        description="Number of read-only connections used for history lookups in WAL mode",
+        default=2,
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -43,6 +70,10 @@ class MemoryConfig(BaseModel):
         description="Path to the history database",
         default=os.path.join(mem0_dir, "history.db"),
     )
+    history_db: HistoryDbConfig = Field(
+        description="Configuration for the history database",
+        default_factory=HistoryDbConfig,
+    )
     graph_store: GraphStoreConfig = Field(
         description="Configuration for the graph",
         default_factory=GraphStoreConfig,
@@ -59,6 +90,42 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    duplicate_similarity_threshold: Optional[float] = Field(
+        description="Neighbor score at or above which a new fact is treated as a duplicate and skipped without "
+        "calling the update LLM. Opt-in: disabled when None, since the score scale depends on the vector store "
+        "and its distance metric. Only set it for stores that report similarities (higher is closer), e.g. "
+        "0.95 for cosine similarity",
+        default=None,
+    )
+    novelty_similarity_threshold: Optional[float] = Field(
+        description="Neighbor score below which a new fact is added without calling the update LLM. Opt-in: "
+        "disabled when None, in which case only facts without neighbors skip the LLM. Only set it for stores "
+        "that report similarities (higher is closer), e.g. 0.5 for cosine similarity",
+        default=None,
+    )
+    search_mode: Literal["vector", "hybrid"] = Field(
+        description="'vector' for dense retrieval only, or 'hybrid' to fuse it with the vector store's keyword "
+        "search over the memory text. In hybrid mode, search scores and thresholds are fused scores",
+        default="vector",
+    )
+    hybrid_fusion: Literal["rrf", "normalized"] = Field(
+        description="How hybrid search merges the two rankings: 'rrf' (reciprocal rank fusion) or 'normalized' "
+        "(sum of min-max normalized scores)",
+        default="rrf",
+    )
+    executor_max_workers: Optional[int] = Field(
+        description="Maximum number of threads in the executor shared by a Memory instance",
+        default=None,
+    )
+    telemetry_vector_store: bool = Field(
+        description="Keep the anonymous telemetry user id in a 'mem0migrations' collection of the vector store. "
+        "The collection is created on the first telemetry event; when disabled, only the local config file is used",
+        default=True,
+    )
+    action_parallelism: int = Field(
+        description="Maximum number of memory actions (update lookups and deletes) run concurrently by Memory",
+        default=4,
+    )
 
 
 class AzureConfig(BaseModel):
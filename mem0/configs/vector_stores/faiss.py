@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -13,6 +13,28 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    write_log: bool = Field(
+        False, description="Persist writes to an append-only log checkpointed in the background"
+    )
+    checkpoint_bytes: int = Field(64 * 1024 * 1024, description="Write log size that triggers a checkpoint")
+    checkpoint_interval: float = Field(300.0, description="Seconds after which a non-empty write log is checkpointed")
+    index_type: Literal["flat", "hnsw", "ivf_flat", "ivf_pq", "auto"] = Field(
+        "flat",
+        description="Index type. 'auto' starts flat and moves to IVF-Flat at upgrade_threshold vectors",
+    )
+    hnsw_m: int = Field(32, description="Neighbors per HNSW node")
+    hnsw_ef_construction: int = Field(40, description="HNSW candidate list size while adding")
+    hnsw_ef_search: int = Field(64, description="HNSW candidate list size while searching")
+    nlist: Optional[int] = Field(None, description="Number of IVF lists. Defaults to 4 * sqrt(collection size)")
+    nprobe: int = Field(16, description="Number of IVF lists visited per search")
+    pq_m: int = Field(16, description="Number of PQ sub-quantizers for ivf_pq; must divide embedding_model_dims")
+    pq_nbits: int = Field(8, description="Bits per PQ code for ivf_pq")
+    upgrade_threshold: int = Field(100_000, description="Collection size at which the 'auto' index type moves to IVF")
+    mmap: bool = Field(
+        False,
+        description="Memory-map the index and read the docstore on demand; for read-mostly collections shared by "
+        "several processes",
+    )
 
     @model_validator(mode="before")
     @classmethod
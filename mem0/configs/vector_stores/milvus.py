@@ -25,6 +25,11 @@ class MilvusDBConfig(BaseModel):
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: int = Field(1536, description="Dimensions of the embedding model")
     metric_type: str = Field("L2", description="Metric type for similarity search")
+    enable_full_text_search: bool = Field(
+        False,
+        description="Index the memory text with Milvus' BM25 function for keyword and hybrid search (Milvus 2.5+). "
+        "Only applies to collections created with it enabled",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 try:
     import boto3
@@ -19,6 +19,9 @@ class AWSBedrockEmbedding(EmbeddingBase):
     This class uses AWS Bedrock's embedding models.
     """
 
+    # Cohere embedding models accept at most 96 texts per request.
+    COHERE_MAX_BATCH_SIZE = 96
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -85,6 +88,23 @@ class AWSBedrockEmbedding(EmbeddingBase):
         except Exception as e:
             raise ValueError(f"Error getting embedding from AWS Bedrock: {e}")
 
+    def _get_cohere_embeddings(self, texts):
+        """Call out to the Bedrock Cohere embedding endpoint with several texts at once."""
+        body = json.dumps({"input_type": "search_document", "texts": texts})
+
+        try:
+            response = self.client.invoke_model(
+                body=body,
+                modelId=self.config.model,
+                accept="application/json",
+                contentType="application/json",
+            )
+
+            response_body = json.loads(response.get("body").read())
+            return response_body.get("embeddings")
+        except Exception as e:
+            raise ValueError(f"Error getting embedding from AWS Bedrock: {e}")
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Get the embedding for the given text using AWS Bedrock.
@@ -96,3 +116,24 @@ class AWSBedrockEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         return self._get_embedding(text)
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using AWS Bedrock.
+
+        Cohere models receive the texts in as few requests as possible; other providers only accept
+        a single input per request and are called once per text.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        if self.config.model.split(".")[0] != "cohere":
+            return [self._get_embedding(text) for text in texts]
+
+        embeddings = []
+        for start in range(0, len(texts), self.COHERE_MAX_BATCH_SIZE):
+            embeddings.extend(self._get_cohere_embeddings(texts[start : start + self.COHERE_MAX_BATCH_SIZE]))
+        return embeddings
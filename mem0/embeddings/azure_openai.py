@@ -1,7 +1,7 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
@@ -25,6 +25,19 @@ class AzureOpenAIEmbedding(EmbeddingBase):
             http_client=self.config.http_client,
             default_headers=default_headers,
         )
+        # The configured proxy client is synchronous; without one, calls from AsyncMemory use a native
+        # async client, otherwise they fall back to running the sync client in a worker thread.
+        self.async_client = (
+            AsyncAzureOpenAI(
+                azure_deployment=azure_deployment,
+                azure_endpoint=azure_endpoint,
+                api_version=api_version,
+                api_key=api_key,
+                default_headers=default_headers,
+            )
+            if self.config.http_client is None
+            else None
+        )
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -38,3 +51,51 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts with a single Azure OpenAI request.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        response = self.client.embeddings.create(input=texts, model=self.config.model)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using the async Azure OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return (await self.aembed_batch([text], memory_action))[0]
+
+    async def aembed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ):
+        """
+        Get the embeddings for a list of texts with a single request from the async Azure OpenAI client.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        if self.async_client is None:
+            return await super().aembed_batch(texts, memory_action)
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        response = await self.async_client.embeddings.create(input=texts, model=self.config.model)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
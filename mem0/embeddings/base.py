@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 
@@ -29,3 +30,40 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[list]:
+        """
+        Get the embeddings for a list of texts.
+
+        Providers that accept several inputs per request should override this to send a single request.
+        The default implementation calls `embed` once per text.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        return [self.embed(text, memory_action) for text in texts]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Async version of `embed`.
+
+        Providers with an async client should override this. The default implementation runs `embed`
+        in a worker thread.
+        """
+        return await asyncio.to_thread(self.embed, text, memory_action)
+
+    async def aembed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[list]:
+        """
+        Async version of `embed_batch`.
+
+        Providers with an async client should override this. The default implementation runs
+        `embed_batch` in a worker thread.
+        """
+        return await asyncio.to_thread(self.embed_batch, texts, memory_action)
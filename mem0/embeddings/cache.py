@@ -0,0 +1,119 @@
+import hashlib
+import logging
+from typing import Any, Dict, List, Literal, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbedding(EmbeddingBase):
+    """
+    Wraps any embedding model with a size-bounded in-process LRU cache and an optional SQLite tier.
+
+    Entries are keyed on the provider, model, embedding dims, memory action and a hash of the text,
+    so switching models or dimensions never returns stale vectors. Lookups go to the LRU first, then
+    to the persistent tier, and only the remaining misses reach the wrapped model.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, provider: str, max_size: int = 10000, path: Optional[str] = None):
+        super().__init__(embedder.config)
+        self.embedder = embedder
+        self.provider = provider
+        self.max_size = max_size
+        self.cache = TieredCache(max_size, path, table="embedding_cache")
+
+    def __getattr__(self, name):
+        # Expose provider-specific attributes (client, model names...) of the wrapped model.
+        if name == "embedder":
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def _cache_key(self, text: str, memory_action: Optional[str]) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        # Some providers resolve their model from a provider-specific setting rather than `config.model`.
+        model = getattr(self.embedder, "model", None) or self.config.model
+        return f"{self.provider}:{model}:{self.config.embedding_dims}:{memory_action}:{text_hash}"
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, from the cache when possible.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        key = self._cache_key(text, memory_action)
+        found = self.cache.get_many([key])
+        if key in found:
+            return list(found[key])
+
+        embedding = self.embedder.embed(text, memory_action)
+        self.cache.set_many({key: embedding})
+        return list(embedding)
+
+    def embed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[list]:
+        """
+        Get the embeddings for a list of texts. Only texts missing from the cache are sent to the
+        wrapped model, in a single `embed_batch` call.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        keys, found, missing = self._partition(texts, memory_action)
+        if missing:
+            computed = dict(zip(missing, self.embedder.embed_batch(list(missing.values()), memory_action)))
+            self.cache.set_many(computed)
+            found.update(computed)
+
+        return [list(found[key]) for key in keys]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Async version of `embed`, using the async client of the wrapped model on a miss."""
+        key = self._cache_key(text, memory_action)
+        found = self.cache.get_many([key])
+        if key in found:
+            return list(found[key])
+
+        embedding = await self.embedder.aembed(text, memory_action)
+        self.cache.set_many({key: embedding})
+        return list(embedding)
+
+    async def aembed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[list]:
+        """Async version of `embed_batch`, using the async client of the wrapped model for the misses."""
+        keys, found, missing = self._partition(texts, memory_action)
+        if missing:
+            computed = dict(zip(missing, await self.embedder.aembed_batch(list(missing.values()), memory_action)))
+            self.cache.set_many(computed)
+            found.update(computed)
+
+        return [list(found[key]) for key in keys]
+
+    def _partition(self, texts: List[str], memory_action: Optional[str]):
+        """Return the cache key of each text, the cached embeddings found and the texts still to embed."""
+        keys = [self._cache_key(text, memory_action) for text in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        return keys, found, missing
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of entries held in memory."""
+        return self.cache.stats()
+
+    def clear(self) -> None:
+        """Drop every cached embedding, including the persistent tier, and reset the counters."""
+        self.cache.clear()
@@ -3,12 +3,25 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+class EmbeddingCacheConfig(BaseModel):
+    enabled: bool = Field(description="Whether to cache embeddings", default=False)
+    max_size: int = Field(description="Maximum number of embeddings kept in the in-process LRU cache", default=10000)
+    path: Optional[str] = Field(
+        description="Path of a SQLite file used as a persistent cache tier. Defaults to in-process caching only",
+        default=None,
+    )
+
+
 class EmbedderConfig(BaseModel):
     provider: str = Field(
         description="Provider of the embedding model (e.g., 'ollama', 'openai')",
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache: EmbeddingCacheConfig = Field(
+        description="Configuration for the embedding cache",
+        default_factory=EmbeddingCacheConfig,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
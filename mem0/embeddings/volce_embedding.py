@@ -1,9 +1,15 @@
+import asyncio
 import os
-from typing import Literal, Optional
+import weakref
+from typing import List, Literal, Optional
+import httpx
 import requests
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
 
+# Seconds to wait for a Volce embedding request.
+REQUEST_TIMEOUT = 60.0
+
 
 class VolceEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -11,6 +17,8 @@ class VolceEmbedding(EmbeddingBase):
         self.api_key = config.volce_api_key or ""
         self.model = config.volce_model or "intfloat/multilingual-e5-small"
         self.endpoint = config.volce_endpoint or ""
+        # httpx async clients are bound to the event loop they first ran on, so each loop gets its own.
+        self._async_clients = weakref.WeakKeyDictionary()
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -22,15 +30,84 @@ class VolceEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
-        text = text.replace("\n", " ")
-        request_body = {
-            "model": self.model,
-            "input": [text]
-        }
-        headers = {
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts with a single Volce request.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        response = requests.post(
+            self.endpoint, headers=self._headers(), json=self._request_body(texts), timeout=REQUEST_TIMEOUT
+        )
+        return self._parse_embeddings(response.json())
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using Volce, without blocking the event loop.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return (await self.aembed_batch([text], memory_action))[0]
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts with a single async Volce request.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            List[list]: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        client = self._async_client()
+        response = await client.post(self.endpoint, headers=self._headers(), json=self._request_body(texts))
+        return self._parse_embeddings(response.json())
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._async_clients[loop] = httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+        return client
+
+    async def aclose(self):
+        """
+        Close the async client of the running event loop. Clients of other loops are dropped; their
+        connections cannot be closed outside their own loop.
+        """
+        client = self._async_clients.get(asyncio.get_running_loop())
+        self._async_clients.clear()
+        if client is not None:
+            await client.aclose()
+
+    def _headers(self):
+        return {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
-        response = requests.post(self.endpoint, headers=headers, json=request_body)
-        return response.json()["data"][0]["embedding"]
+
+    def _request_body(self, texts: List[str]):
+        return {
+            "model": self.model,
+            "input": [text.replace("\n", " ") for text in texts]
+        }
+
+    @staticmethod
+    def _parse_embeddings(response_json):
+        data = response_json["data"]
+        return [item["embedding"] for item in sorted(data, key=lambda item: item.get("index", 0))]
 
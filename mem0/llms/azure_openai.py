@@ -2,7 +2,7 @@ import json
 import os
 from typing import Dict, List, Optional
 
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
@@ -30,6 +30,19 @@ class AzureOpenAILLM(LLMBase):
             http_client=self.config.http_client,
             default_headers=default_headers,
         )
+        # The configured proxy client is synchronous; without one, calls from AsyncMemory use a native
+        # async client, otherwise they fall back to running the sync client in a worker thread.
+        self.async_client = (
+            AsyncAzureOpenAI(
+                azure_deployment=azure_deployment,
+                azure_endpoint=azure_endpoint,
+                api_version=api_version,
+                api_key=api_key,
+                default_headers=default_headers,
+            )
+            if self.config.http_client is None
+            else None
+        )
 
     def _parse_response(self, response, tools):
         """
@@ -61,26 +74,8 @@ class AzureOpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-    ):
-        """
-        Generate a response based on the given messages using Azure OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-
-        Returns:
-            str: The generated response.
-        """
-
+    def _build_params(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        """Build the chat completion request parameters shared by the sync and async calls."""
         common_params = {
             "model": self.config.model,
             "messages": messages,
@@ -101,5 +96,47 @@ class AzureOpenAILLM(LLMBase):
             params["tools"] = tools
             params["tool_choice"] = tool_choice
 
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using Azure OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._build_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using the async Azure OpenAI client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        if self.async_client is None:
+            return await super().agenerate_response(
+                messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
+        params = self._build_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
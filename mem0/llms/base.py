@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
@@ -30,3 +31,12 @@ class LLMBase(ABC):
             str: The generated response.
         """
         pass
+
+    async def agenerate_response(self, messages, **kwargs):
+        """
+        Async version of `generate_response`, taking the same arguments.
+
+        Providers with an async client should override this. The default implementation runs
+        `generate_response` in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_response, messages, **kwargs)
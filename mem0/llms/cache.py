@@ -0,0 +1,109 @@
+import hashlib
+import inspect
+import json
+import logging
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+from mem0.llms.base import LLMBase
+from mem0.utils.cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM(LLMBase):
+    """
+    Wraps any LLM with a response cache on `generate_response`.
+
+    Entries are keyed on a hash of the provider, model, sampling settings (temperature, max_tokens,
+    top_p, top_k) and every argument of the call (messages, tools, tool_choice, response_format...),
+    so only identical requests share a response.
+    The in-process tier is an LRU bounded by `max_size`; an optional SQLite file keeps responses
+    across restarts. With a `ttl`, entries older than `ttl` seconds are treated as misses.
+    """
+
+    def __init__(
+        self,
+        llm: LLMBase,
+        provider: str,
+        max_size: int = 1000,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        super().__init__(llm.config)
+        self.llm = llm
+        self.provider = provider
+        self.max_size = max_size
+        self.ttl = ttl
+        self.cache = TieredCache(max_size, path, table="llm_response_cache", ttl=ttl)
+        self._signature = inspect.signature(llm.generate_response)
+
+    def __getattr__(self, name):
+        # Expose provider-specific attributes (client, model names...) of the wrapped LLM.
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _cache_key(self, args, kwargs) -> Optional[str]:
+        try:
+            bound = self._signature.bind(*args, **kwargs)
+        except TypeError:
+            return None
+        bound.apply_defaults()
+        try:
+            request = json.dumps(
+                {
+                    "provider": self.provider,
+                    "model": self.config.model,
+                    "temperature": self.config.temperature,
+                    "max_tokens": self.config.max_tokens,
+                    "top_p": self.config.top_p,
+                    "top_k": self.config.top_k,
+                    "arguments": bound.arguments,
+                },
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            # Arguments such as pydantic response formats cannot be hashed reliably; do not cache.
+            return None
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def generate_response(self, *args, **kwargs):
+        """
+        Generate a response, returning a cached one when an identical request was made before.
+
+        Takes the same arguments as the `generate_response` method of the wrapped LLM.
+        """
+        key = self._cache_key(args, kwargs)
+        if key is None:
+            return self.llm.generate_response(*args, **kwargs)
+
+        found = self.cache.get_many([key])
+        if key in found:
+            return deepcopy(found[key])
+
+        response = self.llm.generate_response(*args, **kwargs)
+        self.cache.set_many({key: response})
+        return deepcopy(response)
+
+    async def agenerate_response(self, messages, **kwargs):
+        """Async version of `generate_response`, using the async client of the wrapped LLM on a miss."""
+        key = self._cache_key((messages,), kwargs)
+        if key is None:
+            return await self.llm.agenerate_response(messages, **kwargs)
+
+        found = self.cache.get_many([key])
+        if key in found:
+            return deepcopy(found[key])
+
+        response = await self.llm.agenerate_response(messages, **kwargs)
+        self.cache.set_many({key: response})
+        return deepcopy(response)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/expiry counters and the number of entries held in memory."""
+        return self.cache.stats()
+
+    def clear(self) -> None:
+        """Drop every cached response, including the persistent tier, and reset the counters."""
+        self.cache.clear()
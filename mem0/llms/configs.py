@@ -3,9 +3,26 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+class LlmCacheConfig(BaseModel):
+    enabled: bool = Field(description="Whether to cache LLM responses", default=False)
+    max_size: int = Field(description="Maximum number of responses kept in the in-process LRU cache", default=1000)
+    ttl: Optional[float] = Field(
+        description="Number of seconds a cached response stays valid. Defaults to no expiry",
+        default=None,
+    )
+    path: Optional[str] = Field(
+        description="Path of a SQLite file used as a persistent cache tier. Defaults to in-process caching only",
+        default=None,
+    )
+
+
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: LlmCacheConfig = Field(
+        description="Configuration for the LLM response cache",
+        default_factory=LlmCacheConfig,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -0,0 +1,65 @@
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryExecutor:
+    """
+    Long-lived thread pool shared by all operations of a `Memory` instance.
+
+    Wraps a `ThreadPoolExecutor` so threads are reused across calls and the total concurrency of an
+    instance stays bounded, and keeps count of queued and running tasks for monitoring.
+
+    Tasks must not wait on other tasks submitted to the same executor, as that can deadlock
+    once every worker is busy.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "mem0"):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self.max_workers = self._executor._max_workers
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule `fn(*args, **kwargs)` on the pool and return its future."""
+        with self._lock:
+            self._queued += 1
+
+        def run():
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._completed += 1
+
+        try:
+            return self._executor.submit(run)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the pool size and the number of queued, running and completed tasks."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks and, if `wait` is True, wait for running tasks to finish."""
+        self._executor.shutdown(wait=wait)
@@ -38,7 +38,10 @@ class MemoryGraph:
             driver_config={"notifications_min_severity": "OFF"},
         )
         self.embedding_model = EmbedderFactory.create(
-            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+            self.config.embedder.provider,
+            self.config.embedder.config,
+            self.config.vector_store.config,
+            self.config.embedder.cache,
         )
         self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
 
@@ -61,7 +64,7 @@ class MemoryGraph:
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config, self.config.llm.cache)
         self.user_id = None
         self.threshold = 0.7
 
@@ -0,0 +1,174 @@
+import bisect
+import contextlib
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Shared by every disabled stage; `nullcontext` keeps no state, so one instance can be reused.
+_NULL_STAGE = contextlib.nullcontext()
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class InstrumentationSink:
+    """
+    Receives the timing of each pipeline stage of a `Memory` instance.
+
+    Subclasses either override `record`, called once per stage with its duration and error, or
+    override `stage` to wrap the stage itself (for instance in a tracing span).
+    """
+
+    @contextlib.contextmanager
+    def stage(self, name: str, attributes: Dict[str, Any]):
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, error, attributes)
+
+    def record(self, name: str, duration: float, error: Optional[BaseException], attributes: Dict[str, Any]) -> None:
+        pass
+
+
+class Instrumentation:
+    """
+    Dispatches the pipeline stages of a `Memory` instance to the registered sinks.
+
+    Without sinks, `stage` returns a shared no-op context manager, so instrumentation costs a
+    method call per stage.
+    """
+
+    def __init__(self, sinks: Optional[Iterable[InstrumentationSink]] = None):
+        self.sinks: List[InstrumentationSink] = list(sinks or [])
+
+    def add_sink(self, sink: InstrumentationSink) -> None:
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: InstrumentationSink) -> None:
+        self.sinks.remove(sink)
+
+    def stage(self, name: str, **attributes):
+        """
+        Return a context manager timing the stage `name`.
+
+        Args:
+            name (str): Stage name, e.g. "fact_extraction" or "neighbor_search".
+            **attributes: Labels of the stage, such as the `provider` or `backend` involved.
+        """
+        sinks = self.sinks
+        if not sinks:
+            return _NULL_STAGE
+        if len(sinks) == 1:
+            return sinks[0].stage(name, attributes)
+        return self._stage_all(sinks, name, attributes)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _stage_all(sinks, name, attributes):
+        with contextlib.ExitStack() as stack:
+            for sink in sinks:
+                stack.enter_context(sink.stage(name, attributes))
+            yield
+
+
+class HistogramSink(InstrumentationSink):
+    """
+    Keeps in memory the count, errors and a latency histogram of each stage, per set of attributes.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the histogram buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: Dict[tuple, Dict[str, Any]] = {}
+
+    def record(self, name: str, duration: float, error: Optional[BaseException], attributes: Dict[str, Any]) -> None:
+        key = (name, tuple(sorted(attributes.items())))
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"count": 0, "errors": 0, "total": 0.0, "max": 0.0, "counts": [0] * (len(self.buckets) + 1)}
+                self._series[key] = series
+            series["count"] += 1
+            series["errors"] += error is not None
+            series["total"] += duration
+            series["max"] = max(series["max"], duration)
+            series["counts"][bucket] += 1
+
+    def _quantile(self, series: Dict[str, Any], quantile: float) -> float:
+        # Upper bound of the bucket holding the quantile; the overflow bucket reports the max.
+        rank = quantile * series["count"]
+        seen = 0
+        for bound, count in zip(self.buckets, series["counts"]):
+            seen += count
+            if seen >= rank:
+                return min(bound, series["max"])
+        return series["max"]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Return one entry per stage and attribute set.
+
+        Each entry has the stage, attributes, count, errors, total/mean/max durations and p50/p99
+        estimates in seconds, and the bucket counts keyed by upper bound ("+Inf" for the overflow).
+        """
+        with self._lock:
+            items = [(key, {**series, "counts": list(series["counts"])}) for key, series in self._series.items()]
+
+        snapshot = []
+        for (name, attributes), series in items:
+            snapshot.append(
+                {
+                    "stage": name,
+                    "attributes": dict(attributes),
+                    "count": series["count"],
+                    "errors": series["errors"],
+                    "total_s": series["total"],
+                    "mean_s": series["total"] / series["count"],
+                    "max_s": series["max"],
+                    "p50_s": self._quantile(series, 0.5),
+                    "p99_s": self._quantile(series, 0.99),
+                    "buckets": dict(zip([*map(str, self.buckets), "+Inf"], series["counts"])),
+                }
+            )
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class OpenTelemetrySink(InstrumentationSink):
+    """
+    Wraps every stage in an OpenTelemetry span named `<span_prefix><stage>`, carrying the stage
+    attributes. Exceptions are recorded on the span and mark it as failed.
+
+    Args:
+        tracer: OpenTelemetry tracer to use. Defaults to the "mem0" tracer of the global provider.
+        span_prefix (str): Prefix of the span names. Defaults to "mem0.".
+    """
+
+    def __init__(self, tracer=None, span_prefix: str = "mem0."):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError(
+                    "The 'opentelemetry-api' library is required. "
+                    "Please install it using 'pip install opentelemetry-api'."
+                )
+            tracer = trace.get_tracer("mem0")
+        self.tracer = tracer
+        self.span_prefix = span_prefix
+
+    @contextlib.contextmanager
+    def stage(self, name: str, attributes: Dict[str, Any]):
+        with self.tracer.start_as_current_span(f"{self.span_prefix}{name}", attributes=attributes):
+            yield
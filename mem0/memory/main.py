@@ -1,15 +1,17 @@
 import asyncio
 import concurrent
+import functools
 import gc
 import hashlib
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pytz
 from pydantic import ValidationError
@@ -21,9 +23,11 @@ from mem0.configs.prompts import (
     get_update_memory_messages,
 )
 from mem0.memory.base import MemoryBase
+from mem0.memory.executor import MemoryExecutor
+from mem0.memory.instrumentation import Instrumentation
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
-from mem0.memory.telemetry import capture_event
+from mem0.memory.telemetry import AnonymousTelemetry, capture_event
 from mem0.memory.utils import (
     get_fact_retrieval_messages,
     parse_messages,
@@ -32,6 +36,7 @@ from mem0.memory.utils import (
     process_telemetry_filters,
 )
 from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
+from mem0.vector_stores.base import BulkWriteError
 
 
 def _build_filters_and_metadata(
@@ -110,6 +115,368 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _fuse_search_results(result_lists: List[list], limit: int, method: str = "rrf", rrf_k: int = 60) -> list:
+    """
+    Merge several rankings of the same store into one list of at most `limit` results, best first.
+
+    Each input list must be ordered best first. With "rrf" (reciprocal rank fusion) a result scores
+    `1 / (rrf_k + rank)` per list it appears in; with "normalized" its scores are min-max normalized
+    within each list, which works whether the store reports similarities or distances, and summed.
+
+    Returns copies of the results whose `score` is the fused score.
+    """
+    fused_scores: Dict[str, float] = {}
+    results_by_id = {}
+    for results in result_lists:
+        scores = [result.score for result in results]
+        normalize = method == "normalized" and results and None not in scores
+        best, worst = (scores[0], scores[-1]) if normalize else (None, None)
+        for rank, result in enumerate(results):
+            if normalize:
+                contribution = (result.score - worst) / (best - worst) if best != worst else 1.0
+            elif method == "normalized":
+                contribution = 1.0 - rank / len(results)
+            else:
+                contribution = 1.0 / (rrf_k + rank + 1)
+            fused_scores[result.id] = fused_scores.get(result.id, 0.0) + contribution
+            results_by_id.setdefault(result.id, result)
+
+    ranked_ids = sorted(fused_scores, key=fused_scores.get, reverse=True)[:limit]
+    return [results_by_id[memory_id].model_copy(update={"score": fused_scores[memory_id]}) for memory_id in ranked_ids]
+
+
+def _threshold_vector_results(results: list, threshold: Optional[float]) -> list:
+    """
+    Drop the vector search results scoring below `threshold` ahead of hybrid fusion. Fused scores are
+    on a scale of their own, so in hybrid search the threshold applies to the vector scores instead.
+    """
+    if threshold is None:
+        return results
+    return [result for result in results if result.score >= threshold]
+
+
+def _embed_memory_actions(embedding_model, memory_actions, existing_embeddings: Dict[str, Any]) -> None:
+    """
+    Embeds, in one batch per memory action, every ADD/UPDATE text that has no embedding yet.
+
+    The update-decision LLM may rephrase facts, so action texts do not always match the already
+    embedded facts. Embedding them up front avoids one embedding round trip per action later on.
+    The new embeddings are stored in `existing_embeddings` in place.
+
+    Args:
+        embedding_model (EmbeddingBase): Embedding model used to embed the texts.
+        memory_actions (list): Memory actions returned by the update-decision LLM.
+        existing_embeddings (Dict[str, Any]): Mapping of text to embedding, updated in place.
+    """
+    for memory_action, texts in _pending_action_texts(memory_actions, existing_embeddings).items():
+        existing_embeddings.update(zip(texts, embedding_model.embed_batch(texts, memory_action)))
+
+
+async def _aembed_memory_actions(embedding_model, memory_actions, existing_embeddings: Dict[str, Any]) -> None:
+    """
+    Async version of `_embed_memory_actions`, using the async methods of the embedding model.
+    """
+    for memory_action, texts in _pending_action_texts(memory_actions, existing_embeddings).items():
+        existing_embeddings.update(zip(texts, await embedding_model.aembed_batch(texts, memory_action)))
+
+
+def _pending_action_texts(memory_actions, existing_embeddings: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Groups by memory action the ADD/UPDATE texts that have no embedding yet."""
+    pending = {"add": [], "update": []}
+    for resp in memory_actions:
+        if not isinstance(resp, dict):
+            continue
+        text = resp.get("text")
+        if not text or text in existing_embeddings:
+            continue
+        memory_action = {"ADD": "add", "UPDATE": "update"}.get(resp.get("event"))
+        if memory_action and text not in pending[memory_action]:
+            pending[memory_action].append(text)
+    return {memory_action: texts for memory_action, texts in pending.items() if texts}
+
+
+def _prepare_add_request(
+    messages,
+    *,
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    memory_type: Optional[str] = None,
+) -> tuple[list, Dict[str, Any], Dict[str, Any]]:
+    """
+    Validates the arguments of an add call and normalizes `messages` to a list of message dicts.
+
+    Returns:
+        tuple[list, Dict[str, Any], Dict[str, Any]]: The normalized messages, the metadata template
+        for storing memories and the filters for querying existing memories.
+    """
+    processed_metadata, effective_filters = _build_filters_and_metadata(
+        user_id=user_id,
+        agent_id=agent_id,
+        run_id=run_id,
+        input_metadata=metadata,
+    )
+
+    if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
+        raise ValueError(
+            f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
+        )
+
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    elif isinstance(messages, dict):
+        messages = [messages]
+
+    elif not isinstance(messages, list):
+        raise ValueError("messages must be str, dict, or list[dict]")
+
+    return messages, processed_metadata, effective_filters
+
+
+def _preclassify_facts(
+    facts: List[str],
+    existing_memories_per_fact: List[list],
+    duplicate_threshold: Optional[float] = None,
+    novelty_threshold: Optional[float] = None,
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, list]]]:
+    """
+    Resolves the facts whose outcome does not depend on the update-decision LLM.
+
+    A fact is a duplicate (NONE) when an existing memory has the same hash, when a neighbor scores at or
+    above `duplicate_threshold`, or when it repeats an earlier fact. A fact is new (ADD) when it has no
+    neighbors, or when every neighbor scores below `novelty_threshold`. Scores are compared as
+    similarities, so the thresholds only apply to vector stores where a higher score means closer.
+
+    Args:
+        facts (List[str]): The extracted facts.
+        existing_memories_per_fact (List[list]): The neighbor search results of each fact.
+        duplicate_threshold (float, optional): Minimum neighbor score for a near-exact duplicate.
+        novelty_threshold (float, optional): Neighbor score below which a fact is considered new.
+
+    Returns:
+        tuple: `(actions, ambiguous)`, where `actions` holds the resolved ADD/NONE actions and
+        `ambiguous` the `(fact, existing_memories)` pairs that still need the LLM.
+    """
+    actions = []
+    ambiguous = []
+    seen_hashes = set()
+    for fact, existing_memories in zip(facts, existing_memories_per_fact):
+        fact_hash = hashlib.md5(fact.encode()).hexdigest()
+        scores = [mem.score for mem in existing_memories if mem.score is not None]
+
+        if fact_hash in seen_hashes or any(
+            (mem.payload or {}).get("hash") == fact_hash for mem in existing_memories
+        ):
+            actions.append({"text": fact, "event": "NONE"})
+        elif duplicate_threshold is not None and scores and max(scores) >= duplicate_threshold:
+            actions.append({"text": fact, "event": "NONE"})
+        elif not existing_memories or (
+            novelty_threshold is not None and len(scores) == len(existing_memories) and max(scores) < novelty_threshold
+        ):
+            actions.append({"text": fact, "event": "ADD"})
+        else:
+            ambiguous.append((fact, existing_memories))
+        seen_hashes.add(fact_hash)
+
+    return actions, ambiguous
+
+
+def _build_old_memory_context(existing_memories_per_fact: List[list]) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+    """
+    Builds the list of existing memories shown to the update-decision LLM.
+
+    Memories are deduplicated and given integer-like temporary ids, since the LLM tends to garble UUIDs.
+
+    Returns:
+        tuple: `(retrieved_old_memory, temp_uuid_mapping)`, where `temp_uuid_mapping` maps the
+        temporary ids back to the real memory ids.
+    """
+    unique_data = {}
+    for existing_memories in existing_memories_per_fact:
+        for mem in existing_memories:
+            unique_data[mem.id] = {"id": mem.id, "text": mem.payload["data"]}
+    retrieved_old_memory = list(unique_data.values())
+    logging.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+    temp_uuid_mapping = {}
+    for idx, item in enumerate(retrieved_old_memory):
+        temp_uuid_mapping[str(idx)] = item["id"]
+        retrieved_old_memory[idx]["id"] = str(idx)
+
+    return retrieved_old_memory, temp_uuid_mapping
+
+
+def _create_history_db(config: MemoryConfig) -> SQLiteManager:
+    return SQLiteManager(
+        config.history_db_path,
+        write_behind=config.history_db.write_behind,
+        flush_interval=config.history_db.flush_interval,
+        batch_size=config.history_db.batch_size,
+        wal=config.history_db.wal,
+        synchronous=config.history_db.synchronous,
+        read_connections=config.history_db.read_connections,
+    )
+
+
+def _payloads_by_id(existing_memories_per_fact: List[list]) -> Dict[str, Dict[str, Any]]:
+    """
+    Indexes by memory id the payloads returned by the neighbor search, so UPDATE and DELETE actions on
+    those memories can reuse them instead of reading each memory from the vector store again.
+    """
+    return {
+        mem.id: mem.payload
+        for existing_memories in existing_memories_per_fact
+        for mem in existing_memories
+        if mem.payload is not None
+    }
+
+
+def _merge_memory_actions(preclassified_actions: List[Dict[str, Any]], llm_response) -> Dict[str, Any]:
+    """
+    Combines the pre-classified actions with the actions returned by the update-decision LLM.
+
+    Returns:
+        dict: `{"memory": [...]}`, or an empty dict when there is nothing to apply.
+    """
+    llm_actions = llm_response.get("memory", []) if isinstance(llm_response, dict) else []
+    if not isinstance(llm_actions, list):
+        logging.error(f"Invalid memory actions from LLM: {llm_actions}")
+        llm_actions = []
+    actions = preclassified_actions + llm_actions
+    return {"memory": actions} if actions else {}
+
+
+def _plan_memory_action(resp, temp_uuid_mapping: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Turns one action of the update-decision response into a planned action, whose "memory" entry is
+    what `add` returns for it. Returns None for NONE actions and actions without text.
+
+    ADD actions get their memory id once prepared; see `_settle_memory_action`.
+    """
+    logging.info(resp)
+    action_text = resp.get("text")
+    if not action_text:
+        logging.info("Skipping memory entry because of empty `text` field.")
+        return None
+
+    event_type = resp.get("event")
+    if event_type == "ADD":
+        return {"memory": {"id": None, "memory": action_text, "event": event_type}}
+    if event_type == "UPDATE":
+        memory = {
+            "id": temp_uuid_mapping[resp.get("id")],
+            "memory": action_text,
+            "event": event_type,
+            "previous_memory": resp.get("old_memory"),
+        }
+        return {"memory": memory}
+    if event_type == "DELETE":
+        return {"memory": {"id": temp_uuid_mapping[resp.get("id")], "memory": action_text, "event": event_type}}
+    if event_type == "NONE":
+        logging.info("NOOP for Memory.")
+    return None
+
+
+def _settle_memory_action(action: Dict[str, Any], prepared: tuple) -> None:
+    """Records on a planned ADD or UPDATE action the write and history row prepared for it."""
+    if action["memory"]["event"] == "ADD":
+        action["memory"]["id"], embeddings, payload, action["history"] = prepared
+    else:
+        embeddings, payload, action["history"] = prepared
+    action["write"] = (action["memory"]["id"], embeddings, payload)
+
+
+def _stage_memory_writes(planned: List[Dict[str, Any]]) -> Tuple[list, list, list]:
+    """
+    Collects the writes of planned actions, so ADD and UPDATE actions are flushed together.
+
+    Returns:
+        tuple: `(inserts, updates, history_records)`, as taken by `_write_memories`.
+    """
+    inserts = [action["write"] for action in planned if action["memory"]["event"] == "ADD"]
+    updates = [action["write"] for action in planned if action["memory"]["event"] == "UPDATE"]
+    history_records = [action["history"] for action in planned if "history" in action]
+    return inserts, updates, history_records
+
+
+def _memory_write_batches(inserts: list, updates: list):
+    """Yields `(event, memory_ids, vectors, payloads)` for the staged inserts, then the staged updates."""
+    for event, writes in (("ADD", inserts), ("UPDATE", updates)):
+        if writes:
+            memory_ids, vectors, payloads = (list(column) for column in zip(*writes))
+            yield event, memory_ids, vectors, payloads
+
+
+def _ids_written_despite(error: Exception, memory_ids: List[str]) -> List[str]:
+    """Returns the ids of a write batch that were stored although the batch raised `error`."""
+    if isinstance(error, BulkWriteError):
+        failed_ids = set(error.failed_ids)
+        return [memory_id for memory_id in memory_ids if memory_id not in failed_ids]
+    return []
+
+
+def _capture_memory_writes(memory_instance, inserts: list, updates: list, written_ids: Set[str], sync_type: str):
+    for event_name, writes in (("mem0._create_memory", inserts), ("mem0._update_memory", updates)):
+        memory_count = sum(1 for memory_id, _, _ in writes if memory_id in written_ids)
+        if memory_count:
+            capture_event(event_name, memory_instance, {"memory_count": memory_count, "sync_type": sync_type})
+
+
+def _written_memories(planned: List[Dict[str, Any]], written_ids: Set[str]) -> List[Dict[str, Any]]:
+    """Returns the memories of the planned actions that were written, plus the DELETEs still to run."""
+    return [
+        action["memory"]
+        for action in planned
+        if action["memory"]["event"] == "DELETE" or action["memory"]["id"] in written_ids
+    ]
+
+
+# Stages of the `add_many` pipeline, each bounded by its own concurrency limit.
+ADD_MANY_STAGES = ("extract", "embed", "search", "decide", "write", "graph")
+DEFAULT_ADD_MANY_CONCURRENCY = {"extract": 8, "embed": 4, "search": 4, "decide": 8, "write": 2, "graph": 2}
+ADD_MANY_ITEM_KEYS = {"messages", "user_id", "agent_id", "run_id", "metadata", "infer", "memory_type", "prompt"}
+
+
+def _resolve_add_many_concurrency(concurrency) -> Dict[str, int]:
+    """
+    Resolves the per-stage concurrency limits of `add_many`.
+
+    `concurrency` may be None (defaults), an int applied to every stage, or a dict overriding
+    the defaults of some stages.
+    """
+    if concurrency is None:
+        limits = dict(DEFAULT_ADD_MANY_CONCURRENCY)
+    elif isinstance(concurrency, int):
+        limits = {stage: concurrency for stage in ADD_MANY_STAGES}
+    elif isinstance(concurrency, dict):
+        unknown_stages = set(concurrency) - set(ADD_MANY_STAGES)
+        if unknown_stages:
+            raise ValueError(
+                f"Unknown add_many stages: {', '.join(sorted(unknown_stages))}. "
+                f"Valid stages are: {', '.join(ADD_MANY_STAGES)}"
+            )
+        limits = {**DEFAULT_ADD_MANY_CONCURRENCY, **concurrency}
+    else:
+        raise ValueError("concurrency must be an int or a dict of stage name to int")
+
+    if any(not isinstance(limit, int) or limit < 1 for limit in limits.values()):
+        raise ValueError("Concurrency limits must be positive integers")
+    return limits
+
+
+def _validate_add_many_item(item) -> Dict[str, Any]:
+    """Checks that an `add_many` item is a dict of `add` arguments and returns a copy of it."""
+    if not isinstance(item, dict) or "messages" not in item:
+        raise ValueError("Each add_many item must be a dict with a 'messages' key")
+
+    unknown_keys = set(item) - ADD_MANY_ITEM_KEYS
+    if unknown_keys:
+        raise ValueError(f"Unsupported add_many item keys: {', '.join(sorted(unknown_keys))}")
+    return dict(item)
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -124,14 +491,16 @@ class Memory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            self.config.embedder.cache,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config, self.config.llm.cache)
+        self.db = _create_history_db(self.config)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self.executor = MemoryExecutor(max_workers=self.config.executor_max_workers)
 
         self.enable_graph = False
 
@@ -145,16 +514,29 @@ class Memory(MemoryBase):
             self.enable_graph = True
         else:
             self.graph = None
-        self.config.vector_store.config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
-            provider_path = f"migrations_{self.config.vector_store.provider}"
-            self.config.vector_store.config.path = os.path.join(mem0_dir, provider_path)
-            os.makedirs(self.config.vector_store.config.path, exist_ok=True)
-        self._telemetry_vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+
+        # The "mem0migrations" store only holds the anonymous telemetry user id. It is created by the
+        # telemetry sender on its first event, so it stays off the startup path.
+        self._telemetry_vector_store = None
+        self.telemetry = AnonymousTelemetry(
+            vector_store_factory=self._get_telemetry_vector_store if self.config.telemetry_vector_store else None
         )
+        # Sinks added with `self.instrumentation.add_sink` receive the timing of every pipeline stage.
+        self.instrumentation = Instrumentation()
+        self._keyword_search_supported = True
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
+    def _get_telemetry_vector_store(self):
+        if self._telemetry_vector_store is None:
+            config = deepcopy(self.config.vector_store.config)
+            config.collection_name = "mem0migrations"
+            if self.config.vector_store.provider in ["faiss", "qdrant"]:
+                provider_path = f"migrations_{self.config.vector_store.provider}"
+                config.path = os.path.join(mem0_dir, provider_path)
+                os.makedirs(config.path, exist_ok=True)
+            self._telemetry_vector_store = VectorStoreFactory.create(self.config.vector_store.provider, config)
+        return self._telemetry_vector_store
+
     @classmethod
     def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -222,27 +604,15 @@ class Memory(MemoryBase):
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "event": "ADD"}]}`
         """
 
-        processed_metadata, effective_filters = _build_filters_and_metadata(
+        messages, processed_metadata, effective_filters = _prepare_add_request(
+            messages,
             user_id=user_id,
             agent_id=agent_id,
             run_id=run_id,
-            input_metadata=metadata,
+            metadata=metadata,
+            memory_type=memory_type,
         )
 
-        if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
-            raise ValueError(
-                f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
-            )
-
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        elif isinstance(messages, dict):
-            messages = [messages]
-
-        elif not isinstance(messages, list):
-            raise ValueError("messages must be str, dict, or list[dict]")
-
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
             return results
@@ -252,14 +622,11 @@ class Memory(MemoryBase):
         else:
             messages = parse_vision_messages(messages)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
-            future2 = executor.submit(self._add_to_graph, messages, effective_filters)
-
-            concurrent.futures.wait([future1, future2])
-
-            vector_store_result = future1.result()
-            graph_result = future2.result()
+        future_graph = (
+            self.executor.submit(self._add_to_graph, messages, effective_filters) if self.enable_graph else None
+        )
+        vector_store_result = self._add_to_vector_store(messages, processed_metadata, effective_filters, infer)
+        graph_result = future_graph.result() if future_graph else []
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -279,9 +646,136 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    def add_many(self, items, *, concurrency=None):
+        """
+        Create memories for many conversations at once.
+
+        Each item goes through the same stages as `add` (fact extraction, embedding, neighbor search,
+        update decision and write). The stages are pipelined across items, and each stage has its own
+        concurrency limit, so LLM calls for some items overlap with store writes for others. A failing
+        item is reported and does not abort the rest of the batch.
+
+        Items are processed concurrently, so two items scoped to the same session may not see each
+        other's memories when deciding what to add.
+
+        Args:
+            items (Iterable[dict]): Items holding the arguments of `add`: `messages` plus any of
+                `user_id`, `agent_id`, `run_id`, `metadata`, `infer`, `memory_type` and `prompt`.
+            concurrency (int or dict, optional): Maximum number of items in each stage at once. An int
+                applies to every stage; a dict overrides the defaults of some of the stages
+                ("extract", "embed", "search", "decide", "write", "graph"). Defaults to None.
+
+        Returns:
+            dict: `{"results": [...], "failures": [...]}`. `results` holds one entry per item, in input
+                  order: the value `add` would return, or None if the item failed. `failures` lists
+                  `{"index": ..., "error": ...}` for every failed item.
+        """
+        stage_limits = _resolve_add_many_concurrency(concurrency)
+        stage_semaphores = {stage: threading.BoundedSemaphore(limit) for stage, limit in stage_limits.items()}
+
+        results = []
+        failures = []
+        results_lock = threading.Lock()
+        pending_items = enumerate(items)
+        pending_lock = threading.Lock()
+
+        def worker():
+            while True:
+                with pending_lock:
+                    next_item = next(pending_items, None)
+                    if next_item is None:
+                        return
+                    index, item = next_item
+                    with results_lock:
+                        results.append(None)
+
+                try:
+                    result = self._add_pipelined(item, stage_semaphores)
+                except Exception as e:
+                    logger.error(f"Error adding item {index} in add_many: {e}")
+                    with results_lock:
+                        failures.append({"index": index, "error": str(e)})
+                    continue
+
+                with results_lock:
+                    results[index] = result
+
+        # The workers live for the whole batch, so they get their own pool rather than occupying the
+        # shared executor that `add`, `search` and `get_all` use.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=sum(stage_limits.values())) as executor:
+            workers = [executor.submit(worker) for _ in range(sum(stage_limits.values()))]
+            concurrent.futures.wait(workers)
+            for future in workers:
+                future.result()
+
+        failures.sort(key=lambda failure: failure["index"])
+        capture_event(
+            "mem0.add_many",
+            self,
+            {"item_count": len(results), "failure_count": len(failures), "sync_type": "sync"},
+        )
+        return {"results": results, "failures": failures}
+
+    def _add_pipelined(self, item, stage_semaphores):
+        """Run a single `add_many` item through the add stages, holding each stage's semaphore."""
+        item = _validate_add_many_item(item)
+        infer = item.get("infer", True)
+
+        with stage_semaphores["extract"]:
+            messages, processed_metadata, effective_filters = _prepare_add_request(
+                item["messages"],
+                user_id=item.get("user_id"),
+                agent_id=item.get("agent_id"),
+                run_id=item.get("run_id"),
+                metadata=item.get("metadata"),
+                memory_type=item.get("memory_type"),
+            )
+
+            if item.get("agent_id") is not None and item.get("memory_type") == MemoryType.PROCEDURAL.value:
+                return self._create_procedural_memory(messages, metadata=processed_metadata, prompt=item.get("prompt"))
+
+            if self.config.llm.config.get("enable_vision"):
+                messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+            else:
+                messages = parse_vision_messages(messages)
+
+            new_retrieved_facts = self._extract_facts(messages) if infer else []
+
+        if not infer:
+            with stage_semaphores["write"]:
+                vector_store_result = self._add_to_vector_store(messages, processed_metadata, effective_filters, False)
+        elif not new_retrieved_facts:
+            vector_store_result = []
+        else:
+            with stage_semaphores["embed"]:
+                new_message_embeddings = self._embed_facts(new_retrieved_facts)
+            with stage_semaphores["search"]:
+                existing_memories_per_fact = self._retrieve_old_memories(
+                    new_retrieved_facts, new_message_embeddings, effective_filters
+                )
+            with stage_semaphores["decide"]:
+                new_memories_with_actions, temp_uuid_mapping = self._resolve_memory_actions(
+                    new_retrieved_facts, existing_memories_per_fact
+                )
+            with stage_semaphores["write"]:
+                vector_store_result = self._apply_memory_actions(
+                    new_memories_with_actions,
+                    processed_metadata,
+                    new_message_embeddings,
+                    temp_uuid_mapping,
+                    _payloads_by_id(existing_memories_per_fact),
+                )
+
+        if self.enable_graph:
+            with stage_semaphores["graph"]:
+                graph_result = self._add_to_graph(messages, effective_filters)
+            return {"results": vector_store_result, "relations": graph_result}
+
+        return {"results": vector_store_result}
+
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
-            returned_memories = []
+            valid_messages = []
             for message_dict in messages:
                 if (
                     not isinstance(message_dict, dict)
@@ -294,6 +788,14 @@ class Memory(MemoryBase):
                 if message_dict["role"] == "system":
                     continue
 
+                valid_messages.append(message_dict)
+
+            msg_contents = [message_dict["content"] for message_dict in valid_messages]
+            with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+                msg_embeddings = dict(zip(msg_contents, self.embedding_model.embed_batch(msg_contents, "add")))
+
+            returned_memories, inserts, history_records = [], [], []
+            for message_dict in valid_messages:
                 per_msg_meta = deepcopy(metadata)
                 per_msg_meta["role"] = message_dict["role"]
 
@@ -302,8 +804,11 @@ class Memory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                mem_id, embeddings, payload, history_record = self._prepare_create_memory(
+                    msg_content, msg_embeddings, per_msg_meta
+                )
+                inserts.append((mem_id, embeddings, payload))
+                history_records.append(history_record)
 
                 returned_memories.append(
                     {
@@ -314,8 +819,39 @@ class Memory(MemoryBase):
                         "role": message_dict["role"],
                     }
                 )
-            return returned_memories
 
+            written_ids = self._write_memories(inserts, [], history_records)
+            return [memory for memory in returned_memories if memory["id"] in written_ids]
+
+        new_retrieved_facts = self._extract_facts(messages)
+
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+            return []
+
+        new_message_embeddings = self._embed_facts(new_retrieved_facts)
+        existing_memories_per_fact = self._retrieve_old_memories(new_retrieved_facts, new_message_embeddings, filters)
+        new_memories_with_actions, temp_uuid_mapping = self._resolve_memory_actions(
+            new_retrieved_facts, existing_memories_per_fact
+        )
+        returned_memories = self._apply_memory_actions(
+            new_memories_with_actions,
+            metadata,
+            new_message_embeddings,
+            temp_uuid_mapping,
+            _payloads_by_id(existing_memories_per_fact),
+        )
+
+        keys, encoded_ids = process_telemetry_filters(filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        )
+        return returned_memories
+
+    def _extract_facts(self, messages):
+        """Run the fact-extraction LLM call and return the extracted facts."""
         parsed_messages = parse_messages(messages)
 
         if self.config.custom_fact_extraction_prompt:
@@ -324,13 +860,14 @@ class Memory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        with self.instrumentation.stage("fact_extraction", provider=self.config.llm.provider):
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
 
         try:
             response = remove_code_blocks(response)
@@ -339,45 +876,61 @@ class Memory(MemoryBase):
             logging.error(f"Error in new_retrieved_facts: {e}")
             new_retrieved_facts = []
 
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-            return []
+        return new_retrieved_facts
+
+    def _embed_facts(self, facts):
+        """Embed all facts in one batch and return a mapping of fact to embedding."""
+        with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+            return dict(zip(facts, self.embedding_model.embed_batch(facts, "add")))
 
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
+    def _retrieve_old_memories(self, facts, fact_embeddings, filters):
+        """Look up the existing memories closest to each new fact, in one batched search."""
+        with self.instrumentation.stage("neighbor_search", backend=self.config.vector_store.provider):
+            return self.vector_store.search_many(
+                queries=facts,
+                vectors=[fact_embeddings[fact] for fact in facts],
                 limit=5,
                 filters=filters,
             )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
 
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logging.info(f"Total existing memories: {len(retrieved_old_memory)}")
+    def _resolve_memory_actions(self, facts, existing_memories_per_fact):
+        """
+        Decide what to do with each new fact.
 
-        # mapping UUIDs with integers for handling UUID hallucinations
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
+        Exact duplicates and facts without close neighbors are resolved up front; only the remaining
+        facts go to the update-decision LLM, and the call is skipped when there are none.
 
+        Returns:
+            tuple: `(new_memories_with_actions, temp_uuid_mapping)`.
+        """
+        preclassified_actions, ambiguous = _preclassify_facts(
+            facts,
+            existing_memories_per_fact,
+            self.config.duplicate_similarity_threshold,
+            self.config.novelty_similarity_threshold,
+        )
+        if not ambiguous:
+            logger.debug("All facts resolved without the update-decision LLM call.")
+            return _merge_memory_actions(preclassified_actions, {}), {}
+
+        retrieved_old_memory, temp_uuid_mapping = _build_old_memory_context(
+            [existing_memories for _, existing_memories in ambiguous]
+        )
+        llm_response = self._decide_memory_actions(retrieved_old_memory, [fact for fact, _ in ambiguous])
+        return _merge_memory_actions(preclassified_actions, llm_response), temp_uuid_mapping
+
+    def _decide_memory_actions(self, retrieved_old_memory, facts):
+        """Run the update-decision LLM call and return its parsed response."""
         function_calling_prompt = get_update_memory_messages(
-            retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            retrieved_old_memory, facts, self.config.custom_update_memory_prompt
         )
 
         try:
-            response: str = self.llm.generate_response(
-                messages=[{"role": "user", "content": function_calling_prompt}],
-                response_format={"type": "json_object"},
-            )
+            with self.instrumentation.stage("update_decision", provider=self.config.llm.provider):
+                response: str = self.llm.generate_response(
+                    messages=[{"role": "user", "content": function_calling_prompt}],
+                    response_format={"type": "json_object"},
+                )
         except Exception as e:
             logging.error(f"Error in new memory actions response: {e}")
             response = ""
@@ -389,63 +942,120 @@ class Memory(MemoryBase):
             logging.error(f"Invalid JSON response: {e}")
             new_memories_with_actions = {}
 
-        returned_memories = []
+        return new_memories_with_actions
+
+    def _apply_memory_actions(
+        self, new_memories_with_actions, metadata, new_message_embeddings, temp_uuid_mapping, existing_payloads=None
+    ):
+        """
+        Execute the ADD, UPDATE and DELETE actions decided by the LLM and return the affected memories.
+
+        `existing_payloads` maps memory ids to the payloads already fetched by the neighbor search; UPDATE
+        and DELETE actions on those memories skip the vector store read. UPDATE lookups and DELETEs run
+        concurrently on the shared executor, at most `config.action_parallelism` at a time. The returned
+        memories keep the order of the actions.
+        """
+        existing_payloads = existing_payloads or {}
+        try:
+            _embed_memory_actions(
+                self.embedding_model, new_memories_with_actions.get("memory", []), new_message_embeddings
+            )
+        except Exception as e:
+            logging.error(f"Error embedding memory actions: {e}")
+
+        # Updates need a lookup of the existing memory before they can be staged; those lookups run
+        # concurrently once every action is planned.
+        planned = []
         try:
             for resp in new_memories_with_actions.get("memory", []):
-                logging.info(resp)
                 try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        logging.info("Skipping memory entry because of empty `text` field.")
+                    action = _plan_memory_action(resp, temp_uuid_mapping)
+                    if action is None:
                         continue
-
-                    event_type = resp.get("event")
-                    if event_type == "ADD":
-                        memory_id = self._create_memory(
-                            data=action_text,
+                    memory = action["memory"]
+                    if memory["event"] == "ADD":
+                        prepared = self._prepare_create_memory(
+                            data=memory["memory"],
                             existing_embeddings=new_message_embeddings,
                             metadata=deepcopy(metadata),
                         )
-                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
-                    elif event_type == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=action_text,
+                        _settle_memory_action(action, prepared)
+                    elif memory["event"] == "UPDATE":
+                        action["prepare"] = functools.partial(
+                            self._prepare_update_memory,
+                            memory_id=memory["id"],
+                            data=memory["memory"],
                             existing_embeddings=new_message_embeddings,
                             metadata=deepcopy(metadata),
+                            existing_payload=existing_payloads.get(memory["id"]),
                         )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                            }
-                        )
-                    elif event_type == "NONE":
-                        logging.info("NOOP for Memory.")
+                    planned.append(action)
                 except Exception as e:
                     logging.error(f"Error processing memory action: {resp}, Error: {e}")
         except Exception as e:
             logging.error(f"Error iterating new_memories_with_actions: {e}")
 
-        keys, encoded_ids = process_telemetry_filters(filters)
-        capture_event(
-            "mem0.add",
-            self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        pending_updates = [action for action in planned if "prepare" in action]
+        outcomes = self._run_concurrently([action["prepare"] for action in pending_updates])
+        for action, (result, error) in zip(pending_updates, outcomes):
+            if error is not None:
+                logging.error(f"Error processing memory action: {action['memory']}, Error: {error}")
+                planned.remove(action)
+                continue
+            _settle_memory_action(action, result)
+
+        # ADD and UPDATE actions are staged and flushed together; deletes run once they are written.
+        written_ids = self._write_memories(*_stage_memory_writes(planned))
+        returned_memories = _written_memories(planned, written_ids)
+
+        staged_deletes = [mem for mem in returned_memories if mem["event"] == "DELETE"]
+        outcomes = self._run_concurrently(
+            [
+                functools.partial(
+                    self._delete_memory, memory_id=deleted["id"], existing_payload=existing_payloads.get(deleted["id"])
+                )
+                for deleted in staged_deletes
+            ]
         )
+        for deleted, (_, error) in zip(staged_deletes, outcomes):
+            if error is not None:
+                logging.error(f"Error deleting memory {deleted['id']}: {error}")
+                returned_memories.remove(deleted)
+
         return returned_memories
 
+    def _run_concurrently(self, calls):
+        """
+        Run zero-argument callables on the shared executor, at most `config.action_parallelism` at a time.
+
+        Returns:
+            list: One `(result, error)` pair per call, in the order of `calls`.
+        """
+        outcomes = [None] * len(calls)
+
+        def settle(index, get_result):
+            try:
+                outcomes[index] = (get_result(), None)
+            except Exception as e:
+                outcomes[index] = (None, e)
+
+        parallelism = max(1, self.config.action_parallelism)
+        if parallelism == 1 or len(calls) <= 1:
+            for index, call in enumerate(calls):
+                settle(index, call)
+            return outcomes
+
+        running = {}
+        for index, call in enumerate(calls):
+            if len(running) >= parallelism:
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    settle(running.pop(future), future.result)
+            running[self.executor.submit(call)] = index
+        for future in concurrent.futures.as_completed(running):
+            settle(running[future], future.result)
+        return outcomes
+
     def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -540,18 +1150,11 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
-
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+        future_graph_entities = (
+            self.executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
+        )
+        all_memories_result = self._get_all_from_vector_store(effective_filters, limit)
+        graph_entities_result = future_graph_entities.result() if future_graph_entities else None
 
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
@@ -627,7 +1230,8 @@ class Memory(MemoryBase):
             run_id (str, optional): ID of the run to search for. Defaults to None.
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Filters to apply to the search. Defaults to None..
-            threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+            threshold (float, optional): Minimum score for a memory to be included in the results. In hybrid
+                search mode it applies to the vector search score, before fusion. Defaults to None.
 
         Returns:
             dict: A dictionary containing the search results, typically under a "results" key,
@@ -655,18 +1259,11 @@ class Memory(MemoryBase):
             },
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
-            future_graph_entities = (
-                executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
-
-            original_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+        future_graph_entities = (
+            self.executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
+        )
+        original_memories = self._search_vector_store(query, effective_filters, limit, threshold)
+        graph_entities = future_graph_entities.result() if future_graph_entities else None
 
         if self.enable_graph:
             return {"results": original_memories, "relations": graph_entities}
@@ -684,8 +1281,16 @@ class Memory(MemoryBase):
             return {"results": original_memories}
 
     def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = self.embedding_model.embed(query, "search")
-        memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
+        with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+            embeddings = self.embedding_model.embed(query, "search")
+        with self.instrumentation.stage("vector_search", backend=self.config.vector_store.provider):
+            memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
+
+        if self.config.search_mode == "hybrid":
+            keyword_memories = self._keyword_search(query, filters, limit)
+            if keyword_memories is not None:
+                memories, threshold = _threshold_vector_results(memories, threshold), None
+                memories = _fuse_search_results([memories, keyword_memories], limit, self.config.hybrid_fusion)
 
         promoted_payload_keys = [
             "user_id",
@@ -721,6 +1326,21 @@ class Memory(MemoryBase):
 
         return original_memories
 
+    def _keyword_search(self, query, filters, limit):
+        """Run the lexical half of hybrid search. Returns None when the vector store has no keyword search."""
+        if not self._keyword_search_supported:
+            return None
+        try:
+            with self.instrumentation.stage("keyword_search", backend=self.config.vector_store.provider):
+                return self.vector_store.keyword_search(query=query, limit=limit, filters=filters)
+        except NotImplementedError:
+            logger.warning(
+                f"Vector store {self.config.vector_store.provider} does not support keyword search; "
+                "hybrid search falls back to vector search."
+            )
+            self._keyword_search_supported = False
+            return None
+
     def update(self, memory_id, data):
         """
         Update a memory by ID.
@@ -799,6 +1419,26 @@ class Memory(MemoryBase):
         return self.db.get_history(memory_id)
 
     def _create_memory(self, data, existing_embeddings, metadata=None):
+        memory_id, embeddings, metadata, history_record = self._prepare_create_memory(
+            data, existing_embeddings, metadata
+        )
+
+        self.vector_store.insert(
+            vectors=[embeddings],
+            ids=[memory_id],
+            payloads=[metadata],
+        )
+        self.db.add_history(**history_record)
+        capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
+        return memory_id
+
+    def _prepare_create_memory(self, data, existing_embeddings, metadata=None):
+        """
+        Build the vector, payload and history row for a new memory without writing them.
+
+        Returns:
+            tuple: `(memory_id, embeddings, payload, history_record)`.
+        """
         logging.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
@@ -810,22 +1450,63 @@ class Memory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
-        self.db.add_history(
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
-        capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return memory_id
+        history_record = {
+            "memory_id": memory_id,
+            "old_memory": None,
+            "new_memory": data,
+            "event": "ADD",
+            "created_at": metadata.get("created_at"),
+            "actor_id": metadata.get("actor_id"),
+            "role": metadata.get("role"),
+        }
+        return memory_id, embeddings, metadata, history_record
+
+    def _write_memories(self, inserts, updates, history_records):
+        """
+        Flush staged ADD and UPDATE actions with one insert, one bulk update and one history transaction.
+
+        Errors are logged rather than raised. Only the memories the vector store accepted are reported as
+        written and get history: a failed batch drops all of its memories, except when the store raises
+        `BulkWriteError`, which names the ones it rejected. When the insert fails outright the updates are
+        not attempted. A failed history write does not undo the memories written.
+
+        Args:
+            inserts (list): `(memory_id, embeddings, payload)` tuples for new memories.
+            updates (list): `(memory_id, embeddings, payload)` tuples for updated memories.
+            history_records (list): History rows for all staged actions.
+
+        Returns:
+            set: The ids of the memories that were written.
+        """
+        if not inserts and not updates:
+            return set()
+
+        written_ids = set()
+        with self.instrumentation.stage("vector_store_write", backend=self.config.vector_store.provider):
+            for event, memory_ids, vectors, payloads in _memory_write_batches(inserts, updates):
+                try:
+                    if event == "ADD":
+                        self.vector_store.insert(vectors=vectors, ids=memory_ids, payloads=payloads)
+                    else:
+                        self.vector_store.update_many(vector_ids=memory_ids, vectors=vectors, payloads=payloads)
+                except Exception as e:
+                    logging.error(f"Error writing memory actions: {e}")
+                    written_ids.update(_ids_written_despite(e, memory_ids))
+                    if not isinstance(e, BulkWriteError):
+                        break
+                else:
+                    written_ids.update(memory_ids)
+
+        history_records = [record for record in history_records if record["memory_id"] in written_ids]
+        if history_records:
+            try:
+                with self.instrumentation.stage("history_write", backend="sqlite"):
+                    self.db.batch_add_history(history_records)
+            except Exception as e:
+                logging.error(f"Error writing memory history: {e}")
+
+        _capture_memory_writes(self, inserts, updates, written_ids, "sync")
+        return written_ids
 
     def _create_procedural_memory(self, messages, metadata=None, prompt=None):
         """
@@ -866,71 +1547,90 @@ class Memory(MemoryBase):
         return result
 
     def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+        embeddings, new_metadata, history_record = self._prepare_update_memory(
+            memory_id, data, existing_embeddings, metadata
+        )
+
+        self.vector_store.update(
+            vector_id=memory_id,
+            vector=embeddings,
+            payload=new_metadata,
+        )
+        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
+
+        self.db.add_history(**history_record)
+        capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
+        return memory_id
+
+    def _prepare_update_memory(self, memory_id, data, existing_embeddings, metadata=None, existing_payload=None):
+        """
+        Build the new vector, payload and history row for an existing memory without writing them.
+
+        The current payload is read from the vector store unless `existing_payload` is given.
+
+        Returns:
+            tuple: `(embeddings, payload, history_record)`.
+        """
         logger.info(f"Updating memory with {data=}")
 
-        try:
-            existing_memory = self.vector_store.get(vector_id=memory_id)
-        except Exception:
-            logger.error(f"Error getting memory with ID {memory_id} during update.")
-            raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+        if existing_payload is None:
+            try:
+                existing_memory = self.vector_store.get(vector_id=memory_id)
+            except Exception:
+                logger.error(f"Error getting memory with ID {memory_id} during update.")
+                raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+            existing_payload = existing_memory.payload
 
-        prev_value = existing_memory.payload.get("data")
+        prev_value = existing_payload.get("data")
 
         new_metadata = deepcopy(metadata) if metadata is not None else {}
 
         new_metadata["data"] = data
         new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
+        new_metadata["created_at"] = existing_payload.get("created_at")
         new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-        if "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        if "user_id" in existing_payload:
+            new_metadata["user_id"] = existing_payload["user_id"]
+        if "agent_id" in existing_payload:
+            new_metadata["agent_id"] = existing_payload["agent_id"]
+        if "run_id" in existing_payload:
+            new_metadata["run_id"] = existing_payload["run_id"]
+        if "actor_id" in existing_payload:
+            new_metadata["actor_id"] = existing_payload["actor_id"]
+        if "role" in existing_payload:
+            new_metadata["role"] = existing_payload["role"]
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
             embeddings = self.embedding_model.embed(data, "update")
 
-        self.vector_store.update(
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
-        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
-
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-            actor_id=new_metadata.get("actor_id"),
-            role=new_metadata.get("role"),
-        )
-        capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return memory_id
-
-    def _delete_memory(self, memory_id):
+        history_record = {
+            "memory_id": memory_id,
+            "old_memory": prev_value,
+            "new_memory": data,
+            "event": "UPDATE",
+            "created_at": new_metadata["created_at"],
+            "updated_at": new_metadata["updated_at"],
+            "actor_id": new_metadata.get("actor_id"),
+            "role": new_metadata.get("role"),
+        }
+        return embeddings, new_metadata, history_record
+
+    def _delete_memory(self, memory_id, existing_payload=None):
         logging.info(f"Deleting memory with {memory_id=}")
-        existing_memory = self.vector_store.get(vector_id=memory_id)
-        prev_value = existing_memory.payload["data"]
+        if existing_payload is None:
+            existing_payload = self.vector_store.get(vector_id=memory_id).payload
+        prev_value = existing_payload["data"]
         self.vector_store.delete(vector_id=memory_id)
         self.db.add_history(
             memory_id,
             prev_value,
             None,
             "DELETE",
-            actor_id=existing_memory.payload.get("actor_id"),
-            role=existing_memory.payload.get("role"),
+            actor_id=existing_payload.get("actor_id"),
+            role=existing_payload.get("role"),
             is_deleted=1,
         )
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
@@ -945,11 +1645,10 @@ class Memory(MemoryBase):
         """
         logger.warning("Resetting all memories")
 
-        if hasattr(self.db, "connection") and self.db.connection:
-            self.db.connection.execute("DROP TABLE IF EXISTS history")
-            self.db.connection.close()
+        self.db.reset()
+        self.db.close()
 
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.db = _create_history_db(self.config)
 
         if hasattr(self.vector_store, "reset"):
             self.vector_store = VectorStoreFactory.reset(self.vector_store)
@@ -959,8 +1658,31 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+        self.executor.shutdown(wait=True)
+        self.executor = MemoryExecutor(max_workers=self.config.executor_max_workers)
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
+    def executor_stats(self) -> Dict[str, Any]:
+        """
+        Get the load of the executor shared by this instance.
+
+        Returns:
+            dict: Pool size and the number of queued, in-flight and completed tasks.
+        """
+        return self.executor.stats()
+
+    def close(self):
+        """
+        Release the resources held by this instance: waits for pending tasks on the shared
+        executor, closes the history database connection and the vector store, and sends the queued
+        telemetry events.
+        """
+        self.executor.shutdown(wait=True)
+        self.db.close()
+        if hasattr(self.vector_store, "close"):
+            self.vector_store.close()
+        self.telemetry.close()
+
     def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
 
@@ -973,12 +1695,13 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            self.config.embedder.cache,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config, self.config.llm.cache)
+        self.db = _create_history_db(self.config)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
 
@@ -992,6 +1715,10 @@ class AsyncMemory(MemoryBase):
         else:
             self.graph = None
 
+        self.telemetry = AnonymousTelemetry()
+        # Sinks added with `self.instrumentation.add_sink` receive the timing of every pipeline stage.
+        self.instrumentation = Instrumentation()
+        self._keyword_search_supported = True
         capture_event("mem0.init", self, {"sync_type": "async"})
 
     @classmethod
@@ -1049,24 +1776,15 @@ class AsyncMemory(MemoryBase):
         Returns:
             dict: A dictionary containing the result of the memory addition operation.
         """
-        processed_metadata, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_metadata=metadata
+        messages, processed_metadata, effective_filters = _prepare_add_request(
+            messages,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            metadata=metadata,
+            memory_type=memory_type,
         )
 
-        if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
-            raise ValueError(
-                f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
-            )
-
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        elif isinstance(messages, dict):
-            messages = [messages]
-
-        elif not isinstance(messages, list):
-            raise ValueError("messages must be str, dict, or list[dict]")
-
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = await self._create_procedural_memory(
                 messages, metadata=processed_metadata, prompt=prompt, llm=llm
@@ -1103,6 +1821,111 @@ class AsyncMemory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    async def add_many(self, items, *, concurrency=None):
+        """
+        Create memories for many conversations at once asynchronously.
+
+        See `Memory.add_many` for the pipeline and the format of `items`, `concurrency` and the result.
+
+        Args:
+            items (Iterable[dict]): Items holding the arguments of `add`.
+            concurrency (int or dict, optional): Maximum number of items in each stage at once. Defaults to None.
+
+        Returns:
+            dict: `{"results": [...], "failures": [...]}`, with one result per item in input order.
+        """
+        stage_limits = _resolve_add_many_concurrency(concurrency)
+        stage_semaphores = {stage: asyncio.Semaphore(limit) for stage, limit in stage_limits.items()}
+
+        results = []
+        failures = []
+        pending_items = enumerate(items)
+
+        async def worker():
+            for index, item in pending_items:
+                results.append(None)
+                try:
+                    results[index] = await self._add_pipelined(item, stage_semaphores)
+                except Exception as e:
+                    logger.error(f"Error adding item {index} in add_many (async): {e}")
+                    failures.append({"index": index, "error": str(e)})
+
+        await asyncio.gather(*(worker() for _ in range(sum(stage_limits.values()))))
+
+        failures.sort(key=lambda failure: failure["index"])
+        capture_event(
+            "mem0.add_many",
+            self,
+            {"item_count": len(results), "failure_count": len(failures), "sync_type": "async"},
+        )
+        return {"results": results, "failures": failures}
+
+    async def _add_pipelined(self, item, stage_semaphores):
+        """Run a single `add_many` item through the add stages, holding each stage's semaphore."""
+        item = _validate_add_many_item(item)
+        infer = item.get("infer", True)
+
+        async with stage_semaphores["extract"]:
+            messages, processed_metadata, effective_filters = _prepare_add_request(
+                item["messages"],
+                user_id=item.get("user_id"),
+                agent_id=item.get("agent_id"),
+                run_id=item.get("run_id"),
+                metadata=item.get("metadata"),
+                memory_type=item.get("memory_type"),
+            )
+
+            if item.get("agent_id") is not None and item.get("memory_type") == MemoryType.PROCEDURAL.value:
+                return await self._create_procedural_memory(
+                    messages, metadata=processed_metadata, prompt=item.get("prompt")
+                )
+
+            if self.config.llm.config.get("enable_vision"):
+                messages = await asyncio.to_thread(
+                    parse_vision_messages, messages, self.llm, self.config.llm.config.get("vision_details")
+                )
+            else:
+                messages = parse_vision_messages(messages)
+
+            new_retrieved_facts = await self._extract_facts(messages) if infer else []
+
+        if not infer:
+            async with stage_semaphores["write"]:
+                vector_store_result = await self._add_to_vector_store(
+                    messages, processed_metadata, effective_filters, False
+                )
+        elif not new_retrieved_facts:
+            vector_store_result = []
+        else:
+            async with stage_semaphores["embed"]:
+                new_message_embeddings = await self._embed_facts(new_retrieved_facts)
+            async with stage_semaphores["search"]:
+                existing_memories_per_fact = await self._retrieve_old_memories(
+                    new_retrieved_facts, new_message_embeddings, effective_filters
+                )
+            async with stage_semaphores["decide"]:
+                new_memories_with_actions, temp_uuid_mapping = await self._resolve_memory_actions(
+                    new_retrieved_facts, existing_memories_per_fact
+                )
+            if not new_memories_with_actions:
+                vector_store_result = []
+            else:
+                async with stage_semaphores["write"]:
+                    vector_store_result = await self._apply_memory_actions(
+                        new_memories_with_actions,
+                        processed_metadata,
+                        new_message_embeddings,
+                        temp_uuid_mapping,
+                        _payloads_by_id(existing_memories_per_fact),
+                    )
+
+        if self.enable_graph:
+            async with stage_semaphores["graph"]:
+                graph_result = await self._add_to_graph(messages, effective_filters)
+            return {"results": vector_store_result, "relations": graph_result}
+
+        return {"results": vector_store_result}
+
     async def _add_to_vector_store(
         self,
         messages: list,
@@ -1111,7 +1934,7 @@ class AsyncMemory(MemoryBase):
         infer: bool,
     ):
         if not infer:
-            returned_memories = []
+            valid_messages = []
             for message_dict in messages:
                 if (
                     not isinstance(message_dict, dict)
@@ -1124,6 +1947,15 @@ class AsyncMemory(MemoryBase):
                 if message_dict["role"] == "system":
                     continue
 
+                valid_messages.append(message_dict)
+
+            msg_contents = [message_dict["content"] for message_dict in valid_messages]
+            with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+                msg_embeddings = await self.embedding_model.aembed_batch(msg_contents, "add")
+            msg_embeddings = dict(zip(msg_contents, msg_embeddings))
+
+            returned_memories, inserts, history_records = [], [], []
+            for message_dict in valid_messages:
                 per_msg_meta = deepcopy(metadata)
                 per_msg_meta["role"] = message_dict["role"]
 
@@ -1132,8 +1964,11 @@ class AsyncMemory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                mem_id, embeddings, payload, history_record = await self._prepare_create_memory(
+                    msg_content, msg_embeddings, per_msg_meta
+                )
+                inserts.append((mem_id, embeddings, payload))
+                history_records.append(history_record)
 
                 returned_memories.append(
                     {
@@ -1144,8 +1979,46 @@ class AsyncMemory(MemoryBase):
                         "role": message_dict["role"],
                     }
                 )
-            return returned_memories
 
+            written_ids = await self._write_memories(inserts, [], history_records)
+            return [memory for memory in returned_memories if memory["id"] in written_ids]
+
+        new_retrieved_facts = await self._extract_facts(messages)
+
+        if not new_retrieved_facts:
+            logger.info("No new facts retrieved from input. Skipping memory update LLM call.")
+            return []
+
+        new_message_embeddings = await self._embed_facts(new_retrieved_facts)
+        existing_memories_per_fact = await self._retrieve_old_memories(
+            new_retrieved_facts, new_message_embeddings, effective_filters
+        )
+        new_memories_with_actions, temp_uuid_mapping = await self._resolve_memory_actions(
+            new_retrieved_facts, existing_memories_per_fact
+        )
+
+        if not new_memories_with_actions:
+            logger.info("No new facts retrieved from input (async). Skipping memory update LLM call.")
+            return []
+
+        returned_memories = await self._apply_memory_actions(
+            new_memories_with_actions,
+            metadata,
+            new_message_embeddings,
+            temp_uuid_mapping,
+            _payloads_by_id(existing_memories_per_fact),
+        )
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+        )
+        return returned_memories
+
+    async def _extract_facts(self, messages):
+        """Run the fact-extraction LLM call and return the extracted facts."""
         parsed_messages = parse_messages(messages)
         if self.config.custom_fact_extraction_prompt:
             system_prompt = self.config.custom_fact_extraction_prompt
@@ -1153,144 +2026,154 @@ class AsyncMemory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
+        with self.instrumentation.stage("fact_extraction", provider=self.config.llm.provider):
+            response = await self.llm.agenerate_response(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
         try:
             response = remove_code_blocks(response)
             new_retrieved_facts = json.loads(response)["facts"]
         except Exception as e:
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.info("No new facts retrieved from input. Skipping memory update LLM call.")
-            return []
             logging.error(f"Error in new_retrieved_facts: {e}")
             new_retrieved_facts = []
 
-        retrieved_old_memory = []
-        new_message_embeddings = {}
+        return new_retrieved_facts
 
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
+    async def _embed_facts(self, facts):
+        """Embed all facts in one batch and return a mapping of fact to embedding."""
+        with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+            fact_embeddings = await self.embedding_model.aembed_batch(facts, "add")
+        return dict(zip(facts, fact_embeddings))
+
+    async def _retrieve_old_memories(self, facts, fact_embeddings, filters):
+        """Look up the existing memories closest to each new fact, in one batched search."""
+        with self.instrumentation.stage("neighbor_search", backend=self.config.vector_store.provider):
+            return await self.vector_store.asearch_many(
+                queries=facts,
+                vectors=[fact_embeddings[fact] for fact in facts],
                 limit=5,
-                filters=effective_filters,  # 'filters' is query_filters_for_inference
+                filters=filters,
             )
-            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logging.info(f"Total existing memories: {len(retrieved_old_memory)}")
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
 
+    async def _resolve_memory_actions(self, facts, existing_memories_per_fact):
+        """
+        Decide what to do with each new fact; see `Memory._resolve_memory_actions`.
+
+        Returns:
+            tuple: `(new_memories_with_actions, temp_uuid_mapping)`.
+        """
+        preclassified_actions, ambiguous = _preclassify_facts(
+            facts,
+            existing_memories_per_fact,
+            self.config.duplicate_similarity_threshold,
+            self.config.novelty_similarity_threshold,
+        )
+        if not ambiguous:
+            logger.debug("All facts resolved without the update-decision LLM call.")
+            return _merge_memory_actions(preclassified_actions, {}), {}
+
+        retrieved_old_memory, temp_uuid_mapping = _build_old_memory_context(
+            [existing_memories for _, existing_memories in ambiguous]
+        )
+        llm_response = await self._decide_memory_actions(retrieved_old_memory, [fact for fact, _ in ambiguous])
+        return _merge_memory_actions(preclassified_actions, llm_response), temp_uuid_mapping
+
+    async def _decide_memory_actions(self, retrieved_old_memory, facts):
+        """Run the update-decision LLM call and return its parsed response."""
         function_calling_prompt = get_update_memory_messages(
-            retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            retrieved_old_memory, facts, self.config.custom_update_memory_prompt
         )
         try:
-            response = await asyncio.to_thread(
-                self.llm.generate_response,
-                messages=[{"role": "user", "content": function_calling_prompt}],
-                response_format={"type": "json_object"},
-            )
+            with self.instrumentation.stage("update_decision", provider=self.config.llm.provider):
+                response = await self.llm.agenerate_response(
+                    messages=[{"role": "user", "content": function_calling_prompt}],
+                    response_format={"type": "json_object"},
+                )
         except Exception as e:
-            response = ""
             logging.error(f"Error in new memory actions response: {e}")
             response = ""
         try:
             response = remove_code_blocks(response)
             new_memories_with_actions = json.loads(response)
         except Exception as e:
+            logging.error(f"Invalid JSON response: {e}")
             new_memories_with_actions = {}
 
-        if not new_memories_with_actions:
-            logger.info("No new facts retrieved from input (async). Skipping memory update LLM call.")
-            return []
+        return new_memories_with_actions
 
-            logging.error(f"Invalid JSON response: {e}")
-            new_memories_with_actions = {}
+    async def _apply_memory_actions(
+        self, new_memories_with_actions, metadata, new_message_embeddings, temp_uuid_mapping, existing_payloads=None
+    ):
+        """
+        Execute the ADD, UPDATE and DELETE actions decided by the LLM and return the affected memories.
+
+        See `Memory._apply_memory_actions` for `existing_payloads`.
+        """
+        existing_payloads = existing_payloads or {}
+        try:
+            await _aembed_memory_actions(
+                self.embedding_model, new_memories_with_actions.get("memory", []), new_message_embeddings
+            )
+        except Exception as e:
+            logging.error(f"Error embedding memory actions (async): {e}")
 
-        returned_memories = []
+        # ADD and UPDATE actions are prepared concurrently, then flushed together; deletes run once they are written.
+        planned = []
         try:
-            memory_tasks = []
             for resp in new_memories_with_actions.get("memory", []):
-                logging.info(resp)
                 try:
-                    action_text = resp.get("text")
-                    if not action_text:
+                    action = _plan_memory_action(resp, temp_uuid_mapping)
+                    if action is None:
                         continue
-                    event_type = resp.get("event")
-
-                    if event_type == "ADD":
-                        task = asyncio.create_task(
-                            self._create_memory(
-                                data=action_text,
+                    memory = action["memory"]
+                    if memory["event"] == "ADD":
+                        action["task"] = asyncio.create_task(
+                            self._prepare_create_memory(
+                                data=memory["memory"],
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
                             )
                         )
-                        memory_tasks.append((task, resp, "ADD", None))
-                    elif event_type == "UPDATE":
-                        task = asyncio.create_task(
-                            self._update_memory(
-                                memory_id=temp_uuid_mapping[resp["id"]],
-                                data=action_text,
+                    elif memory["event"] == "UPDATE":
+                        action["task"] = asyncio.create_task(
+                            self._prepare_update_memory(
+                                memory_id=memory["id"],
+                                data=memory["memory"],
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
+                                existing_payload=existing_payloads.get(memory["id"]),
                             )
                         )
-                        memory_tasks.append((task, resp, "UPDATE", temp_uuid_mapping[resp["id"]]))
-                    elif event_type == "DELETE":
-                        task = asyncio.create_task(self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")]))
-                        memory_tasks.append((task, resp, "DELETE", temp_uuid_mapping[resp.get("id")]))
-                    elif event_type == "NONE":
-                        logging.info("NOOP for Memory (async).")
+                    planned.append(action)
                 except Exception as e:
                     logging.error(f"Error processing memory action (async): {resp}, Error: {e}")
 
-            for task, resp, event_type, mem_id in memory_tasks:
+            for action in [action for action in planned if "task" in action]:
                 try:
-                    result_id = await task
-                    if event_type == "ADD":
-                        returned_memories.append({"id": result_id, "memory": resp.get("text"), "event": event_type})
-                    elif event_type == "UPDATE":
-                        returned_memories.append(
-                            {
-                                "id": mem_id,
-                                "memory": resp.get("text"),
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        returned_memories.append({"id": mem_id, "memory": resp.get("text"), "event": event_type})
+                    _settle_memory_action(action, await action.pop("task"))
                 except Exception as e:
                     logging.error(f"Error awaiting memory task (async): {e}")
+                    planned.remove(action)
         except Exception as e:
             logging.error(f"Error in memory processing loop (async): {e}")
 
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
-        capture_event(
-            "mem0.add",
-            self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+        written_ids = await self._write_memories(*_stage_memory_writes(planned))
+        returned_memories = _written_memories(planned, written_ids)
+
+        staged_deletes = [mem for mem in returned_memories if mem["event"] == "DELETE"]
+        delete_results = await asyncio.gather(
+            *(
+                self._delete_memory(memory_id=deleted["id"], existing_payload=existing_payloads.get(deleted["id"]))
+                for deleted in staged_deletes
+            ),
+            return_exceptions=True,
         )
+        for deleted, result in zip(staged_deletes, delete_results):
+            if isinstance(result, Exception):
+                logging.error(f"Error deleting memory {deleted['id']} (async): {result}")
+                returned_memories.remove(deleted)
+
         return returned_memories
 
     async def _add_to_graph(self, messages, filters):
@@ -1315,7 +2198,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await self.vector_store.aget(vector_id=memory_id)
         if not memory:
             return None
 
@@ -1390,18 +2273,20 @@ class AsyncMemory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
+        vector_store_task = asyncio.create_task(self._get_all_from_vector_store(effective_filters, limit))
 
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
+        graph_task = None
+        if self.enable_graph:
+            if asyncio.iscoroutinefunction(self.graph.get_all):
+                graph_task = asyncio.create_task(self.graph.get_all(effective_filters, limit))
+            else:
+                graph_task = asyncio.create_task(asyncio.to_thread(self.graph.get_all, effective_filters, limit))
 
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+        if graph_task:
+            all_memories_result, graph_entities_result = await asyncio.gather(vector_store_task, graph_task)
+        else:
+            all_memories_result = await vector_store_task
+            graph_entities_result = None
 
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
@@ -1418,12 +2303,62 @@ class AsyncMemory(MemoryBase):
         else:
             return {"results": all_memories_result}
 
+    async def get_all_pages(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        page_size: int = 100,
+    ):
+        """
+        List all memories, yielding them page by page.
+
+        Takes the same scoping arguments as `get_all`, but returns an async iterator, so a large listing
+        is fetched and formatted one page at a time instead of in a single step. Graph relations are
+        not included; use `get_all` for them.
+
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters to apply, as in `get_all`.
+            limit (int, optional): The maximum number of memories to return in total. Defaults to 100.
+            page_size (int, optional): The maximum number of memories per page. Defaults to 100.
+
+        Yields:
+            list: The formatted memories of one page, in the same shape as the `get_all` results.
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
+
+        if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
+            raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be specified.")
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.get_all_pages",
+            self,
+            {"limit": limit, "page_size": page_size, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+        )
+
+        async for page in self.vector_store.alist_pages(filters=effective_filters, page_size=page_size, limit=limit):
+            yield self._format_listed_memories(page)
+
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await self.vector_store.alist(filters=filters, limit=limit)
         actual_memories = (
-            memories_result[0] if isinstance(memories_result, tuple) and len(memories_result) > 0 else memories_result
+            memories_result[0]
+            if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
+            else memories_result
         )
+        return self._format_listed_memories(actual_memories)
 
+    def _format_listed_memories(self, memories):
+        """Convert listed vector store records into the dicts returned by `get_all`."""
         promoted_payload_keys = [
             "user_id",
             "agent_id",
@@ -1434,7 +2369,7 @@ class AsyncMemory(MemoryBase):
         core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
 
         formatted_memories = []
-        for mem in actual_memories:
+        for mem in memories:
             memory_item_dict = MemoryItem(
                 id=mem.id,
                 memory=mem.payload["data"],
@@ -1475,7 +2410,8 @@ class AsyncMemory(MemoryBase):
             run_id (str, optional): ID of the run to search for. Defaults to None.
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Filters to apply to the search. Defaults to None.
-            threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+            threshold (float, optional): Minimum score for a memory to be included in the results. In hybrid
+                search mode it applies to the vector search score, before fusion. Defaults to None.
 
         Returns:
             dict: A dictionary containing the search results, typically under a "results" key,
@@ -1535,10 +2471,22 @@ class AsyncMemory(MemoryBase):
             return {"results": original_memories}
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
-        )
+        with self.instrumentation.stage("embedding", provider=self.config.embedder.provider):
+            embeddings = await self.embedding_model.aembed(query, "search")
+
+        async def vector_search():
+            with self.instrumentation.stage("vector_search", backend=self.config.vector_store.provider):
+                return await self.vector_store.asearch(query=query, vectors=embeddings, limit=limit, filters=filters)
+
+        if self.config.search_mode == "hybrid":
+            memories, keyword_memories = await asyncio.gather(
+                vector_search(), self._keyword_search(query, filters, limit)
+            )
+            if keyword_memories is not None:
+                memories, threshold = _threshold_vector_results(memories, threshold), None
+                memories = _fuse_search_results([memories, keyword_memories], limit, self.config.hybrid_fusion)
+        else:
+            memories = await vector_search()
 
         promoted_payload_keys = [
             "user_id",
@@ -1574,6 +2522,21 @@ class AsyncMemory(MemoryBase):
 
         return original_memories
 
+    async def _keyword_search(self, query, filters, limit):
+        """Run the lexical half of hybrid search. Returns None when the vector store has no keyword search."""
+        if not self._keyword_search_supported:
+            return None
+        try:
+            with self.instrumentation.stage("keyword_search", backend=self.config.vector_store.provider):
+                return await self.vector_store.akeyword_search(query=query, limit=limit, filters=filters)
+        except NotImplementedError:
+            logger.warning(
+                f"Vector store {self.config.vector_store.provider} does not support keyword search; "
+                "hybrid search falls back to vector search."
+            )
+            self._keyword_search_supported = False
+            return None
+
     async def update(self, memory_id, data):
         """
         Update a memory by ID asynchronously.
@@ -1587,7 +2550,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await self.embedding_model.aembed(data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -1628,7 +2591,7 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        memories = await self.vector_store.alist(filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -1657,11 +2620,33 @@ class AsyncMemory(MemoryBase):
         return await asyncio.to_thread(self.db.get_history, memory_id)
 
     async def _create_memory(self, data, existing_embeddings, metadata=None):
+        memory_id, embeddings, metadata, history_record = await self._prepare_create_memory(
+            data, existing_embeddings, metadata
+        )
+
+        await self.vector_store.ainsert(
+            vectors=[embeddings],
+            ids=[memory_id],
+            payloads=[metadata],
+        )
+
+        await asyncio.to_thread(self.db.add_history, **history_record)
+
+        capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
+        return memory_id
+
+    async def _prepare_create_memory(self, data, existing_embeddings, metadata=None):
+        """
+        Build the vector, payload and history row for a new memory without writing them.
+
+        Returns:
+            tuple: `(memory_id, embeddings, payload, history_record)`.
+        """
         logging.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await self.embedding_model.aembed(data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -1669,26 +2654,52 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
+        history_record = {
+            "memory_id": memory_id,
+            "old_memory": None,
+            "new_memory": data,
+            "event": "ADD",
+            "created_at": metadata.get("created_at"),
+            "actor_id": metadata.get("actor_id"),
+            "role": metadata.get("role"),
+        }
+        return memory_id, embeddings, metadata, history_record
+
+    async def _write_memories(self, inserts, updates, history_records):
+        """
+        Flush staged ADD and UPDATE actions with one insert, one bulk update and one history transaction.
 
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
+        See `Memory._write_memories`.
+        """
+        if not inserts and not updates:
+            return set()
 
-        capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
-        return memory_id
+        written_ids = set()
+        with self.instrumentation.stage("vector_store_write", backend=self.config.vector_store.provider):
+            for event, memory_ids, vectors, payloads in _memory_write_batches(inserts, updates):
+                try:
+                    if event == "ADD":
+                        await self.vector_store.ainsert(vectors=vectors, ids=memory_ids, payloads=payloads)
+                    else:
+                        await self.vector_store.aupdate_many(vector_ids=memory_ids, vectors=vectors, payloads=payloads)
+                except Exception as e:
+                    logging.error(f"Error writing memory actions (async): {e}")
+                    written_ids.update(_ids_written_despite(e, memory_ids))
+                    if not isinstance(e, BulkWriteError):
+                        break
+                else:
+                    written_ids.update(memory_ids)
+
+        history_records = [record for record in history_records if record["memory_id"] in written_ids]
+        if history_records:
+            try:
+                with self.instrumentation.stage("history_write", backend="sqlite"):
+                    await asyncio.to_thread(self.db.batch_add_history, history_records)
+            except Exception as e:
+                logging.error(f"Error writing memory history (async): {e}")
+
+        _capture_memory_writes(self, inserts, updates, written_ids, "async")
+        return written_ids
 
     async def _create_procedural_memory(self, messages, metadata=None, llm=None, prompt=None):
         """
@@ -1724,7 +2735,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await self.llm.agenerate_response(messages=parsed_messages)
         except Exception as e:
             logger.error(f"Error generating procedural memory summary: {e}")
             raise
@@ -1733,7 +2744,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await self.embedding_model.aembed(procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -1742,76 +2753,93 @@ class AsyncMemory(MemoryBase):
         return result
 
     async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+        embeddings, new_metadata, history_record = await self._prepare_update_memory(
+            memory_id, data, existing_embeddings, metadata
+        )
+
+        await self.vector_store.aupdate(
+            vector_id=memory_id,
+            vector=embeddings,
+            payload=new_metadata,
+        )
+        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
+
+        await asyncio.to_thread(self.db.add_history, **history_record)
+        capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
+        return memory_id
+
+    async def _prepare_update_memory(self, memory_id, data, existing_embeddings, metadata=None, existing_payload=None):
+        """
+        Build the new vector, payload and history row for an existing memory without writing them.
+
+        The current payload is read from the vector store unless `existing_payload` is given.
+
+        Returns:
+            tuple: `(embeddings, payload, history_record)`.
+        """
         logger.info(f"Updating memory with {data=}")
 
-        try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
-        except Exception:
-            logger.error(f"Error getting memory with ID {memory_id} during update.")
-            raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+        if existing_payload is None:
+            try:
+                existing_memory = await self.vector_store.aget(vector_id=memory_id)
+            except Exception:
+                logger.error(f"Error getting memory with ID {memory_id} during update.")
+                raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+            existing_payload = existing_memory.payload
 
-        prev_value = existing_memory.payload.get("data")
+        prev_value = existing_payload.get("data")
 
         new_metadata = deepcopy(metadata) if metadata is not None else {}
 
         new_metadata["data"] = data
         new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
+        new_metadata["created_at"] = existing_payload.get("created_at")
         new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
+        if "user_id" in existing_payload:
+            new_metadata["user_id"] = existing_payload["user_id"]
+        if "agent_id" in existing_payload:
+            new_metadata["agent_id"] = existing_payload["agent_id"]
+        if "run_id" in existing_payload:
+            new_metadata["run_id"] = existing_payload["run_id"]
 
-        if "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        if "actor_id" in existing_payload:
+            new_metadata["actor_id"] = existing_payload["actor_id"]
+        if "role" in existing_payload:
+            new_metadata["role"] = existing_payload["role"]
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
-
-        await asyncio.to_thread(
-            self.vector_store.update,
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
-        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
-
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-            actor_id=new_metadata.get("actor_id"),
-            role=new_metadata.get("role"),
-        )
-        capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
-        return memory_id
-
-    async def _delete_memory(self, memory_id):
+            embeddings = await self.embedding_model.aembed(data, "update")
+
+        history_record = {
+            "memory_id": memory_id,
+            "old_memory": prev_value,
+            "new_memory": data,
+            "event": "UPDATE",
+            "created_at": new_metadata["created_at"],
+            "updated_at": new_metadata["updated_at"],
+            "actor_id": new_metadata.get("actor_id"),
+            "role": new_metadata.get("role"),
+        }
+        return embeddings, new_metadata, history_record
+
+    async def _delete_memory(self, memory_id, existing_payload=None):
         logging.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
-        prev_value = existing_memory.payload["data"]
+        if existing_payload is None:
+            existing_payload = (await self.vector_store.aget(vector_id=memory_id)).payload
+        prev_value = existing_payload["data"]
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+        await self.vector_store.adelete(vector_id=memory_id)
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
             prev_value,
             None,
             "DELETE",
-            actor_id=existing_memory.payload.get("actor_id"),
-            role=existing_memory.payload.get("role"),
+            actor_id=existing_payload.get("actor_id"),
+            role=existing_payload.get("role"),
             is_deleted=1,
         )
 
@@ -1832,17 +2860,32 @@ class AsyncMemory(MemoryBase):
 
         if hasattr(self.vector_store, "client") and hasattr(self.vector_store.client, "close"):
             await asyncio.to_thread(self.vector_store.client.close)
+        if hasattr(self.vector_store, "aclose"):
+            await self.vector_store.aclose()
 
-        if hasattr(self.db, "connection") and self.db.connection:
-            await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
-            await asyncio.to_thread(self.db.connection.close)
+        await asyncio.to_thread(self.db.reset)
+        await asyncio.to_thread(self.db.close)
 
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.db = _create_history_db(self.config)
 
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
+    async def close(self):
+        """
+        Release the resources held by this instance, flushing buffered history rows and telemetry events.
+        Async clients of the vector store and the embedding model are closed on the running event loop.
+        """
+        await asyncio.to_thread(self.db.close)
+        if hasattr(self.vector_store, "close"):
+            await asyncio.to_thread(self.vector_store.close)
+        if hasattr(self.vector_store, "aclose"):
+            await self.vector_store.aclose()
+        if hasattr(self.embedding_model, "aclose"):
+            await self.embedding_model.aclose()
+        await asyncio.to_thread(self.telemetry.close)
+
     async def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
@@ -38,6 +38,7 @@ class MemoryGraph:
             self.config.embedder.provider,
             self.config.embedder.config,
             {"enable_embeddings": True},
+            self.config.embedder.cache,
         )
 
         self.llm_provider = "openai_structured"
@@ -46,7 +47,7 @@ class MemoryGraph:
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config, self.config.llm.cache)
         self.user_id = None
         self.threshold = 0.7
 
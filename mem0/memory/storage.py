@@ -1,19 +1,124 @@
+import atexit
+import functools
 import logging
+import queue
 import sqlite3
 import threading
 import uuid
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+_INSERT_HISTORY_SQL = """
+                INSERT INTO history (
+                    id, memory_id, old_memory, new_memory, event,
+                    created_at, updated_at, is_deleted, actor_id, role
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# `PRAGMA user_version` of history databases whose timestamps are stored in UTC.
+_UTC_TIMESTAMPS_VERSION = 1
+
+
+def _to_utc(timestamp: Optional[str]) -> Optional[str]:
+    """
+    Convert an ISO 8601 timestamp with a UTC offset to UTC, in a fixed-width format, so that timestamps
+    sort as strings in the order of the instants they denote. Other values are returned unchanged.
+    """
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return timestamp
+    if parsed.tzinfo is None:
+        return timestamp
+    return parsed.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _flush_at_exit(manager_ref) -> None:
+    manager = manager_ref()
+    if manager is None:
+        return
+    try:
+        manager.flush()
+    except Exception as e:
+        logger.error(f"Error writing history rows at exit: {e}")
+
+
 class SQLiteManager:
-    def __init__(self, db_path: str = ":memory:"):
+    """
+    Stores the history of memory changes in a SQLite database.
+
+    With `write_behind=True`, `add_history` and `batch_add_history` only buffer the rows; a background
+    thread commits them with `executemany` every `flush_interval` seconds, or as soon as `batch_size`
+    rows are pending. Pending rows are flushed before every read, on `close()` and when the interpreter
+    exits, so `get_history` always sees the rows added before it was called. Rows are still lost if the
+    process is killed before they are flushed.
+
+    Timestamps with a UTC offset are stored converted to UTC, so ordering history by the indexed
+    columns follows time even across DST changes.
+
+    File databases are opened in WAL mode by default, with `synchronous` applied to the writer
+    connection. In WAL mode `get_history` runs on a pool of `read_connections` read-only connections,
+    so reads are not serialized behind writes.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        write_behind: bool = False,
+        flush_interval: float = 0.1,
+        batch_size: int = 100,
+        wal: bool = True,
+        synchronous: str = "NORMAL",
+        read_connections: int = 2,
+    ):
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous mode {synchronous!r}. Expected one of {_SYNCHRONOUS_MODES}")
+
         self.db_path = db_path
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._writer = None
+        self._readers = None
+        self._exit_hook = None
+
         self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self._lock = threading.Lock()
+        journal_mode = None
+        if wal:
+            # In-memory databases stay in "memory" mode, which rules out separate reader connections.
+            journal_mode = self.connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        self.connection.execute(f"PRAGMA synchronous={synchronous}")
         self._migrate_history_table()
         self._create_history_table()
+        self._migrate_timestamps_to_utc()
+        self._create_history_indexes()
+
+        if journal_mode == "wal" and read_connections > 0:
+            self._readers = queue.Queue()
+            uri = f"{Path(self.db_path).absolute().as_uri()}?mode=ro"
+            for _ in range(read_connections):
+                self._readers.put(sqlite3.connect(uri, uri=True, check_same_thread=False))
+
+        if write_behind:
+            self._writer = threading.Thread(target=self._run_writer, name="mem0-history-writer", daemon=True)
+            self._writer.start()
+            # The writer is a daemon thread, killed at exit with whatever it has not committed yet.
+            self._exit_hook = functools.partial(_flush_at_exit, weakref.ref(self))
+            atexit.register(self._exit_hook)
 
     def _migrate_history_table(self) -> None:
         """
@@ -56,6 +161,22 @@ class SQLiteManager:
             cur.execute(f"INSERT INTO history ({cols_csv}) SELECT {cols_csv} FROM history_old")
             cur.execute("DROP TABLE history_old")
 
+    def _migrate_timestamps_to_utc(self) -> None:
+        """Convert the timestamps of rows written before they were stored in UTC, once per database."""
+        with self._lock, self.connection:
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] >= _UTC_TIMESTAMPS_VERSION:
+                return
+            rows = self.connection.execute("SELECT id, created_at, updated_at FROM history").fetchall()
+            updates = [
+                (_to_utc(created_at), _to_utc(updated_at), row_id)
+                for row_id, created_at, updated_at in rows
+                if (_to_utc(created_at), _to_utc(updated_at)) != (created_at, updated_at)
+            ]
+            if updates:
+                logger.info(f"Converting the timestamps of {len(updates)} history rows to UTC.")
+                self.connection.executemany("UPDATE history SET created_at = ?, updated_at = ? WHERE id = ?", updates)
+            self.connection.execute(f"PRAGMA user_version = {_UTC_TIMESTAMPS_VERSION}")
+
     def _create_history_table(self) -> None:
         with self._lock, self.connection:
             self.connection.execute(
@@ -75,6 +196,17 @@ class SQLiteManager:
             """
             )
 
+    def _create_history_indexes(self) -> None:
+        # Created separately from the table: a table renamed by the migration keeps its index names.
+        # The index finds the rows of a memory already in `get_history` order, since timestamps are stored
+        # in UTC and sort as strings. It is not covering, since it would then hold a second copy of every
+        # memory text, so the rows are read from the table.
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_memory_id_created_at "
+                "ON history (memory_id, created_at, updated_at)"
+            )
+
     def add_history(
         self,
         memory_id: str,
@@ -88,42 +220,107 @@ class SQLiteManager:
         actor_id: Optional[str] = None,
         role: Optional[str] = None,
     ) -> None:
+        row = (
+            str(uuid.uuid4()),
+            memory_id,
+            old_memory,
+            new_memory,
+            event,
+            _to_utc(created_at),
+            _to_utc(updated_at),
+            is_deleted,
+            actor_id,
+            role,
+        )
+        if self.write_behind:
+            self._enqueue([row])
+            return
+
         with self._lock, self.connection:
-            self.connection.execute(
-                """
-                INSERT INTO history (
-                    id, memory_id, old_memory, new_memory, event,
-                    created_at, updated_at, is_deleted, actor_id, role
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    str(uuid.uuid4()),
-                    memory_id,
-                    old_memory,
-                    new_memory,
-                    event,
-                    created_at,
-                    updated_at,
-                    is_deleted,
-                    actor_id,
-                    role,
-                ),
+            self.connection.execute(_INSERT_HISTORY_SQL, row)
+
+    def batch_add_history(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert several history rows in a single transaction.
+
+        Each record takes the same fields as `add_history`: `memory_id`, `old_memory`,
+        `new_memory` and `event`, plus the optional keyword fields.
+        """
+        if not records:
+            return
+
+        rows = [
+            (
+                str(uuid.uuid4()),
+                record["memory_id"],
+                record.get("old_memory"),
+                record.get("new_memory"),
+                record["event"],
+                _to_utc(record.get("created_at")),
+                _to_utc(record.get("updated_at")),
+                record.get("is_deleted", 0),
+                record.get("actor_id"),
+                record.get("role"),
             )
+            for record in records
+        ]
 
-    def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        if self.write_behind:
+            self._enqueue(rows)
+            return
+
+        with self._lock, self.connection:
+            self.connection.executemany(_INSERT_HISTORY_SQL, rows)
+
+    def _enqueue(self, rows: List[tuple]) -> None:
+        with self._pending_lock:
+            self._pending.extend(rows)
+            pending = len(self._pending)
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _run_writer(self) -> None:
+        while not self._closing:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error writing history rows: {e}")
+
+    def flush(self) -> None:
+        """
+        Commit the rows buffered in write-behind mode. A no-op otherwise.
+
+        The buffer is taken while holding the connection lock, so once a reader acquires that lock no
+        row added before it is still in flight.
+        """
         with self._lock:
-            cur = self.connection.execute(
-                """
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if rows and self.connection:
+                with self.connection:
+                    self.connection.executemany(_INSERT_HISTORY_SQL, rows)
+
+    def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        if self.write_behind:
+            self.flush()
+        query = """
                 SELECT id, memory_id, old_memory, new_memory, event,
                        created_at, updated_at, is_deleted, actor_id, role
                 FROM history
                 WHERE memory_id = ?
-                ORDER BY created_at ASC, DATETIME(updated_at) ASC
-            """,
-                (memory_id,),
-            )
-            rows = cur.fetchall()
+                ORDER BY created_at ASC, updated_at ASC
+            """
+        if self._readers is not None:
+            reader = self._readers.get()
+            try:
+                rows = reader.execute(query, (memory_id,)).fetchall()
+            finally:
+                self._readers.put(reader)
+        else:
+            with self._lock:
+                rows = self.connection.execute(query, (memory_id,)).fetchall()
 
         return [
             {
@@ -142,13 +339,29 @@ class SQLiteManager:
         ]
 
     def reset(self) -> None:
-        """Drop and recreate the history table."""
+        """Drop and recreate the history table, discarding any buffered rows."""
+        with self._pending_lock:
+            self._pending = []
         with self._lock, self.connection:
             self.connection.execute("DROP TABLE IF EXISTS history")
         self._create_history_table()
+        self._create_history_indexes()
 
     def close(self) -> None:
-        if self.connection:
+        if getattr(self, "_exit_hook", None) is not None:
+            atexit.unregister(self._exit_hook)
+            self._exit_hook = None
+        if getattr(self, "_writer", None) is not None:
+            self._closing = True
+            self._wakeup.set()
+            self._writer.join()
+            self._writer = None
+        if getattr(self, "_readers", None) is not None:
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+            self._readers = None
+        if getattr(self, "connection", None):
+            self.flush()
             self.connection.close()
             self.connection = None
 
@@ -1,9 +1,10 @@
 import logging
 import os
 import platform
+import queue
 import sys
-
-from posthog import Posthog
+import threading
+from typing import Any, Callable, Optional
 
 import mem0
 from mem0.memory.setup import get_or_create_user_id
@@ -20,21 +21,29 @@ if not isinstance(MEM0_TELEMETRY, bool):
 
 logging.getLogger("posthog").setLevel(logging.CRITICAL + 1)
 logging.getLogger("urllib3").setLevel(logging.CRITICAL + 1)
+logger = logging.getLogger(__name__)
 
+_posthog = None
+_posthog_lock = threading.Lock()
+_platform_properties = None
 
-class AnonymousTelemetry:
-    def __init__(self, vector_store=None):
-        self.posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
 
-        self.user_id = get_or_create_user_id(vector_store)
+def _get_posthog():
+    """Return the Posthog client shared by every telemetry instance of the process."""
+    global _posthog
+    with _posthog_lock:
+        if _posthog is None:
+            from posthog import Posthog
 
-        if not MEM0_TELEMETRY:
-            self.posthog.disabled = True
+            _posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
+        return _posthog
 
-    def capture_event(self, event_name, properties=None, user_email=None):
-        if properties is None:
-            properties = {}
-        properties = {
+
+def _get_platform_properties():
+    # platform.processor() may spawn a subprocess, so these are computed once per process.
+    global _platform_properties
+    if _platform_properties is None:
+        _platform_properties = {
             "client_source": "python",
             "client_version": mem0.__version__,
             "python_version": sys.version,
@@ -43,24 +52,97 @@ class AnonymousTelemetry:
             "os_release": platform.release(),
             "processor": platform.processor(),
             "machine": platform.machine(),
-            **properties,
         }
+    return _platform_properties
+
+
+class AnonymousTelemetry:
+    """
+    Sends anonymous usage events from a background thread.
+
+    `capture_event` only puts the event on a queue bounded by `max_queue_size`; events are dropped
+    when the queue is full. The sender thread is started on the first event and resolves the user id,
+    which may need a round trip to `vector_store`, once for the lifetime of the instance. Instead of a
+    store, a `vector_store_factory` can be given; it is then only called by the sender thread.
+    """
+
+    def __init__(
+        self,
+        vector_store=None,
+        max_queue_size: int = 1000,
+        vector_store_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.vector_store = vector_store
+        self.vector_store_factory = vector_store_factory
+        self.enabled = MEM0_TELEMETRY
+        self.dropped = 0
+        self._user_id = None
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._sender = None
+        self._sender_lock = threading.Lock()
+
+    @property
+    def user_id(self):
+        if self._user_id is None:
+            if self.vector_store is None and self.vector_store_factory is not None:
+                try:
+                    self.vector_store = self.vector_store_factory()
+                except Exception as e:
+                    logger.debug(f"Failed to create the telemetry vector store: {e}")
+            self._user_id = get_or_create_user_id(self.vector_store)
+        return self._user_id
+
+    def capture_event(self, event_name, properties=None, user_email=None):
+        if not self.enabled:
+            return
+        if self._sender is None:
+            self._start_sender()
+        try:
+            self._queue.put_nowait((event_name, properties, user_email))
+        except queue.Full:
+            self.dropped += 1
+
+    def _start_sender(self):
+        with self._sender_lock:
+            if self._sender is None:
+                self._sender = threading.Thread(target=self._run_sender, name="mem0-telemetry", daemon=True)
+                self._sender.start()
+
+    def _run_sender(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._send(*item)
+            except Exception as e:
+                logger.debug(f"Failed to send telemetry event: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _send(self, event_name, properties, user_email):
+        properties = {**_get_platform_properties(), **(properties or {})}
         distinct_id = self.user_id if user_email is None else user_email
-        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
+        _get_posthog().capture(distinct_id=distinct_id, event=event_name, properties=properties)
 
     def close(self):
-        self.posthog.shutdown()
+        """Send the queued events and stop the sender thread."""
+        with self._sender_lock:
+            sender, self._sender = self._sender, None
+        if sender is not None:
+            self._queue.put(None)
+            sender.join()
+        if _posthog is not None:
+            _posthog.flush()
 
 
 client_telemetry = AnonymousTelemetry()
 
 
 def capture_event(event_name, memory_instance, additional_data=None):
-    oss_telemetry = AnonymousTelemetry(
-        vector_store=memory_instance._telemetry_vector_store
-        if hasattr(memory_instance, "_telemetry_vector_store")
-        else None,
-    )
+    oss_telemetry = getattr(memory_instance, "telemetry", None) or client_telemetry
+    if not oss_telemetry.enabled:
+        return
 
     event_data = {
         "collection": memory_instance.collection_name,
@@ -81,6 +163,9 @@ def capture_event(event_name, memory_instance, additional_data=None):
 
 
 def capture_client_event(event_name, instance, additional_data=None):
+    if not client_telemetry.enabled:
+        return
+
     event_data = {
         "function": f"{instance.__class__.__module__}.{instance.__class__.__name__}",
     }
@@ -0,0 +1,192 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCacheStore:
+    """
+    Persistent tier of a cache, backed by a SQLite table.
+
+    Values are stored already serialized, together with the time they were stored so expired entries
+    can be told apart after a restart. A cache file can be shared by several processes.
+    """
+
+    def __init__(self, db_path: str, table: str):
+        self.db_path = db_path
+        self.table = table
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            columns = {row[1] for row in self.connection.execute(f"PRAGMA table_info({self.table})")}
+            if columns and not {"key", "value", "created_at"} <= columns:
+                # Written by an older cache layout; its entries are only a cache, so start over.
+                logger.info(f"Dropping cache table {self.table} with an outdated layout.")
+                self.connection.execute(f"DROP TABLE {self.table}")
+            self.connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    key        TEXT PRIMARY KEY,
+                    value      TEXT,
+                    created_at REAL
+                )
+                """
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[str, float]]:
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        return {key: (value, created_at) for key, value, created_at in rows}
+
+    def set_many(self, rows: Iterable[Tuple[str, str, float]]) -> None:
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)", rows
+            )
+
+    def delete_many(self, keys: List[str]) -> None:
+        if not keys:
+            return
+        with self._lock, self.connection:
+            self.connection.executemany(f"DELETE FROM {self.table} WHERE key = ?", [(key,) for key in keys])
+
+    def clear(self) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+
+class TieredCache:
+    """
+    Size-bounded in-process LRU cache with an optional SQLite tier behind it.
+
+    Lookups go to the LRU first, then to the persistent tier, whose hits are promoted into the LRU.
+    With a `ttl`, entries older than `ttl` seconds are treated as misses and dropped. Values are kept
+    as they are in memory and stored through `serialize`/`deserialize` (JSON by default) in the
+    persistent tier. With a persistent tier, values `serialize` rejects are not cached at all, so both
+    tiers hold the same entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        path: Optional[str] = None,
+        table: str = "cache",
+        ttl: Optional[float] = None,
+        serialize: Callable[[Any], str] = json.dumps,
+        deserialize: Callable[[str], Any] = json.loads,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.store = SQLiteCacheStore(path, table) if path else None
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _remember(self, key: str, value, created_at: float) -> None:
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the cached values of `keys` that are present and not expired."""
+        found, expired = {}, set()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if self._is_expired(entry[1]):
+                    del self._entries[key]
+                    expired.add(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry[0]
+            self._hits += len(found)
+
+        if self.store is not None:
+            persisted = self.store.get_many([key for key in keys if key not in found])
+            stale = [key for key, (_, created_at) in persisted.items() if self._is_expired(created_at)]
+            self.store.delete_many(stale)
+            expired.update(stale)
+            with self._lock:
+                for key, (serialized, created_at) in persisted.items():
+                    if key not in expired:
+                        found[key] = self._deserialize(serialized)
+                        self._remember(key, found[key], created_at)
+                        self._persistent_hits += 1
+
+        with self._lock:
+            self._expired += len(expired)
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Cache values computed after a miss, counting each of them as a miss."""
+        created_at = time.time()
+        misses = len(items)
+        rows = []
+        if self.store is not None:
+            for key, value in items.items():
+                try:
+                    rows.append((key, self._serialize(value), created_at))
+                except (TypeError, ValueError):
+                    logger.debug("Value is not serializable; not caching it.")
+            items = {key: items[key] for key, _, _ in rows}
+        with self._lock:
+            self._misses += misses
+            for key, value in items.items():
+                self._remember(key, value, created_at)
+        if rows:
+            self.store.set_many(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/expiry counters and the number of entries held in memory."""
+        with self._lock:
+            lookups = self._hits + self._persistent_hits + self._misses
+            return {
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "hit_rate": (self._hits + self._persistent_hits) / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry, including the persistent tier, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._persistent_hits = self._misses = self._expired = 0
+        if self.store is not None:
+            self.store.clear()
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
@@ -3,7 +3,9 @@ from typing import Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.embeddings.cache import CachedEmbedding
 from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.cache import CachedLLM
 
 
 def load_class(class_type):
@@ -33,12 +35,17 @@ class LlmFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, cache_config=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             llm_instance = load_class(class_type)
             base_config = BaseLlmConfig(**config)
-            return llm_instance(base_config)
+            llm = llm_instance(base_config)
+            if cache_config and cache_config.enabled:
+                llm = CachedLLM(
+                    llm, provider_name, max_size=cache_config.max_size, ttl=cache_config.ttl, path=cache_config.path
+                )
+            return llm
         else:
             raise ValueError(f"Unsupported Llm provider: {provider_name}")
 
@@ -58,14 +65,19 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config, vector_config: Optional[dict]):
+    def create(cls, provider_name, config, vector_config: Optional[dict], cache_config=None):
         if provider_name == "upstash_vector" and vector_config and vector_config.enable_embeddings:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if cache_config and cache_config.enabled:
+                embedder = CachedEmbedding(
+                    embedder, provider_name, max_size=cache_config.max_size, path=cache_config.path
+                )
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -74,6 +86,7 @@ class VectorStoreFactory:
     provider_to_class = {
         "milvus": "mem0.vector_stores.milvus.MilvusDB",
         "opensearch": "mem0.vector_stores.opensearch.OpenSearchDB",
+        "faiss": "mem0.vector_stores.faiss.FAISS",
     }
 
     @classmethod
@@ -1,6 +1,15 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
+class BulkWriteError(Exception):
+    """Raised when a store rejects part of a bulk write. The other vectors of the request were written."""
+
+    def __init__(self, message, failed_ids):
+        super().__init__(message)
+        self.failed_ids = list(failed_ids)
+
+
 class VectorStoreBase(ABC):
     @abstractmethod
     def create_col(self, name, vector_size, distance):
@@ -17,6 +26,25 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_many(self, queries, vectors, limit=5, filters=None):
+        """Search for similar vectors for several queries at once.
+
+        Returns one list of results per query, in the same order as `queries`. Stores that
+        support batched queries should override this to issue a single request.
+        """
+        return [
+            self.search(query=query, vectors=query_vectors, limit=limit, filters=filters)
+            for query, query_vectors in zip(queries, vectors)
+        ]
+
+    def keyword_search(self, query, limit=5, filters=None):
+        """Lexical search over the memory text (`payload["data"]`), used by hybrid search.
+
+        Returns up to `limit` results ordered best first. Stores without full-text search keep
+        this default, which raises `NotImplementedError`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support keyword search")
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
@@ -27,6 +55,16 @@ class VectorStoreBase(ABC):
         """Update a vector and its payload."""
         pass
 
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """Update several vectors and their payloads.
+
+        Stores that support bulk upserts should override this to issue a single request.
+        """
+        vectors = vectors if vectors is not None else [None] * len(vector_ids)
+        payloads = payloads if payloads is not None else [None] * len(vector_ids)
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            self.update(vector_id=vector_id, vector=vector, payload=payload)
+
     @abstractmethod
     def get(self, vector_id):
         """Retrieve a vector by ID."""
@@ -56,3 +94,56 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    # Async variants. Stores with an async client should override them; the defaults run the
+    # synchronous method in a worker thread.
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Async version of `insert`."""
+        return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        """Async version of `search`."""
+        return await asyncio.to_thread(self.search, query=query, vectors=vectors, limit=limit, filters=filters)
+
+    async def asearch_many(self, queries, vectors, limit=5, filters=None):
+        """Async version of `search_many`."""
+        return await asyncio.to_thread(self.search_many, queries=queries, vectors=vectors, limit=limit, filters=filters)
+
+    async def akeyword_search(self, query, limit=5, filters=None):
+        """Async version of `keyword_search`."""
+        return await asyncio.to_thread(self.keyword_search, query=query, limit=limit, filters=filters)
+
+    async def adelete(self, vector_id):
+        """Async version of `delete`."""
+        return await asyncio.to_thread(self.delete, vector_id=vector_id)
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Async version of `update`."""
+        return await asyncio.to_thread(self.update, vector_id=vector_id, vector=vector, payload=payload)
+
+    async def aupdate_many(self, vector_ids, vectors=None, payloads=None):
+        """Async version of `update_many`."""
+        return await asyncio.to_thread(self.update_many, vector_ids=vector_ids, vectors=vectors, payloads=payloads)
+
+    async def aget(self, vector_id):
+        """Async version of `get`."""
+        return await asyncio.to_thread(self.get, vector_id=vector_id)
+
+    async def alist_pages(self, filters=None, page_size=100, limit=None):
+        """Yield the records matched by `list` in pages of at most `page_size`.
+
+        Stores with cursor-based listing should override this to fetch one page per request; the
+        default lists everything with `alist` and splits the result.
+        """
+        memories = await self.alist(filters=filters, limit=limit)
+        if memories and isinstance(memories[0], (tuple, list)):
+            memories = memories[0]
+        for start in range(0, len(memories), page_size):
+            yield memories[start : start + page_size]
+
+    async def alist(self, filters=None, limit=None):
+        """Async version of `list`. `limit` is only forwarded when given, so the store's own default applies."""
+        if limit is None:
+            return await asyncio.to_thread(self.list, filters=filters)
+        return await asyncio.to_thread(self.list, filters=filters, limit=limit)
@@ -1,7 +1,18 @@
+import copy
+import functools
+import glob
 import logging
+import math
 import os
 import pickle
+import shutil
+import sqlite3
+import struct
+import threading
+import time
 import uuid
+import zlib
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -21,9 +32,141 @@ except ImportError:
     )
 
 from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.lexical import BM25Index
 
 logger = logging.getLogger(__name__)
 
+# Payload keys indexed for pre-filtered search; memories are almost always filtered on these.
+_FILTER_INDEX_KEYS = ("user_id", "agent_id", "run_id")
+
+# Filtered searches matching at most this many vectors rank the matches exactly instead of
+# searching the index with an ID selector.
+_SLICE_SCAN_MAX_SIZE = 10_000
+
+INDEX_TYPES = ("flat", "hnsw", "ivf_flat", "ivf_pq", "auto")
+
+# Minimum training points per IVF list (and per PQ centroid) recommended by FAISS.
+_MIN_POINTS_PER_CENTROID = 39
+
+# HNSW graphs cannot drop vectors; the index is rebuilt once deleted vectors exceed this share of it.
+_MAX_HNSW_TOMBSTONE_RATIO = 0.25
+
+
+def _synchronized(method):
+    """Serialize calls to a FAISS method; the index, docstore and files are not safe to share between threads."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _fsync_path(path: str):
+    """Flush a file, or the entries of a directory, to disk."""
+    if os.path.isdir(path) and not hasattr(os, "O_DIRECTORY"):
+        return  # Directories cannot be opened, nor need syncing, on Windows.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _WriteLog:
+    """
+    Append-only log of FAISS mutations.
+
+    Each record holds the operations of one write call, framed by its length and CRC32, and is
+    fsynced before the call returns. A torn record at the tail, left by a crash mid-write, ends the
+    replay.
+    """
+
+    _HEADER = struct.Struct("<II")
+
+    def __init__(self, path: str):
+        self.path = path
+        created = not os.path.exists(path)
+        self._file = open(path, "ab")
+        self.size = self._file.tell()
+        if created:
+            # Records fsynced to the file are lost with it if its directory entry is not on disk.
+            _fsync_path(os.path.dirname(path) or ".")
+
+    def append(self, operations: list):
+        data = pickle.dumps(operations, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(self._HEADER.pack(len(data), zlib.crc32(data)) + data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.size = self._file.tell()
+
+    def truncate(self):
+        self._file.truncate(0)
+        os.fsync(self._file.fileno())
+        self.size = 0
+
+    def close(self):
+        self._file.close()
+
+    @classmethod
+    def read(cls, path: str):
+        """Return the records of the log at `path` and the length of its valid prefix."""
+        records, valid_length = [], 0
+        if not os.path.exists(path):
+            return records, valid_length
+
+        with open(path, "rb") as f:
+            while True:
+                header = f.read(cls._HEADER.size)
+                if len(header) < cls._HEADER.size:
+                    break
+                length, checksum = cls._HEADER.unpack(header)
+                data = f.read(length)
+                if len(data) < length or zlib.crc32(data) != checksum:
+                    logger.warning(f"Ignoring incomplete record at offset {valid_length} of {path}")
+                    break
+                records.append(pickle.loads(data))
+                valid_length = f.tell()
+        return records, valid_length
+
+
+class _SnapshotColumn(Mapping):
+    """
+    Read-only mapping between two columns of a snapshot database, queried on access instead of loaded
+    up front. Rows where either column is NULL are not part of the mapping.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, key_column: str, value_column: str, length: int, decode=None):
+        self._connection = connection
+        where = f"{key_column} IS NOT NULL AND {value_column} IS NOT NULL"
+        self._get_sql = f"SELECT {value_column} FROM docstore WHERE {key_column} = ? AND {value_column} IS NOT NULL"
+        self._keys_sql = f"SELECT {key_column} FROM docstore WHERE {where}"
+        self._items_sql = f"SELECT {key_column}, {value_column} FROM docstore WHERE {where}"
+        self._length = length
+        self._decode = decode
+
+    def __getitem__(self, key):
+        row = self._connection.execute(self._get_sql, (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._decode(row[0]) if self._decode else row[0]
+
+    def __contains__(self, key) -> bool:
+        return self._connection.execute(self._get_sql, (key,)).fetchone() is not None
+
+    def __iter__(self):
+        return (key for (key,) in self._connection.execute(self._keys_sql))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def items(self):
+        rows = self._connection.execute(self._items_sql)
+        if self._decode is None:
+            return iter(rows)
+        return ((key, self._decode(value)) for key, value in rows)
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -39,6 +182,19 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        write_log: bool = False,
+        checkpoint_bytes: int = 64 * 1024 * 1024,
+        checkpoint_interval: float = 300.0,
+        index_type: str = "flat",
+        hnsw_m: int = 32,
+        hnsw_ef_construction: int = 40,
+        hnsw_ef_search: int = 64,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        pq_m: int = 16,
+        pq_nbits: int = 8,
+        upgrade_threshold: int = 100_000,
+        mmap: bool = False,
     ):
         """
         Initialize the FAISS vector store.
@@ -50,65 +206,586 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            write_log (bool, optional): Persist mutations to an append-only log instead of rewriting the index and
+                docstore on every write. Defaults to False.
+            checkpoint_bytes (int, optional): Log size that triggers a background checkpoint. Defaults to 64 MiB.
+            checkpoint_interval (float, optional): Seconds after which a non-empty log is checkpointed.
+                Defaults to 300.
+            index_type (str, optional): Index to search with. Options: 'flat' (exact), 'hnsw', 'ivf_flat', 'ivf_pq',
+                or 'auto', which starts flat and moves to IVF-Flat at `upgrade_threshold` vectors. IVF indexes
+                need training data, so collections stay flat until they hold enough vectors. Defaults to "flat".
+            hnsw_m (int, optional): Neighbors per HNSW node. Defaults to 32.
+            hnsw_ef_construction (int, optional): HNSW candidate list size while adding. Defaults to 40.
+            hnsw_ef_search (int, optional): HNSW candidate list size while searching. Defaults to 64.
+            nlist (int, optional): Number of IVF lists. Defaults to 4 * sqrt(collection size) at training time.
+            nprobe (int, optional): Number of IVF lists visited per search. Defaults to 16.
+            pq_m (int, optional): Number of PQ sub-quantizers; must divide `embedding_model_dims`. Defaults to 16.
+            pq_nbits (int, optional): Bits per PQ code. Defaults to 8.
+            upgrade_threshold (int, optional): Collection size at which the 'auto' index type moves to IVF.
+                Defaults to 100000.
+            mmap (bool, optional): Memory-map the index and save the docstore as a SQLite file read on demand, so
+                loading takes constant time and processes on one host share pages through the page cache. The
+                first write in a process loads both into memory. Suited to read-mostly collections.
+                Defaults to False.
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Invalid index_type {index_type!r}. Must be one of: {', '.join(INDEX_TYPES)}")
+        if index_type == "ivf_pq" and embedding_model_dims % pq_m:
+            raise ValueError(f"pq_m ({pq_m}) must divide embedding_model_dims ({embedding_model_dims})")
+
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
-
-        # Initialize storage structures
+        self.write_log = write_log
+        self.checkpoint_bytes = checkpoint_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.pq_m = pq_m
+        self.pq_nbits = pq_nbits
+        self.upgrade_threshold = upgrade_threshold
+        self.mmap = mmap
+        self._lock = threading.RLock()
+        self._log = None
+        self._checkpoint_thread = None
+        self._last_checkpoint = time.monotonic()
+        # Generation of the snapshot on disk; each save writes the index to a new file.
+        self._generation = 0
+
+        # Initialize storage structures. The index maps int64 internal ids to vectors; `index_to_id` and
+        # `id_to_index` translate between those and memory ids.
         self.index = None
         self.docstore = {}
         self.index_to_id = {}
+        self.id_to_index = {}
+        self._next_index_id = 0
+        # BM25 index over payload["data"], built on the first keyword search and kept in sync afterwards.
+        self._lexical_index = None
+        # Memory ids by value of each of _FILTER_INDEX_KEYS, built on the first filtered search.
+        self._filter_index = None
+        # With `mmap`, whether the index is memory-mapped, and the read-only database backing the
+        # docstore and id maps, until the first write.
+        self._mapped = False
+        self._snapshot_db = None
 
         # Create directory if it doesn't exist
         if self.path:
             os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
             # Try to load existing index if available
-            index_path = f"{self.path}/{collection_name}.faiss"
-            docstore_path = f"{self.path}/{collection_name}.pkl"
-            if os.path.exists(index_path) and os.path.exists(docstore_path):
-                self._load(index_path, docstore_path)
+            docstore_path = self._find_docstore_path()
+            if docstore_path is not None:
+                self._load(docstore_path)
+                if self.write_log and self.index is not None:
+                    self._log = _WriteLog(self._log_path)
             else:
                 self.create_col(collection_name)
 
-    def _load(self, index_path: str, docstore_path: str):
+    def _index_path(self, generation: int) -> str:
+        if generation == 0:
+            # Snapshots saved before generations were introduced.
+            return f"{self.path}/{self.collection_name}.faiss"
+        return f"{self.path}/{self.collection_name}.{generation}.faiss"
+
+    def _docstore_paths(self):
+        """Return the docstore paths of the format written by this store and of the other format."""
+        pickle_path = f"{self.path}/{self.collection_name}.pkl"
+        db_path = f"{self.path}/{self.collection_name}.docstore.db"
+        return (db_path, pickle_path) if self.mmap else (pickle_path, db_path)
+
+    def _find_docstore_path(self) -> Optional[str]:
+        # After a crash while switching formats both may exist; the one this store writes is the newest.
+        for path in self._docstore_paths():
+            if os.path.exists(path):
+                return path
+        return None
+
+    @property
+    def _log_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.log"
+
+    @property
+    def _checkpoint_log_path(self) -> str:
+        # Log segment being folded into the snapshot by a running (or interrupted) checkpoint.
+        return f"{self.path}/{self.collection_name}.log.checkpoint"
+
+    def _load(self, docstore_path: str):
         """
         Load FAISS index and docstore from disk.
 
         Args:
-            index_path (str): Path to FAISS index file.
-            docstore_path (str): Path to docstore pickle file.
+            docstore_path (str): Path to docstore pickle file, or SQLite file when saved with `mmap`.
         """
         try:
-            self.index = faiss.read_index(index_path)
-            with open(docstore_path, "rb") as f:
-                self.docstore, self.index_to_id = pickle.load(f)
-            logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
+            self._read_snapshot(docstore_path, mapped=self.mmap)
+            if not self.mmap:
+                self._materialize()
+            self._replay_write_log()
+            self._maybe_upgrade_index()
+            logger.info(f"Loaded FAISS index {self.collection_name} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
 
             self.docstore = {}
             self.index_to_id = {}
+            self.id_to_index = {}
+            self._next_index_id = 0
+
+    def _read_snapshot(self, docstore_path: str, mapped: bool):
+        """
+        Read the snapshot whose docstore is at `docstore_path`, together with the index generation it
+        names. With `mapped`, the index is memory-mapped and a SQLite docstore is read on demand.
+        """
+        self._lexical_index = None
+        self._filter_index = None
+        if docstore_path.endswith(".db"):
+            self._open_snapshot_db(docstore_path)
+        else:
+            with open(docstore_path, "rb") as f:
+                snapshot = pickle.load(f)
+            self.docstore, self.index_to_id = snapshot[0], snapshot[1]
+            self._generation = snapshot[2] if len(snapshot) > 2 else 0
+            self.id_to_index = {vector_id: index_id for index_id, vector_id in self.index_to_id.items()}
+            self._next_index_id = max(self.index_to_id, default=-1) + 1
+
+        index_path = self._index_path(self._generation)
+        if mapped:
+            # Pages of the file back the vectors and are shared with other processes mapping it.
+            self.index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY)
+            self._mapped = True
+        else:
+            self.index = faiss.read_index(index_path)
+            self._mapped = False
+        # IVF indexes store their ids themselves; only bare flat indexes are positional.
+        if not isinstance(self.index, (faiss.IndexIDMap2, faiss.IndexIVF)):
+            self._migrate_positional_index()
+        self._configure_search()
+
+    def _open_snapshot_db(self, path: str):
+        """Serve the docstore and id maps from a snapshot database without loading them."""
+        self._snapshot_db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._snapshot_db.execute("PRAGMA mmap_size = 1099511627776")
+        meta = dict(self._snapshot_db.execute("SELECT key, value FROM meta"))
+        self.docstore = _SnapshotColumn(self._snapshot_db, "id", "payload", meta["payloads"], decode=pickle.loads)
+        self.index_to_id = _SnapshotColumn(self._snapshot_db, "index_id", "id", meta["vectors"])
+        self.id_to_index = _SnapshotColumn(self._snapshot_db, "id", "index_id", meta["vectors"])
+        self._next_index_id = meta["next_index_id"]
+        self._generation = meta.get("generation", 0)
+
+    def _materialize(self):
+        """Load a memory-mapped index and the snapshot database into memory before they are modified."""
+        if self._mapped:
+            # Mapped vectors cannot be resized; FAISS aborts the process on any attempt.
+            self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+            self._mapped = False
+            self._configure_search()
+        if self._snapshot_db is not None:
+            self.docstore = dict(self.docstore.items())
+            self.index_to_id = dict(self.index_to_id.items())
+            self.id_to_index = dict(self.id_to_index.items())
+            self._close_snapshot_db()
+
+    def _close_snapshot_db(self):
+        if self._snapshot_db is not None:
+            self._snapshot_db.close()
+            self._snapshot_db = None
+
+    def _replay_write_log(self):
+        """Apply the mutations logged since the last checkpoint on top of the loaded snapshot."""
+        replayed = 0
+        for path in (self._checkpoint_log_path, self._log_path):
+            records, valid_length = _WriteLog.read(path)
+            for operations in records:
+                self._apply_operations(operations)
+            replayed += len(records)
+            if os.path.exists(path) and valid_length < os.path.getsize(path):
+                with open(path, "r+b") as f:
+                    f.truncate(valid_length)
+
+        if replayed:
+            logger.info(f"Replayed {replayed} logged writes on FAISS index {self.collection_name}")
+            if not self.write_log:
+                # The log is no longer written to; fold it into the snapshot.
+                self._save()
+
+    def _apply_operations(self, operations: list):
+        for operation, vector_ids, values in operations:
+            if operation == "add":
+                self._add_vectors(values, vector_ids)
+            elif operation == "put":
+                for vector_id, payload in zip(vector_ids, values):
+                    self._set_payload(vector_id, payload)
+            elif operation == "remove":
+                self._remove_vectors(vector_ids)
+                for vector_id in vector_ids:
+                    self._pop_payload(vector_id)
+
+    def _set_payload(self, vector_id: str, payload: Dict):
+        """Store a payload, keeping the lexical and filter indexes in sync."""
+        self._materialize()
+        self._unindex_filter_values(vector_id, self.docstore.get(vector_id))
+        self.docstore[vector_id] = payload
+        if self._lexical_index is not None:
+            self._lexical_index.add(vector_id, payload.get("data"))
+        self._index_filter_values(vector_id, payload)
+
+    def _pop_payload(self, vector_id: str):
+        self._materialize()
+        payload = self.docstore.pop(vector_id, None)
+        if self._lexical_index is not None:
+            self._lexical_index.remove(vector_id)
+        self._unindex_filter_values(vector_id, payload)
+
+    def _index_filter_values(self, vector_id: str, payload: Optional[Dict]):
+        if self._filter_index is None or not payload:
+            return
+        for key in _FILTER_INDEX_KEYS:
+            value = payload.get(key)
+            if isinstance(value, (str, int)):
+                self._filter_index[key].setdefault(value, set()).add(vector_id)
+
+    def _unindex_filter_values(self, vector_id: str, payload: Optional[Dict]):
+        if self._filter_index is None or not payload:
+            return
+        for key in _FILTER_INDEX_KEYS:
+            value = payload.get(key)
+            vector_ids = self._filter_index[key].get(value) if isinstance(value, (str, int)) else None
+            if vector_ids is not None:
+                vector_ids.discard(vector_id)
+                if not vector_ids:
+                    del self._filter_index[key][value]
+
+    def _migrate_positional_index(self):
+        """
+        Convert an index saved by earlier versions, addressed by insertion position and still holding
+        the vectors of deleted memories, into an ID-mapped index holding only the live vectors.
+        """
+        positions = np.array(sorted(self.index_to_id), dtype=np.int64)
+        vectors = [self.index.reconstruct(int(position)) for position in positions]
+        self.index = self._new_index(self.distance_strategy)
+        self._mapped = False
+        if vectors:
+            self.index.add_with_ids(np.vstack(vectors).astype(np.float32), positions)
+        logger.info(f"Migrated FAISS index {self.collection_name} to an ID-mapped index")
+
+    def _new_index(self, distance_strategy: str, index_type: str = "flat", training_vectors: np.ndarray = None):
+        """
+        Create an empty index. Flat and HNSW indexes are wrapped in an `IndexIDMap2`; IVF indexes store
+        the ids themselves and are trained on `training_vectors`.
+        """
+        inner_product = distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine"
+        metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.embedding_model_dims, self.hnsw_m, metric)
+            index.hnsw.efConstruction = self.hnsw_ef_construction
+            index.hnsw.efSearch = self.hnsw_ef_search
+            return faiss.IndexIDMap2(index)
+
+        if index_type in ("ivf_flat", "ivf_pq"):
+            nlist = self._ivf_nlist(len(training_vectors))
+            quantizer = faiss.IndexFlatIP(self.embedding_model_dims) if inner_product else faiss.IndexFlatL2(
+                self.embedding_model_dims
+            )
+            if index_type == "ivf_pq":
+                index = faiss.IndexIVFPQ(quantizer, self.embedding_model_dims, nlist, self.pq_m, self.pq_nbits, metric)
+            else:
+                index = faiss.IndexIVFFlat(quantizer, self.embedding_model_dims, nlist, metric)
+            index.train(training_vectors)
+            # Lets deleted and updated vectors be removed, and vectors be reconstructed, by id.
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+            index.nprobe = self.nprobe
+            return index
+
+        if inner_product:
+            return faiss.IndexIDMap2(faiss.IndexFlatIP(self.embedding_model_dims))
+        return faiss.IndexIDMap2(faiss.IndexFlatL2(self.embedding_model_dims))
+
+    def _index_kind(self) -> str:
+        """Return "flat", "hnsw" or "ivf" for the current index."""
+        if isinstance(self.index, faiss.IndexIVF):
+            return "ivf"
+        if isinstance(self.index, faiss.IndexIDMap2):
+            if isinstance(faiss.downcast_index(self.index.index), faiss.IndexHNSW):
+                return "hnsw"
+        return "flat"
+
+    def _configure_search(self):
+        # Search-time settings are not all persisted with the index; apply the configured ones.
+        kind = self._index_kind()
+        if kind == "ivf":
+            self.index.nprobe = self.nprobe
+        elif kind == "hnsw":
+            faiss.downcast_index(self.index.index).hnsw.efSearch = self.hnsw_ef_search
+
+    def _search_parameters(self, selector, coverage: float = 0.0) -> faiss.SearchParameters:
+        """
+        Search parameters restricting the search to `selector`, if given. `coverage` is the share of the
+        searchable vectors the search should reach; nprobe and efSearch are raised to visit about twice
+        that share of the index, so a coverage of 1 scans all of it.
+        """
+        kind = self._index_kind()
+        if kind == "ivf":
+            nprobe = min(self.index.nlist, max(self.nprobe, math.ceil(2 * coverage * self.index.nlist)))
+            return faiss.SearchParametersIVF(sel=selector, nprobe=nprobe)
+        if kind == "hnsw":
+            ef_search = max(self.hnsw_ef_search, min(self.index.ntotal, math.ceil(2 * coverage * self.index.ntotal)))
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search)
+        return faiss.SearchParameters(sel=selector)
+
+    def _ivf_nlist(self, size: int) -> int:
+        return self.nlist or max(1, int(4 * size**0.5))
+
+    def _maybe_upgrade_index(self):
+        """Move a flat index to the configured index type once the collection is large enough for it."""
+        if self.index_type == "flat" or self.index is None or self._index_kind() != "flat":
+            return
+
+        size = len(self.index_to_id)
+        if self.index_type == "hnsw":
+            self._rebuild_index("hnsw")
+            return
+
+        target = "ivf_flat" if self.index_type == "auto" else self.index_type
+        min_training_size = _MIN_POINTS_PER_CENTROID * self._ivf_nlist(size)
+        if target == "ivf_pq":
+            min_training_size = max(min_training_size, _MIN_POINTS_PER_CENTROID * 2**self.pq_nbits)
+        if size >= min_training_size and (self.index_type != "auto" or size >= self.upgrade_threshold):
+            self._rebuild_index(target)
+
+    def _rebuild_index(self, index_type: str):
+        """Rebuild the index as `index_type` from its live vectors, keeping their internal ids."""
+        start = time.perf_counter()
+        index_ids = np.array(sorted(self.index_to_id), dtype=np.int64)
+        if len(index_ids):
+            vectors = self.index.reconstruct_batch(index_ids)
+        else:
+            vectors = np.empty((0, self.embedding_model_dims), dtype=np.float32)
+        inner_product = self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+        index = self._new_index("inner_product" if inner_product else "euclidean", index_type, vectors)
+        if len(index_ids):
+            index.add_with_ids(vectors, index_ids)
+        self.index = index
+        self._mapped = False
+        logger.info(
+            f"Rebuilt FAISS index {self.collection_name} as {index_type} with {len(index_ids)} vectors "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+    def _add_vectors(self, vectors_np: np.ndarray, vector_ids: List[str]):
+        """Add vectors under the given memory ids, replacing the vectors they already have."""
+        self._materialize()
+        self._remove_vectors([vector_id for vector_id in vector_ids if vector_id in self.id_to_index])
+        index_ids = np.arange(self._next_index_id, self._next_index_id + len(vector_ids), dtype=np.int64)
+        self._next_index_id += len(vector_ids)
+        self.index.add_with_ids(vectors_np, index_ids)
+        for index_id, vector_id in zip(index_ids.tolist(), vector_ids):
+            self.index_to_id[index_id] = vector_id
+            self.id_to_index[vector_id] = index_id
+        self._maybe_upgrade_index()
+
+    def _remove_vectors(self, vector_ids: List[str]):
+        """Remove the vectors of the given memory ids from the index."""
+        self._materialize()
+        index_ids = [self.id_to_index.pop(vector_id) for vector_id in vector_ids if vector_id in self.id_to_index]
+        if not index_ids:
+            return
+
+        for index_id in index_ids:
+            self.index_to_id.pop(index_id, None)
+        if self._index_kind() != "hnsw":
+            self.index.remove_ids(np.array(index_ids, dtype=np.int64))
+        elif self.index.ntotal - len(self.index_to_id) > _MAX_HNSW_TOMBSTONE_RATIO * self.index.ntotal:
+            # Deleted HNSW vectors stay in the graph and are skipped when parsing results.
+            self._rebuild_index("hnsw")
 
     def _save(self):
         """Save FAISS index and docstore to disk."""
         if not self.path or not self.index:
             return
 
+        self._wait_for_checkpoint()
+        self._materialize()
         try:
-            os.makedirs(self.path, exist_ok=True)
-            index_path = f"{self.path}/{self.collection_name}.faiss"
-            docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-            faiss.write_index(self.index, index_path)
-            with open(docstore_path, "wb") as f:
-                pickle.dump((self.docstore, self.index_to_id), f)
+            self._write_snapshot()
+            self._remove_write_log_files()
         except Exception as e:
             logger.warning(f"Failed to save FAISS index: {e}")
 
+    def _write_snapshot(self):
+        """
+        Write the index and docstore to disk as the next snapshot generation.
+
+        The index is written to a file of its own generation, then the docstore, which names that
+        generation. Replacing the docstore file is the single atomic switch between snapshots: a crash
+        at any point leaves either the previous snapshot or the new one. Both files and the directory
+        are fsynced before the switch is relied upon.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        generation = self._generation + 1
+        index_path = self._index_path(generation)
+        docstore_path, stale_path = self._docstore_paths()
+
+        faiss.write_index(self.index, f"{index_path}.tmp")
+        _fsync_path(f"{index_path}.tmp")
+        os.replace(f"{index_path}.tmp", index_path)
+
+        if self.mmap:
+            self._write_snapshot_db(f"{docstore_path}.tmp", self.docstore, self.index_to_id, generation)
+        else:
+            with open(f"{docstore_path}.tmp", "wb") as f:
+                pickle.dump((self.docstore, self.index_to_id, generation), f)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(f"{docstore_path}.tmp", docstore_path)
+        _fsync_path(self.path)
+
+        previous_index_path = self._index_path(self._generation)
+        self._generation = generation
+        for path in (previous_index_path, stale_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _write_snapshot_db(path: str, docstore: Dict, index_to_id: Dict, generation: int):
+        """Write the docstore and id maps as a SQLite file, indexed both by memory id and internal id."""
+        if os.path.exists(path):
+            os.remove(path)
+        id_to_index = {vector_id: index_id for index_id, vector_id in index_to_id.items()}
+        rows = (
+            (
+                vector_id,
+                id_to_index.get(vector_id),
+                pickle.dumps(docstore[vector_id]) if vector_id in docstore else None,
+            )
+            for vector_id in docstore.keys() | id_to_index.keys()
+        )
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute("CREATE TABLE docstore (id TEXT PRIMARY KEY, index_id INTEGER UNIQUE, payload BLOB)")
+                connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+                connection.executemany("INSERT INTO docstore (id, index_id, payload) VALUES (?, ?, ?)", rows)
+                connection.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("payloads", len(docstore)),
+                        ("vectors", len(id_to_index)),
+                        ("next_index_id", max(index_to_id, default=-1) + 1),
+                        ("generation", generation),
+                    ],
+                )
+        finally:
+            connection.close()
+        _fsync_path(path)
+
+    def _remove_write_log_files(self):
+        if self._log is not None:
+            self._log.truncate()
+        elif os.path.exists(self._log_path):
+            os.remove(self._log_path)
+        if os.path.exists(self._checkpoint_log_path):
+            os.remove(self._checkpoint_log_path)
+
+    def _persist(self, operations: list):
+        """
+        Make a write durable: append its operations to the write log, checkpointing when the log
+        grows past its limits, or rewrite the whole snapshot when the log is disabled.
+        """
+        if self._log is None:
+            self._save()
+            return
+
+        try:
+            self._log.append(operations)
+        except Exception as e:
+            logger.warning(f"Failed to append to the FAISS write log: {e}")
+
+        checkpoint_running = self._checkpoint_thread is not None and self._checkpoint_thread.is_alive()
+        log_expired = self._log.size and time.monotonic() - self._last_checkpoint >= self.checkpoint_interval
+        if not checkpoint_running and (self._log.size >= self.checkpoint_bytes or log_expired):
+            self._start_checkpoint()
+
+    def _start_checkpoint(self):
+        """
+        Move the current log segment aside and fold it into the snapshot in the background.
+
+        Only the rotation happens on the write path. The checkpoint thread reads the previous snapshot
+        from disk, replays the moved segment on it and saves the result, so no copy of the in-memory
+        state is taken. Writes keep appending to a fresh segment meanwhile; the moved segment is deleted
+        once the new snapshot is on disk, and replayed on load if the checkpoint did not complete.
+        """
+        try:
+            self._log.close()
+            if os.path.exists(self._checkpoint_log_path):
+                # An earlier checkpoint did not complete; keep its records ahead of the new ones.
+                with open(self._checkpoint_log_path, "ab") as dst, open(self._log_path, "rb") as src:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self._log_path)
+            else:
+                os.replace(self._log_path, self._checkpoint_log_path)
+        except Exception as e:
+            logger.warning(f"Failed to start FAISS checkpoint: {e}")
+            return
+        finally:
+            self._log = _WriteLog(self._log_path)
+
+        self._last_checkpoint = time.monotonic()
+        self._checkpoint_thread = threading.Thread(
+            target=self._write_checkpoint, args=(self._checkpoint_builder(),), daemon=True
+        )
+        self._checkpoint_thread.start()
+
+    def _checkpoint_builder(self) -> "FAISS":
+        """Return a store with the settings and paths of this one but none of its state."""
+        builder = copy.copy(self)
+        builder._lock = threading.RLock()
+        builder._log = None
+        builder._checkpoint_thread = None
+        builder._snapshot_db = None
+        builder._mapped = False
+        builder.index = None
+        builder.docstore = {}
+        builder.index_to_id = {}
+        builder.id_to_index = {}
+        builder._lexical_index = None
+        builder._filter_index = None
+        return builder
+
+    def _write_checkpoint(self, builder: "FAISS"):
+        try:
+            builder._read_snapshot(builder._find_docstore_path(), mapped=False)
+            builder._materialize()
+            records, _ = _WriteLog.read(self._checkpoint_log_path)
+            for operations in records:
+                builder._apply_operations(operations)
+            builder._maybe_upgrade_index()
+            builder._write_snapshot()
+            os.remove(self._checkpoint_log_path)
+            _fsync_path(self.path)
+            # Read by the store only after joining this thread.
+            self._generation = builder._generation
+            logger.info(f"Checkpointed FAISS index {self.collection_name} with {builder.index.ntotal} vectors")
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint FAISS index: {e}")
+
+    def _wait_for_checkpoint(self):
+        if self._checkpoint_thread is not None:
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+
+    def _close_write_log(self):
+        self._wait_for_checkpoint()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
         Parse the output data.
@@ -164,18 +841,25 @@ class FAISS(VectorStoreBase):
         """
         distance_strategy = distance or self.distance_strategy
 
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
+        self._materialize()
+
+        # Create index based on distance strategy. IVF indexes start flat until there is data to train them.
+        self.index = self._new_index(distance_strategy, "hnsw" if self.index_type == "hnsw" else "flat")
+        self.index_to_id = {}
+        self.id_to_index = {}
+        self._next_index_id = 0
 
+        self._close_write_log()
         self.collection_name = name
 
         self._save()
+        if self.write_log:
+            self._log = _WriteLog(self._log_path)
+            self._last_checkpoint = time.monotonic()
 
         return self
 
+    @_synchronized
     def insert(
         self,
         vectors: List[list],
@@ -207,17 +891,18 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
 
-        self.index.add(vectors_np)
+        ids = list(ids)
+        self._add_vectors(vectors_np, ids)
 
-        starting_idx = len(self.index_to_id)
-        for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
-            self.docstore[vector_id] = payload.copy()
-            self.index_to_id[starting_idx + i] = vector_id
+        payloads = [payload.copy() for payload in payloads]
+        for vector_id, payload in zip(ids, payloads):
+            self._set_payload(vector_id, payload)
 
-        self._save()
+        self._persist([("add", ids, vectors_np), ("put", ids, payloads)])
 
         logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
 
+    @_synchronized
     def search(
         self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
     ) -> List[OutputData]:
@@ -244,22 +929,192 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(query_vectors)
 
-        fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        return self._search(query_vectors, limit, filters)[0]
 
-        results = self._parse_output(scores[0], indices[0], limit)
+    @_synchronized
+    def search_many(
+        self, queries: List[str], vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search for similar vectors for several queries with a single batched index search.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors (List[list]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to every search. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Search results, one list per query.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        if len(vectors) == 0:
+            return []
+
+        query_vectors = np.array(vectors, dtype=np.float32).reshape(len(vectors), -1)
+
+        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+            faiss.normalize_L2(query_vectors)
 
-        if filters:
-            filtered_results = []
-            for result in results:
-                if self._apply_filters(result.payload, filters):
-                    filtered_results.append(result)
-                    if len(filtered_results) >= limit:
-                        break
-            results = filtered_results[:limit]
+        return self._search(query_vectors, limit, filters)
+
+    def _search(self, query_vectors: np.ndarray, limit: int, filters: Optional[Dict]) -> List[List[OutputData]]:
+        """
+        Search the index for each query vector, returning up to `limit` results that pass the filters.
+
+        Filters on `user_id`, `agent_id` or `run_id` are resolved first through the filter index. Small
+        slices are ranked exactly; larger ones are searched with an ID selector so that only matching
+        vectors are scored. Filters on other keys are applied afterwards, searching again with a larger
+        `k` until enough results pass or the candidates are exhausted. Approximate indexes widen their
+        search along with `k`; queries an approximate selector search still leaves short fall back to
+        ranking the slice exactly.
+        """
+        candidates = self._filter_candidates(filters) if filters else None
+        if candidates is not None and len(candidates) <= _SLICE_SCAN_MAX_SIZE:
+            return self._search_slice(query_vectors, limit, filters, candidates)
+
+        selector = None
+        total = self.index.ntotal
+        if candidates is not None:
+            selector = faiss.IDSelectorBatch(candidates)
+            total = len(candidates)
+        fully_indexed = candidates is not None and all(key in _FILTER_INDEX_KEYS for key in filters)
+        exact = self._index_kind() == "flat"
+
+        def exhausted(query_results, query_indices):
+            # A padded (-1) row means the index found nothing more to return for that query. Approximate
+            # indexes pad once they run out of search budget, which only a full scan rules out.
+            padded = (query_indices == -1).any()
+            return len(query_results) >= limit or (padded and (exact or candidates is not None))
+
+        # Deleted HNSW vectors and filters on other keys can drop results, hence the retries below.
+        fetch_k = limit if not filters or fully_indexed else limit * 2
+        while True:
+            fetch_k = min(fetch_k, total)
+            if fetch_k == 0:
+                return [[] for _ in query_vectors]
+            params = None
+            if selector is not None or not exact:
+                params = self._search_parameters(selector, fetch_k / total)
+            scores, indices = self.index.search(query_vectors, fetch_k, params=params)
+            results = [
+                self._filter_results(self._parse_output(query_scores, query_indices), limit, filters)
+                for query_scores, query_indices in zip(scores, indices)
+            ]
+            if fetch_k >= total or all(map(exhausted, results, indices)):
+                break
+            fetch_k *= 4
 
+        if candidates is not None and not exact:
+            short = [i for i, row in enumerate(results) if len(row) < limit and (indices[i] == -1).any()]
+            if short:
+                for i, row in zip(short, self._search_slice(query_vectors[short], limit, filters, candidates)):
+                    results[i] = row
         return results
 
+    def _filter_candidates(self, filters: Dict) -> Optional[np.ndarray]:
+        """
+        Return the internal ids of the vectors matching the filters on `_FILTER_INDEX_KEYS`, or None
+        when no such key is filtered on.
+        """
+        keys = [key for key in _FILTER_INDEX_KEYS if key in filters]
+        if not keys:
+            return None
+
+        if self._filter_index is None:
+            self._filter_index = {key: {} for key in _FILTER_INDEX_KEYS}
+            for vector_id, payload in self.docstore.items():
+                self._index_filter_values(vector_id, payload)
+
+        matching = None
+        for key in keys:
+            values = filters[key] if isinstance(filters[key], list) else [filters[key]]
+            key_matching = set()
+            for value in values:
+                if isinstance(value, (str, int)):
+                    key_matching |= self._filter_index[key].get(value, set())
+            matching = key_matching if matching is None else matching & key_matching
+            if not matching:
+                break
+
+        return np.fromiter(
+            (self.id_to_index[vector_id] for vector_id in matching if vector_id in self.id_to_index), dtype=np.int64
+        )
+
+    def _search_slice(
+        self, query_vectors: np.ndarray, limit: int, filters: Dict, candidates: np.ndarray
+    ) -> List[List[OutputData]]:
+        """Rank the vectors of a small filtered slice exactly, at a cost proportional to the slice."""
+        candidates = np.array(
+            [
+                index_id
+                for index_id in candidates.tolist()
+                if self._apply_filters(self.docstore.get(self.index_to_id[index_id]), filters)
+            ],
+            dtype=np.int64,
+        )
+        if len(candidates) == 0:
+            return [[] for _ in query_vectors]
+
+        vectors = self.index.reconstruct_batch(candidates)
+        k = min(limit, len(candidates))
+        scores, positions = faiss.knn(query_vectors, vectors, k, metric=self.index.metric_type)
+        return [
+            self._parse_output(query_scores, candidates[query_positions], limit)
+            for query_scores, query_positions in zip(scores, positions)
+        ]
+
+    @_synchronized
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
+        """
+        Search the memory text (`payload["data"]`) with BM25, using a local inverted index.
+
+        The index is built from the docstore on the first call, then updated on every write.
+
+        Args:
+            query (str): Query text.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results, best first, scored with BM25.
+        """
+        if self._lexical_index is None:
+            self._lexical_index = BM25Index()
+            for vector_id, payload in self.docstore.items():
+                self._lexical_index.add(vector_id, payload.get("data"))
+
+        accept = (lambda vector_id: self._apply_filters(self.docstore[vector_id], filters)) if filters else None
+        return [
+            OutputData(id=vector_id, score=score, payload=self.docstore[vector_id].copy())
+            for vector_id, score in self._lexical_index.search(query, limit, accept)
+        ]
+
+    def _filter_results(self, results: List[OutputData], limit: int, filters: Optional[Dict]) -> List[OutputData]:
+        """
+        Keep at most `limit` results whose payload passes the filters.
+
+        Args:
+            results (List[OutputData]): Parsed search results.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict]): Filters to apply.
+
+        Returns:
+            List[OutputData]: Filtered results.
+        """
+        if not filters:
+            return results[:limit]
+
+        filtered_results = []
+        for result in results:
+            if self._apply_filters(result.payload, filters):
+                filtered_results.append(result)
+                if len(filtered_results) >= limit:
+                    break
+        return filtered_results[:limit]
+
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
         Apply filters to a payload.
@@ -286,6 +1141,7 @@ class FAISS(VectorStoreBase):
 
         return True
 
+    @_synchronized
     def delete(self, vector_id: str):
         """
         Delete a vector by ID.
@@ -296,22 +1152,17 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        index_to_delete = None
-        for idx, vid in self.index_to_id.items():
-            if vid == vector_id:
-                index_to_delete = idx
-                break
-
-        if index_to_delete is not None:
-            self.docstore.pop(vector_id, None)
-            self.index_to_id.pop(index_to_delete, None)
+        if vector_id in self.id_to_index:
+            self._remove_vectors([vector_id])
+            self._pop_payload(vector_id)
 
-            self._save()
+            self._persist([("remove", [vector_id], None)])
 
             logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
         else:
             logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
 
+    @_synchronized
     def update(
         self,
         vector_id: str,
@@ -332,20 +1183,74 @@ class FAISS(VectorStoreBase):
         if vector_id not in self.docstore:
             raise ValueError(f"Vector {vector_id} not found")
 
-        current_payload = self.docstore[vector_id].copy()
-
+        operations = []
         if payload is not None:
-            self.docstore[vector_id] = payload.copy()
-            current_payload = self.docstore[vector_id].copy()
+            self._set_payload(vector_id, payload.copy())
+            operations.append(("put", [vector_id], [self.docstore[vector_id]]))
 
         if vector is not None:
-            self.delete(vector_id)
-            self.insert([vector], [current_payload], [vector_id])
-        else:
-            self._save()
+            vectors_np = np.array([vector], dtype=np.float32)
+            if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                faiss.normalize_L2(vectors_np)
+            self._add_vectors(vectors_np, [vector_id])
+            operations.append(("add", [vector_id], vectors_np))
+
+        self._persist(operations)
 
         logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
 
+    @_synchronized
+    def update_many(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[Optional[List[float]]]] = None,
+        payloads: Optional[List[Optional[Dict]]] = None,
+    ):
+        """
+        Update several vectors and their payloads, saving the index only once.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (Optional[List[Optional[List[float]]]], optional): Updated vectors. Defaults to None.
+            payloads (Optional[List[Optional[Dict]]], optional): Updated payloads. Defaults to None.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        vectors = vectors if vectors is not None else [None] * len(vector_ids)
+        payloads = payloads if payloads is not None else [None] * len(vector_ids)
+
+        for vector_id in vector_ids:
+            if vector_id not in self.docstore:
+                raise ValueError(f"Vector {vector_id} not found")
+
+        operations = []
+        replaced_vectors, replaced_ids = [], []
+        replaced_payloads, replaced_payload_ids = [], []
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            if payload is not None:
+                self._set_payload(vector_id, payload.copy())
+                replaced_payloads.append(self.docstore[vector_id])
+                replaced_payload_ids.append(vector_id)
+
+            if vector is not None:
+                replaced_vectors.append(vector)
+                replaced_ids.append(vector_id)
+
+        if replaced_payloads:
+            operations.append(("put", replaced_payload_ids, replaced_payloads))
+        if replaced_vectors:
+            vectors_np = np.array(replaced_vectors, dtype=np.float32)
+            if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                faiss.normalize_L2(vectors_np)
+            self._add_vectors(vectors_np, replaced_ids)
+            operations.append(("add", replaced_ids, vectors_np))
+
+        self._persist(operations)
+
+        logger.info(f"Updated {len(vector_ids)} vectors in collection {self.collection_name}")
+
+    @_synchronized
     def get(self, vector_id: str) -> OutputData:
         """
         Retrieve a vector by ID.
@@ -384,34 +1289,51 @@ class FAISS(VectorStoreBase):
             collections = []
             path = Path(self.path).parent
             for file in path.glob("*.faiss"):
-                collections.append(file.stem)
+                # Drop the snapshot generation from "<name>.<generation>.faiss".
+                name, _, generation = file.stem.rpartition(".")
+                collection = name if name and generation.isdigit() else file.stem
+                if collection not in collections:
+                    collections.append(collection)
             return collections
         except Exception as e:
             logger.warning(f"Failed to list collections: {e}")
             return [self.collection_name] if self.index else []
 
+    @_synchronized
     def delete_col(self):
         """
         Delete a collection.
         """
+        self._close_write_log()
+        self._close_snapshot_db()
         if self.path:
             try:
-                index_path = f"{self.path}/{self.collection_name}.faiss"
-                docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-                if os.path.exists(index_path):
-                    os.remove(index_path)
-                if os.path.exists(docstore_path):
-                    os.remove(docstore_path)
+                # Remove the docstores first: without one, no snapshot is loaded from the index files left.
+                for path in self._docstore_paths():
+                    if os.path.exists(path):
+                        os.remove(path)
+                prefix = f"{self.path}/{self.collection_name}."
+                for path in glob.glob(f"{glob.escape(prefix)}*faiss"):
+                    generation = path[len(prefix) : -len("faiss")].rstrip(".")
+                    if generation == "" or generation.isdigit():
+                        os.remove(path)
+                self._remove_write_log_files()
 
                 logger.info(f"Deleted collection {self.collection_name}")
             except Exception as e:
                 logger.warning(f"Failed to delete collection: {e}")
 
         self.index = None
+        self._mapped = False
         self.docstore = {}
         self.index_to_id = {}
+        self.id_to_index = {}
+        self._next_index_id = 0
+        self._generation = 0
+        self._lexical_index = None
+        self._filter_index = None
 
+    @_synchronized
     def col_info(self) -> Dict:
         """
         Get information about a collection.
@@ -424,11 +1346,13 @@ class FAISS(VectorStoreBase):
 
         return {
             "name": self.collection_name,
-            "count": self.index.ntotal,
+            "count": len(self.index_to_id),
+            "index_type": self._index_kind(),
             "dimension": self.index.d,
             "distance": self.distance_strategy,
         }
 
+    @_synchronized
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
         """
         List all vectors in a collection.
@@ -466,6 +1390,16 @@ class FAISS(VectorStoreBase):
 
         return [results]
 
+    @_synchronized
+    def close(self):
+        """
+        Wait for a running checkpoint, then close the write log and the snapshot database. Logged writes
+        are replayed on the next load.
+        """
+        self._close_write_log()
+        self._close_snapshot_db()
+
+    @_synchronized
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
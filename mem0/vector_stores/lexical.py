@@ -0,0 +1,90 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class BM25Index:
+    """
+    In-memory inverted index scoring documents with Okapi BM25.
+
+    Used by vector stores without native full-text search to provide the lexical half of hybrid
+    search. Documents are keyed by memory id; adding an existing id replaces its text.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_tokens: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: str, text: Optional[str]) -> None:
+        self.remove(doc_id)
+        tokens = Counter(tokenize(text))
+        for token, frequency in tokens.items():
+            self._postings.setdefault(token, {})[doc_id] = frequency
+        length = sum(tokens.values())
+        self._doc_tokens[doc_id] = tokens
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        tokens = self._doc_tokens.pop(doc_id, None)
+        if tokens is None:
+            return
+        for token in tokens:
+            postings = self._postings[token]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._doc_tokens.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+
+    def search(
+        self, query: str, limit: int, accept: Optional[Callable[[str], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return up to `limit` `(doc_id, score)` pairs, best first.
+
+        Args:
+            query (str): Query text.
+            limit (int): Maximum number of results.
+            accept (Callable[[str], bool], optional): Predicate on the doc id; rejected documents are skipped.
+        """
+        doc_count = len(self._doc_lengths)
+        if not doc_count:
+            return []
+
+        average_length = self._total_length / doc_count or 1.0
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        candidates = scores.items()
+        if accept is not None:
+            candidates = ((doc_id, score) for doc_id, score in candidates if accept(doc_id))
+        return heapq.nlargest(limit, candidates, key=lambda item: item[1])
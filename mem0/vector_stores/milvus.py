@@ -30,6 +30,7 @@ class MilvusDB(VectorStoreBase):
         collection_name: str,
         embedding_model_dims: int,
         metric_type: MetricType,
+        enable_full_text_search: bool = False,
     ) -> None:
         """Initialize the MilvusDB database.
 
@@ -39,10 +40,15 @@ class MilvusDB(VectorStoreBase):
             collection_name (str): Name of the collection (defaults to mem0).
             embedding_model_dims (int): Dimensions of the embedding model (defaults to 1536).
             metric_type (MetricType): Metric type for similarity search (defaults to L2).
+            enable_full_text_search (bool): Store the memory text with a BM25 sparse vector for keyword
+                search (defaults to False).
         """
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.metric_type = metric_type
+        self.enable_full_text_search = enable_full_text_search
+        # The BM25 sparse vectors are computed by Milvus and cannot be returned, so name the fields explicitly.
+        self._output_fields = ["id", "metadata"] if enable_full_text_search else ["*"]
         self.client = MilvusClient(uri=url, token=token)
         self.create_col(
             collection_name=self.collection_name,
@@ -72,12 +78,32 @@ class MilvusDB(VectorStoreBase):
                 FieldSchema(name="vectors", dtype=DataType.FLOAT_VECTOR, dim=vector_size),
                 FieldSchema(name="metadata", dtype=DataType.JSON),
             ]
+            if self.enable_full_text_search:
+                fields += [
+                    FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=65535, enable_analyzer=True),
+                    FieldSchema(name="sparse", dtype=DataType.SPARSE_FLOAT_VECTOR),
+                ]
 
             schema = CollectionSchema(fields, enable_dynamic_field=True)
 
             index = self.client.prepare_index_params(
                 field_name="vectors", metric_type=metric_type, index_type="AUTOINDEX", index_name="vector_index"
             )
+            if self.enable_full_text_search:
+                from pymilvus import Function, FunctionType
+
+                # Milvus computes the BM25 sparse vector of `text` on insert.
+                schema.add_function(
+                    Function(
+                        name="text_bm25",
+                        function_type=FunctionType.BM25,
+                        input_field_names=["text"],
+                        output_field_names=["sparse"],
+                    )
+                )
+                index.add_index(
+                    field_name="sparse", index_type="SPARSE_INVERTED_INDEX", metric_type="BM25", index_name="text_index"
+                )
             self.client.create_collection(collection_name=collection_name, schema=schema, index_params=index)
 
     def insert(self, ids, vectors, payloads, **kwargs: Optional[dict[str, any]]):
@@ -88,10 +114,16 @@ class MilvusDB(VectorStoreBase):
             payloads (List[Dict], optional): List of payloads corresponding to vectors.
             ids (List[str], optional): List of IDs corresponding to vectors.
         """
-        for idx, embedding, metadata in zip(ids, vectors, payloads):
-            data = {"id": idx, "vectors": embedding, "metadata": metadata}
+        data = [self._build_row(idx, embedding, metadata) for idx, embedding, metadata in zip(ids, vectors, payloads)]
+        if data:
             self.client.insert(collection_name=self.collection_name, data=data, **kwargs)
 
+    def _build_row(self, vector_id, vector, payload) -> dict:
+        row = {"id": vector_id, "vectors": vector, "metadata": payload}
+        if self.enable_full_text_search:
+            row["text"] = (payload or {}).get("data") or ""
+        return row
+
     def _create_filter(self, filters: dict):
         """Prepare filters for efficient query.
 
@@ -151,13 +183,68 @@ class MilvusDB(VectorStoreBase):
         hits = self.client.search(
             collection_name=self.collection_name,
             data=[vectors],
+            anns_field="vectors",
             limit=limit,
             filter=query_filter,
-            output_fields=["*"],
+            output_fields=self._output_fields,
         )
         result = self._parse_output(data=hits[0])
         return result
 
+    def search_many(self, queries: list, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several queries with one multi-vector search request.
+
+        Args:
+            queries (List[str]): Queries.
+            vectors (List[List[float]]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every search. Defaults to None.
+
+        Returns:
+            list: Search results, one list per query.
+        """
+        if not vectors:
+            return []
+
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=list(vectors),
+            anns_field="vectors",
+            limit=limit,
+            filter=query_filter,
+            output_fields=self._output_fields,
+        )
+        return [self._parse_output(data=query_hits) for query_hits in hits]
+
+    def keyword_search(self, query: str, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search the memory text with BM25 over the sparse vectors Milvus derives from it.
+
+        Args:
+            query (str): Query text.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results, best first.
+        """
+        if not self.enable_full_text_search:
+            return super().keyword_search(query, limit=limit, filters=filters)
+
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=[query],
+            anns_field="sparse",
+            limit=limit,
+            filter=query_filter,
+            output_fields=self._output_fields,
+            search_params={"metric_type": "BM25"},
+        )
+        return self._parse_output(data=hits[0])
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -176,9 +263,27 @@ class MilvusDB(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        schema = {"id": vector_id, "vectors": vector, "metadata": payload}
+        schema = self._build_row(vector_id, vector, payload)
         self.client.upsert(collection_name=self.collection_name, data=schema)
 
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """
+        Update several vectors and their payloads with a single upsert.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors.
+            payloads (List[Dict], optional): Updated payloads.
+        """
+        vectors = vectors if vectors is not None else [None] * len(vector_ids)
+        payloads = payloads if payloads is not None else [None] * len(vector_ids)
+        data = [
+            self._build_row(vector_id, vector, payload)
+            for vector_id, vector, payload in zip(vector_ids, vectors, payloads)
+        ]
+        if data:
+            self.client.upsert(collection_name=self.collection_name, data=data)
+
     def get(self, vector_id):
         """
         Retrieve a vector by ID.
@@ -189,7 +294,9 @@ class MilvusDB(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        result = self.client.get(collection_name=self.collection_name, ids=vector_id)
+        result = self.client.get(
+            collection_name=self.collection_name, ids=vector_id, output_fields=self._output_fields
+        )
         output = OutputData(
             id=result[0].get("id", None),
             score=None,
@@ -231,7 +338,12 @@ class MilvusDB(VectorStoreBase):
             List[OutputData]: List of vectors.
         """
         query_filter = self._create_filter(filters) if filters else None
-        result = self.client.query(collection_name=self.collection_name, filter=query_filter, limit=limit)
+        result = self.client.query(
+            collection_name=self.collection_name,
+            filter=query_filter,
+            limit=limit,
+            output_fields=self._output_fields,
+        )
         memories = []
         for data in result:
             obj = OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -7,10 +8,15 @@ try:
 except ImportError:
     raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
 
+try:
+    from opensearchpy import AsyncOpenSearch
+except ImportError:  # Async support needs `pip install opensearch-py[async]`
+    AsyncOpenSearch = None
+
 from pydantic import BaseModel
 
 from mem0.configs.vector_stores.opensearch import OpenSearchConfig
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import BulkWriteError, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +32,32 @@ class OpenSearchDB(VectorStoreBase):
         config = OpenSearchConfig(**kwargs)
 
         # Initialize OpenSearch client
-        self.client = OpenSearch(
-            hosts=[{"host": config.host, "port": config.port or 9200}],
-            http_auth=config.http_auth
+        hosts = [{"host": config.host, "port": config.port or 9200}]
+        http_auth = (
+            config.http_auth
             if config.http_auth
-            else ((config.user, config.password) if (config.user and config.password) else None),
+            else ((config.user, config.password) if (config.user and config.password) else None)
+        )
+        self.client = OpenSearch(
+            hosts=hosts,
+            http_auth=http_auth,
             use_ssl=config.use_ssl,
             verify_certs=config.verify_certs,
             connection_class=RequestsHttpConnection,
             pool_maxsize=20,
         )
+        # Used by the async methods; without it they run the sync client in a worker thread.
+        self.async_client = (
+            AsyncOpenSearch(
+                hosts=hosts,
+                http_auth=http_auth,
+                use_ssl=config.use_ssl,
+                verify_certs=config.verify_certs,
+                pool_maxsize=20,
+            )
+            if AsyncOpenSearch is not None
+            else None
+        )
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
@@ -106,29 +128,58 @@ class OpenSearchDB(VectorStoreBase):
     def insert(
         self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
     ) -> List[OutputData]:
-        """Insert vectors into the index."""
+        """Insert vectors into the index. Raises `BulkWriteError` naming the vectors OpenSearch rejected."""
+        actions, action_ids = self._build_insert_actions(vectors, payloads, ids)
+
+        if actions:
+            response = self.client.bulk(body=actions)
+            self._raise_for_bulk_errors(response, action_ids, "inserting into")
+
+        results = []
+
+        return results
+
+    def _raise_for_bulk_errors(self, response: Dict, action_ids: List[str], operation: str) -> None:
+        """Raise `BulkWriteError` when a bulk response reports errors; `action_ids` follow the request order."""
+        if not response.get("errors"):
+            return
+        failed_ids = [
+            vector_id
+            for vector_id, item in zip(action_ids, response.get("items", []))
+            if any("error" in result for result in item.values())
+        ]
+        # Without per-item results, nothing tells which documents were written.
+        failed_ids = failed_ids or list(action_ids)
+        raise BulkWriteError(
+            f"OpenSearch rejected {len(failed_ids)} of {len(action_ids)} documents while bulk {operation} "
+            f"index {self.collection_name}",
+            failed_ids,
+        )
+
+    def _build_insert_actions(
+        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+    ):
+        """Build the bulk request body indexing one document per vector, and the vector id of each action."""
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
+        actions, action_ids = [], []
         for i, (vec, id_) in enumerate(zip(vectors, ids)):
             body = {
                 "vector_field": vec,
                 "payload": payloads[i],
                 "id": id_,
             }
-            self.client.index(index=self.collection_name, body=body)
-
-        results = []
+            actions.append({"index": {"_index": self.collection_name}})
+            actions.append(body)
+            action_ids.append(id_)
+        return actions, action_ids
 
-        return results
-
-    def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
-    ) -> List[OutputData]:
-        """Search for similar vectors using OpenSearch k-NN search with optional filters."""
+    def _build_search_body(self, vectors: List[float], limit: int, filters: Optional[Dict] = None) -> Dict:
+        """Build the k-NN search request body with optional filters."""
 
         # Base KNN query
         knn_query = {
@@ -144,12 +195,7 @@ class OpenSearchDB(VectorStoreBase):
         query_body = {"size": limit * 2, "query": None}
 
         # Prepare filter conditions if applicable
-        filter_clauses = []
-        if filters:
-            for key in ["user_id", "run_id", "agent_id"]:
-                value = filters.get(key)
-                if value:
-                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        filter_clauses = self._build_filter_clauses(filters)
 
         # Combine knn with filters if needed
         if filter_clauses:
@@ -157,14 +203,74 @@ class OpenSearchDB(VectorStoreBase):
         else:
             query_body["query"] = knn_query
 
-        # Execute search
-        response = self.client.search(index=self.collection_name, body=query_body)
+        return query_body
 
-        hits = response["hits"]["hits"]
-        results = [
+    def _build_filter_clauses(self, filters: Optional[Dict] = None) -> List[Dict]:
+        """Build the term filters on the session ids present in `filters`."""
+        filter_clauses = []
+        if filters:
+            for key in ["user_id", "run_id", "agent_id"]:
+                value = filters.get(key)
+                if value:
+                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        return filter_clauses
+
+    def _build_keyword_search_body(self, query: str, limit: int, filters: Optional[Dict] = None) -> Dict:
+        """Build a BM25 `match` query on the memory text with optional filters."""
+        match_query = {"match": {"payload.data": query}}
+        return {"size": limit, "query": {"bool": {"must": match_query, "filter": self._build_filter_clauses(filters)}}}
+
+    def _parse_hits(self, hits: List[Dict]) -> List[OutputData]:
+        """Convert search hits into OutputData objects."""
+        return [
             OutputData(id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {}))
             for hit in hits
         ]
+
+    def search(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """Search for similar vectors using OpenSearch k-NN search with optional filters."""
+        query_body = self._build_search_body(vectors, limit, filters)
+
+        # Execute search
+        response = self.client.search(index=self.collection_name, body=query_body)
+
+        return self._parse_hits(response["hits"]["hits"])
+
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
+        """Search the memory text with OpenSearch's BM25 scoring, with optional filters."""
+        query_body = self._build_keyword_search_body(query, limit, filters)
+        response = self.client.search(index=self.collection_name, body=query_body)
+        return self._parse_hits(response["hits"]["hits"])
+
+    def search_many(
+        self, queries: List[str], vectors: List[List[float]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """Run several k-NN searches in a single multi-search (`_msearch`) request."""
+        if not vectors:
+            return []
+
+        response = self.client.msearch(body=self._build_msearch_body(vectors, limit, filters))
+        return self._parse_msearch_responses(response)
+
+    def _build_msearch_body(self, vectors: List[List[float]], limit: int, filters: Optional[Dict] = None) -> List[Dict]:
+        """Build a multi-search request body with one k-NN search per vector."""
+        body = []
+        for query_vectors in vectors:
+            body.append({"index": self.collection_name})
+            body.append(self._build_search_body(query_vectors, limit, filters))
+        return body
+
+    def _parse_msearch_responses(self, response: Dict) -> List[List[OutputData]]:
+        """Convert a multi-search response into one result list per search."""
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                logger.error(f"Error in multi-search response: {item['error']}")
+                results.append([])
+                continue
+            results.append(self._parse_hits(item["hits"]["hits"]))
         return results
 
     def delete(self, vector_id: str) -> None:
@@ -210,6 +316,62 @@ class OpenSearchDB(VectorStoreBase):
             except Exception:
                 pass
 
+    def update_many(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[Optional[List[float]]]] = None,
+        payloads: Optional[List[Optional[Dict]]] = None,
+    ) -> None:
+        """
+        Update several vectors and their payloads with one lookup and one bulk request.
+
+        Raises `BulkWriteError` naming the vectors OpenSearch rejected.
+        """
+        if not vector_ids:
+            return
+
+        vectors = vectors if vectors is not None else [None] * len(vector_ids)
+        payloads = payloads if payloads is not None else [None] * len(vector_ids)
+
+        # Resolve all custom IDs to OpenSearch document IDs at once
+        search_query = {"query": {"terms": {"id": list(vector_ids)}}, "size": len(vector_ids)}
+        response = self.client.search(index=self.collection_name, body=search_query)
+        actions, action_ids = self._build_update_actions(response, vector_ids, vectors, payloads)
+
+        if actions:
+            response = self.client.bulk(body=actions)
+            self._raise_for_bulk_errors(response, action_ids, "updating")
+
+    def _build_update_actions(
+        self,
+        id_lookup_response: Dict,
+        vector_ids: List[str],
+        vectors: List[Optional[List[float]]],
+        payloads: List[Optional[Dict]],
+    ):
+        """Build the bulk update body and the vector id of each action, given the response of the custom-ID lookup."""
+        opensearch_ids = {
+            hit["_source"].get("id"): hit["_id"] for hit in id_lookup_response.get("hits", {}).get("hits", [])
+        }
+
+        actions, action_ids = [], []
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            opensearch_id = opensearch_ids.get(vector_id)
+            if opensearch_id is None:
+                continue
+
+            doc = {}
+            if vector is not None:
+                doc["vector_field"] = vector
+            if payload is not None:
+                doc["payload"] = payload
+
+            if doc:
+                actions.append({"update": {"_index": self.collection_name, "_id": opensearch_id}})
+                actions.append({"doc": doc})
+                action_ids.append(vector_id)
+        return actions, action_ids
+
     def get(self, vector_id: str) -> Optional[OutputData]:
         """Retrieve a vector by ID."""
         try:
@@ -247,35 +409,198 @@ class OpenSearchDB(VectorStoreBase):
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
         try:
             """List all memories with optional filters."""
-            query: Dict = {"query": {"match_all": {}}}
+            response = self.client.search(index=self.collection_name, body=self._build_list_query(filters, limit))
+            return self._parse_list_hits(response["hits"]["hits"])
+        except Exception:
+            return []
 
-            filter_clauses = []
-            if filters:
-                for key in ["user_id", "run_id", "agent_id"]:
-                    value = filters.get(key)
-                    if value:
-                        filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+    def _build_list_query(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> Dict:
+        """Build the query listing the documents that match the session filters."""
+        query: Dict = {"query": {"match_all": {}}}
 
-            if filter_clauses:
-                query["query"] = {"bool": {"filter": filter_clauses}}
+        filter_clauses = []
+        if filters:
+            for key in ["user_id", "run_id", "agent_id"]:
+                value = filters.get(key)
+                if value:
+                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
 
-            if limit:
-                query["size"] = limit
+        if filter_clauses:
+            query["query"] = {"bool": {"filter": filter_clauses}}
 
-            response = self.client.search(index=self.collection_name, body=query)
-            hits = response["hits"]["hits"]
+        if limit:
+            query["size"] = limit
+        return query
 
-            return [
-                [
-                    OutputData(id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {}))
-                    for hit in hits
-                ]
+    def _parse_list_hits(self, hits: List[Dict]) -> List[List[OutputData]]:
+        return [
+            [
+                OutputData(id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {}))
+                for hit in hits
             ]
+        ]
+
+    async def ainsert(
+        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+    ) -> List[OutputData]:
+        """Insert vectors into the index with the async client."""
+        if self.async_client is None:
+            return await super().ainsert(vectors, payloads=payloads, ids=ids)
+
+        actions, action_ids = self._build_insert_actions(vectors, payloads, ids)
+        if actions:
+            response = await self.async_client.bulk(body=actions)
+            self._raise_for_bulk_errors(response, action_ids, "inserting into")
+        return []
+
+    async def asearch(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """Search for similar vectors with the async client."""
+        if self.async_client is None:
+            return await super().asearch(query, vectors, limit=limit, filters=filters)
+
+        query_body = self._build_search_body(vectors, limit, filters)
+        response = await self.async_client.search(index=self.collection_name, body=query_body)
+        return self._parse_hits(response["hits"]["hits"])
+
+    async def akeyword_search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
+        """Search the memory text with BM25 using the async client."""
+        if self.async_client is None:
+            return await super().akeyword_search(query, limit=limit, filters=filters)
+
+        query_body = self._build_keyword_search_body(query, limit, filters)
+        response = await self.async_client.search(index=self.collection_name, body=query_body)
+        return self._parse_hits(response["hits"]["hits"])
+
+    async def asearch_many(
+        self, queries: List[str], vectors: List[List[float]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """Run several k-NN searches in a single multi-search request with the async client."""
+        if self.async_client is None:
+            return await super().asearch_many(queries, vectors, limit=limit, filters=filters)
+        if not vectors:
+            return []
+
+        response = await self.async_client.msearch(body=self._build_msearch_body(vectors, limit, filters))
+        return self._parse_msearch_responses(response)
+
+    async def adelete(self, vector_id: str) -> None:
+        """Delete a vector by custom ID with the async client."""
+        if self.async_client is None:
+            return await super().adelete(vector_id)
+
+        search_query = {"query": {"term": {"id": vector_id}}}
+        response = await self.async_client.search(index=self.collection_name, body=search_query)
+        hits = response.get("hits", {}).get("hits", [])
+        if not hits:
+            return
+
+        await self.async_client.delete(index=self.collection_name, id=hits[0]["_id"])
+
+    async def aupdate(
+        self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None
+    ) -> None:
+        """Update a vector and its payload with the async client."""
+        if self.async_client is None:
+            return await super().aupdate(vector_id, vector=vector, payload=payload)
+
+        await self.aupdate_many([vector_id], [vector], [payload])
+
+    async def aupdate_many(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[Optional[List[float]]]] = None,
+        payloads: Optional[List[Optional[Dict]]] = None,
+    ) -> None:
+        """Update several vectors and their payloads with one lookup and one bulk request, asynchronously."""
+        if self.async_client is None:
+            return await super().aupdate_many(vector_ids, vectors=vectors, payloads=payloads)
+        if not vector_ids:
+            return
+
+        vectors = vectors if vectors is not None else [None] * len(vector_ids)
+        payloads = payloads if payloads is not None else [None] * len(vector_ids)
+
+        search_query = {"query": {"terms": {"id": list(vector_ids)}}, "size": len(vector_ids)}
+        response = await self.async_client.search(index=self.collection_name, body=search_query)
+        actions, action_ids = self._build_update_actions(response, vector_ids, vectors, payloads)
+
+        if actions:
+            response = await self.async_client.bulk(body=actions)
+            self._raise_for_bulk_errors(response, action_ids, "updating")
+
+    async def aget(self, vector_id: str) -> Optional[OutputData]:
+        """Retrieve a vector by ID with the async client."""
+        if self.async_client is None:
+            return await super().aget(vector_id)
+
+        try:
+            if not await self.async_client.indices.exists(index=self.collection_name):
+                logger.info(f"Index {self.collection_name} does not exist, creating it...")
+                await asyncio.to_thread(self.create_col, self.collection_name, self.embedding_model_dims)
+                return None
+
+            search_query = {"query": {"term": {"id": vector_id}}}
+            response = await self.async_client.search(index=self.collection_name, body=search_query)
+            hits = response["hits"]["hits"]
+            if not hits:
+                return None
+
+            return OutputData(id=hits[0]["_source"].get("id"), score=1.0, payload=hits[0]["_source"].get("payload", {}))
+        except Exception as e:
+            logger.error(f"Error retrieving vector {vector_id}: {str(e)}")
+            return None
+
+    async def alist(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
+        """List all memories with optional filters, with the async client."""
+        if self.async_client is None:
+            return await super().alist(filters=filters, limit=limit)
+
+        try:
+            response = await self.async_client.search(
+                index=self.collection_name, body=self._build_list_query(filters, limit)
+            )
+            return self._parse_list_hits(response["hits"]["hits"])
         except Exception:
             return []
 
+    async def alist_pages(self, filters: Optional[Dict] = None, page_size: int = 100, limit: Optional[int] = None):
+        """Yield the matching memories page by page, fetching each page with a `search_after` query."""
+        fetched = 0
+        search_after = None
+        while limit is None or fetched < limit:
+            size = page_size if limit is None else min(page_size, limit - fetched)
+            query = self._build_list_query(filters, size)
+            query["sort"] = [{"id": "asc"}]
+            if search_after is not None:
+                query["search_after"] = search_after
+
+            if self.async_client is not None:
+                response = await self.async_client.search(index=self.collection_name, body=query)
+            else:
+                response = await asyncio.to_thread(self.client.search, index=self.collection_name, body=query)
+            hits = response["hits"]["hits"]
+            if not hits:
+                return
+
+            yield self._parse_list_hits(hits)[0]
+            fetched += len(hits)
+            if len(hits) < size:
+                return
+            search_after = hits[-1]["sort"]
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col(self.collection_name, self.embedding_model_dims)
+
+    def close(self) -> None:
+        """Close the connections of the sync client."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the connections of the async client. Call it from the event loop that used the client."""
+        if self.async_client is not None:
+            await self.async_client.close()
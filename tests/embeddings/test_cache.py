@@ -0,0 +1,69 @@
+import asyncio
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.cache import CachedEmbedding
+
+
+class CountingEmbedding(EmbeddingBase):
+    def __init__(self, config):
+        super().__init__(config)
+        self.texts = []
+
+    def embed(self, text, memory_action=None):
+        self.texts.append(text)
+        return [float(len(text)), float(len(self.texts))]
+
+    def embed_batch(self, texts, memory_action=None):
+        return [self.embed(text, memory_action) for text in texts]
+
+
+def make_cached(model="model-a", embedding_dims=2, path=None):
+    embedder = CountingEmbedding(BaseEmbedderConfig(model=model, embedding_dims=embedding_dims))
+    return CachedEmbedding(embedder, "fake", path=path)
+
+
+def test_embed_hit_and_miss():
+    cached = make_cached()
+
+    first = cached.embed("tea", "add")
+    assert cached.embed("tea", "add") == first
+    assert cached.embedder.texts == ["tea"]
+    assert (cached.stats()["hits"], cached.stats()["misses"]) == (1, 1)
+
+
+def test_embed_batch_only_sends_misses_once():
+    cached = make_cached()
+    cached.embed("tea", "add")
+
+    vectors = cached.embed_batch(["tea", "jazz", "jazz"], "add")
+
+    assert cached.embedder.texts == ["tea", "jazz"]
+    assert vectors[1] == vectors[2]
+    assert asyncio.run(cached.aembed_batch(["jazz", "tea"], "add")) == [vectors[1], vectors[0]]
+    assert cached.embedder.texts == ["tea", "jazz"]
+
+
+def test_keys_separate_models_dims_and_memory_actions(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cached = make_cached(path=path)
+    cached.embed("tea", "add")
+
+    cached.embed("tea", "search")
+    other_model = make_cached(model="model-b", path=path)
+    other_model.embed("tea", "add")
+    other_dims = make_cached(embedding_dims=3, path=path)
+    other_dims.embed("tea", "add")
+    reopened = make_cached(path=path)
+    reopened.embed("tea", "add")
+
+    assert cached.embedder.texts == ["tea", "tea"]
+    assert other_model.embedder.texts == other_dims.embedder.texts == ["tea"]
+    assert reopened.embedder.texts == []
+
+
+def test_key_uses_the_model_the_provider_resolved():
+    cached = make_cached(model=None)
+    cached.embedder.model = "provider-default"
+
+    assert "provider-default" in cached._cache_key("tea", "add")
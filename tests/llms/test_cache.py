@@ -0,0 +1,73 @@
+import asyncio
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.llms.cache import CachedLLM
+
+
+class CountingLLM(LLMBase):
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        self.calls += 1
+        return {"content": f"response {self.calls}", "tool_calls": []}
+
+    async def agenerate_response(self, messages, **kwargs):
+        return self.generate_response(messages, **kwargs)
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+def make_cached(path=None, ttl=None, **config):
+    config.setdefault("model", "model-a")
+    return CachedLLM(CountingLLM(BaseLlmConfig(**config)), "fake", ttl=ttl, path=path)
+
+
+def test_generate_response_hit_and_miss():
+    cached = make_cached()
+
+    first = cached.generate_response(MESSAGES)
+    first["content"] = "changed by the caller"
+
+    assert cached.generate_response(messages=MESSAGES) == {"content": "response 1", "tool_calls": []}
+    assert asyncio.run(cached.agenerate_response(MESSAGES)) == {"content": "response 1", "tool_calls": []}
+    assert cached.generate_response(MESSAGES, response_format={"type": "json_object"})["content"] == "response 2"
+    assert cached.llm.calls == 2
+    assert (cached.stats()["hits"], cached.stats()["misses"]) == (2, 2)
+
+
+def test_keys_separate_models_and_sampling_settings(tmp_path):
+    path = str(tmp_path / "cache.db")
+    make_cached(path=path).generate_response(MESSAGES)
+
+    for config in ({"model": "model-b"}, {"temperature": 0.7}, {"max_tokens": 100}, {"top_p": 0.5}):
+        other = make_cached(path=path, **config)
+        other.generate_response(MESSAGES)
+        assert other.llm.calls == 1, config
+
+    reopened = make_cached(path=path)
+    reopened.generate_response(MESSAGES)
+    assert reopened.llm.calls == 0
+
+
+def test_ttl_expires_responses(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mem0.utils.cache.time.time", lambda: now[0])
+    cached = make_cached(ttl=60)
+    cached.generate_response(MESSAGES)
+
+    now[0] += 61
+    assert cached.generate_response(MESSAGES)["content"] == "response 2"
+    assert cached.stats()["expired"] == 1
+
+
+def test_unhashable_arguments_are_not_cached():
+    cached = make_cached()
+
+    cached.generate_response(MESSAGES, response_format=object())
+    cached.generate_response(MESSAGES, response_format=object())
+
+    assert cached.llm.calls == 2
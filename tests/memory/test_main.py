@@ -0,0 +1,301 @@
+import asyncio
+import hashlib
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mem0.memory.main import (
+    AsyncMemory,
+    Memory,
+    _fuse_search_results,
+    _preclassify_facts,
+    _threshold_vector_results,
+)
+from mem0.vector_stores.faiss import OutputData
+from mem0.vector_stores.base import BulkWriteError
+
+
+def history_record(memory_id, event):
+    return {"memory_id": memory_id, "event": event}
+
+
+def make_memory(memory_class, monkeypatch):
+    monkeypatch.setattr("mem0.memory.main.capture_event", MagicMock())
+    memory = memory_class.__new__(memory_class)
+    memory.config = MagicMock()
+    memory.instrumentation = MagicMock()
+    memory.vector_store = MagicMock()
+    memory.vector_store.ainsert = AsyncMock()
+    memory.vector_store.aupdate_many = AsyncMock()
+    memory.db = MagicMock()
+    return memory
+
+
+INSERTS = [("added", [0.1], {"data": "added"})]
+UPDATES = [("updated", [0.2], {"data": "updated"})]
+HISTORY = [history_record("added", "ADD"), history_record("updated", "UPDATE")]
+
+
+def test_write_memories_keeps_inserts_when_update_fails(monkeypatch):
+    memory = make_memory(Memory, monkeypatch)
+    memory.vector_store.update_many.side_effect = RuntimeError("update failed")
+
+    assert memory._write_memories(INSERTS, UPDATES, HISTORY) == {"added"}
+    memory.vector_store.insert.assert_called_once()
+    memory.db.batch_add_history.assert_called_once_with([history_record("added", "ADD")])
+
+
+def test_write_memories_reports_writes_when_history_fails(monkeypatch):
+    memory = make_memory(Memory, monkeypatch)
+    memory.db.batch_add_history.side_effect = RuntimeError("history failed")
+
+    assert memory._write_memories(INSERTS, UPDATES, HISTORY) == {"added", "updated"}
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_write_memories_drops_ids_rejected_by_a_bulk_write(monkeypatch, memory_class):
+    memory = make_memory(memory_class, monkeypatch)
+    inserts = INSERTS + [("rejected", [0.3], {"data": "rejected"})]
+    history = HISTORY + [history_record("rejected", "ADD")]
+    error = BulkWriteError("rejected", ["rejected"])
+    memory.vector_store.insert.side_effect = error
+    memory.vector_store.ainsert.side_effect = error
+
+    written = memory._write_memories(inserts, UPDATES, history)
+    if memory_class is AsyncMemory:
+        written = asyncio.run(written)
+
+    assert written == {"added", "updated"}
+    memory.db.batch_add_history.assert_called_once_with(
+        [history_record("added", "ADD"), history_record("updated", "UPDATE")]
+    )
+
+
+def test_write_memories_skips_updates_when_the_insert_fails(monkeypatch):
+    memory = make_memory(Memory, monkeypatch)
+    memory.vector_store.insert.side_effect = RuntimeError("insert failed")
+
+    assert memory._write_memories(INSERTS, UPDATES, HISTORY) == set()
+    memory.vector_store.update_many.assert_not_called()
+    memory.db.batch_add_history.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_write_memories_keeps_inserts_when_update_fails(monkeypatch):
+    memory = make_memory(AsyncMemory, monkeypatch)
+    memory.vector_store.aupdate_many.side_effect = RuntimeError("update failed")
+
+    assert await memory._write_memories(INSERTS, UPDATES, HISTORY) == {"added"}
+    memory.vector_store.ainsert.assert_awaited_once()
+    memory.db.batch_add_history.assert_called_once_with([history_record("added", "ADD")])
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_apply_memory_actions_returns_inserts_written_before_a_failed_update(monkeypatch, memory_class):
+    memory = make_memory(memory_class, monkeypatch)
+    memory.vector_store.update_many.side_effect = RuntimeError("update failed")
+    memory.vector_store.aupdate_many.side_effect = RuntimeError("update failed")
+    memory.embedding_model = MagicMock()
+    prepared_add = ("added", [0.1], {"data": "D"}, history_record("added", "ADD"))
+    prepared_update = ([0.2], {"data": "A2"}, history_record("old", "UPDATE"))
+    if memory_class is Memory:
+        memory._prepare_create_memory = MagicMock(return_value=prepared_add)
+        memory._prepare_update_memory = MagicMock(return_value=prepared_update)
+        memory._run_concurrently = lambda calls: [(call(), None) for call in calls]
+    else:
+        memory.embedding_model.aembed_batch = AsyncMock(return_value=[])
+        memory._prepare_create_memory = AsyncMock(return_value=prepared_add)
+        memory._prepare_update_memory = AsyncMock(return_value=prepared_update)
+
+    actions = {
+        "memory": [
+            {"id": "0", "text": "A2", "event": "UPDATE", "old_memory": "A"},
+            {"id": "1", "text": "D", "event": "ADD"},
+        ]
+    }
+    embeddings = {"A2": [0.2], "D": [0.1]}
+    result = memory._apply_memory_actions(actions, {}, embeddings, {"0": "old"})
+    if memory_class is AsyncMemory:
+        result = asyncio.run(result)
+
+    assert result == [{"id": "added", "memory": "D", "event": "ADD"}]
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_add_without_inference_writes_all_messages_in_one_batch(monkeypatch, memory_class):
+    memory = make_memory(memory_class, monkeypatch)
+    memory.embedding_model = MagicMock()
+    memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+    memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1], [0.2]])
+    messages = [
+        {"role": "system", "content": "ignored"},
+        {"role": "user", "content": "I like tea", "name": "alice"},
+        {"role": "assistant", "content": "Noted"},
+    ]
+
+    result = memory._add_to_vector_store(messages, {"user_id": "u"}, {"user_id": "u"}, False)
+    if memory_class is AsyncMemory:
+        result = asyncio.run(result)
+
+    insert = memory.vector_store.insert if memory_class is Memory else memory.vector_store.ainsert
+    insert.assert_called_once()
+    ids, payloads = insert.call_args.kwargs["ids"], insert.call_args.kwargs["payloads"]
+    assert [payload["data"] for payload in payloads] == ["I like tea", "Noted"]
+    assert payloads[0]["actor_id"] == "alice"
+    memory.db.batch_add_history.assert_called_once()
+    assert [record["memory_id"] for record in memory.db.batch_add_history.call_args.args[0]] == ids
+    assert [(item["id"], item["memory"], item["role"]) for item in result] == [
+        (ids[0], "I like tea", "user"),
+        (ids[1], "Noted", "assistant"),
+    ]
+
+
+def neighbor(text, score):
+    return SimpleNamespace(id=text, score=score, payload={"data": text, "hash": hashlib.md5(text.encode()).hexdigest()})
+
+
+def test_preclassify_facts_skips_exact_and_repeated_facts():
+    actions, ambiguous = _preclassify_facts(
+        ["likes tea", "likes jazz", "likes jazz"],
+        [[neighbor("likes tea", 0.4)], [neighbor("likes blues", 0.7)], [neighbor("likes blues", 0.7)]],
+    )
+
+    assert actions == [{"text": "likes tea", "event": "NONE"}, {"text": "likes jazz", "event": "NONE"}]
+    assert ambiguous == [("likes jazz", [neighbor("likes blues", 0.7)])]
+
+
+def test_preclassify_facts_thresholds():
+    facts = ["near duplicate", "novel", "related"]
+    neighbors = [[neighbor("near duplicat", 0.97)], [neighbor("unrelated", 0.2)], [neighbor("close", 0.7)]]
+
+    actions, ambiguous = _preclassify_facts(facts, neighbors, duplicate_threshold=0.95, novelty_threshold=0.5)
+
+    assert actions == [{"text": "near duplicate", "event": "NONE"}, {"text": "novel", "event": "ADD"}]
+    assert ambiguous == [("related", neighbors[2])]
+
+
+def test_preclassify_facts_thresholds_are_opt_in():
+    facts = ["near duplicate", "novel", "no neighbors"]
+    neighbors = [[neighbor("near duplicat", 0.97)], [neighbor("unrelated", 0.2)], []]
+
+    actions, ambiguous = _preclassify_facts(facts, neighbors)
+
+    assert actions == [{"text": "no neighbors", "event": "ADD"}]
+    assert ambiguous == list(zip(facts[:2], neighbors[:2]))
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_resolve_memory_actions_skips_llm_when_all_facts_are_resolved(monkeypatch, memory_class):
+    memory = make_memory(memory_class, monkeypatch)
+    memory.config.duplicate_similarity_threshold = 0.95
+    memory.config.novelty_similarity_threshold = 0.5
+    memory._decide_memory_actions = MagicMock()
+
+    result = memory._resolve_memory_actions(
+        ["likes tea", "near duplicate", "novel"],
+        [[neighbor("likes tea", 0.6)], [neighbor("near duplicat", 0.97)], [neighbor("unrelated", 0.2)]],
+    )
+    if memory_class is AsyncMemory:
+        result = asyncio.run(result)
+
+    memory._decide_memory_actions.assert_not_called()
+    assert result == (
+        {
+            "memory": [
+                {"text": "likes tea", "event": "NONE"},
+                {"text": "near duplicate", "event": "NONE"},
+                {"text": "novel", "event": "ADD"},
+            ]
+        },
+        {},
+    )
+
+
+def ranked(*id_scores):
+    return [OutputData(id=memory_id, score=score, payload={"data": memory_id}) for memory_id, score in id_scores]
+
+
+def test_fuse_search_results_with_rrf():
+    vector_results = ranked(("a", 0.9), ("b", 0.8), ("c", 0.1))
+    keyword_results = ranked(("c", 7.0), ("a", 3.0))
+
+    fused = _fuse_search_results([vector_results, keyword_results], limit=2)
+
+    assert [result.id for result in fused] == ["a", "c"]
+    assert [result.score for result in fused] == pytest.approx([1 / 61 + 1 / 62, 1 / 63 + 1 / 61])
+    assert vector_results[0].score == 0.9
+
+
+def test_fuse_search_results_with_normalized_scores():
+    # Distances: the first result is the closest, whichever way the scores go.
+    vector_results = ranked(("a", 0.1), ("b", 0.4), ("c", 0.7))
+    keyword_results = ranked(("b", 9.0), ("d", 3.0))
+
+    fused = _fuse_search_results([vector_results, keyword_results], limit=3, method="normalized")
+
+    assert [result.id for result in fused] == ["b", "a", "c"]
+    assert [result.score for result in fused] == pytest.approx([1.5, 1.0, 0.0])
+
+
+def test_threshold_vector_results():
+    results = ranked(("a", 0.9), ("b", 0.5), ("c", 0.2))
+
+    assert _threshold_vector_results(results, None) == results
+    assert [result.id for result in _threshold_vector_results(results, 0.5)] == ["a", "b"]
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_add_many_keeps_input_order_and_isolates_failures(monkeypatch, memory_class):
+    memory = make_memory(memory_class, monkeypatch)
+
+    def add_item(item):
+        if item["messages"] == "fail":
+            raise ValueError("bad item")
+        return {"results": [{"memory": item["messages"]}]}
+
+    # Later items finish first, so results arrive out of order.
+    if memory_class is Memory:
+
+        def add_pipelined(item, stage_semaphores):
+            time.sleep(0.01 * (5 - item["index"]))
+            return add_item(item)
+
+    else:
+
+        async def add_pipelined(item, stage_semaphores):
+            await asyncio.sleep(0.01 * (5 - item["index"]))
+            return add_item(item)
+
+    memory._add_pipelined = add_pipelined
+    items = [{"index": i, "messages": "fail" if i in (1, 3) else f"item {i}"} for i in range(5)]
+
+    output = memory.add_many(items, concurrency=5)
+    if memory_class is AsyncMemory:
+        output = asyncio.run(output)
+
+    assert output["results"] == [
+        {"results": [{"memory": "item 0"}]},
+        None,
+        {"results": [{"memory": "item 2"}]},
+        None,
+        {"results": [{"memory": "item 4"}]},
+    ]
+    assert output["failures"] == [{"index": 1, "error": "bad item"}, {"index": 3, "error": "bad item"}]
+
+
+@pytest.mark.asyncio
+async def test_async_close_closes_async_clients(monkeypatch):
+    memory = make_memory(AsyncMemory, monkeypatch)
+    memory.telemetry = MagicMock()
+    memory.vector_store.aclose = AsyncMock()
+    memory.embedding_model = MagicMock()
+    memory.embedding_model.aclose = AsyncMock()
+
+    await memory.close()
+
+    memory.db.close.assert_called_once()
+    memory.vector_store.close.assert_called_once()
+    memory.vector_store.aclose.assert_awaited_once()
+    memory.embedding_model.aclose.assert_awaited_once()
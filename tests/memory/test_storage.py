@@ -0,0 +1,108 @@
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mem0.memory.storage import SQLiteManager
+
+
+def stored_events(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in connection.execute("SELECT event FROM history ORDER BY new_memory")]
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "history.db")
+
+
+def enqueue(manager):
+    manager.add_history("memory-1", None, "a", "ADD")
+    manager.batch_add_history([{"memory_id": "memory-1", "old_memory": "a", "new_memory": "b", "event": "UPDATE"}])
+
+
+def test_write_behind_rows_visible_after_flush(db_path):
+    manager = SQLiteManager(db_path, write_behind=True, flush_interval=60)
+    enqueue(manager)
+    assert stored_events(db_path) == []
+
+    manager.flush()
+    assert stored_events(db_path) == ["ADD", "UPDATE"]
+    manager.close()
+
+
+def test_write_behind_rows_visible_after_close(db_path):
+    manager = SQLiteManager(db_path, write_behind=True, flush_interval=60)
+    enqueue(manager)
+    manager.close()
+
+    assert stored_events(db_path) == ["ADD", "UPDATE"]
+
+
+def test_write_behind_rows_flushed_at_exit(db_path):
+    script = (
+        "from mem0.memory.storage import SQLiteManager\n"
+        f"manager = SQLiteManager({db_path!r}, write_behind=True, flush_interval=60)\n"
+        "manager.add_history('memory-1', None, 'a', 'ADD')\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=Path(__file__).parents[2])
+
+    assert stored_events(db_path) == ["ADD"]
+
+
+def test_get_history_orders_by_creation_then_update(db_path):
+    manager = SQLiteManager(db_path)
+    manager.batch_add_history(
+        [
+            {"memory_id": "m", "new_memory": "b", "event": "UPDATE", "created_at": "1", "updated_at": "3"},
+            {"memory_id": "m", "new_memory": "a", "event": "ADD", "created_at": "1"},
+            {"memory_id": "m", "new_memory": "c", "event": "UPDATE", "created_at": "1", "updated_at": "2"},
+        ]
+    )
+    assert [row["new_memory"] for row in manager.get_history("m")] == ["a", "c", "b"]
+    manager.close()
+
+
+# US/Pacific clocks fall back from 02:00 PDT to 01:00 PST on 2026-11-01.
+BEFORE_FALL_BACK = "2026-11-01T01:30:00-07:00"
+AFTER_FALL_BACK = "2026-11-01T01:10:00-08:00"
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+def test_get_history_orders_by_time_across_dst_change(db_path, write_behind):
+    manager = SQLiteManager(db_path, write_behind=write_behind)
+    manager.add_history("m", "a", "c", "UPDATE", created_at=BEFORE_FALL_BACK, updated_at=AFTER_FALL_BACK)
+    record = {"memory_id": "m", "old_memory": "a", "new_memory": "b", "event": "UPDATE"}
+    manager.batch_add_history([{**record, "created_at": BEFORE_FALL_BACK, "updated_at": BEFORE_FALL_BACK}])
+
+    history = manager.get_history("m")
+    assert [row["new_memory"] for row in history] == ["b", "c"]
+    assert history[1]["updated_at"] == "2026-11-01T09:10:00.000000+00:00"
+    manager.close()
+
+
+def test_existing_timestamps_are_converted_to_utc(db_path):
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute(
+            "CREATE TABLE history (id TEXT PRIMARY KEY, memory_id TEXT, old_memory TEXT, new_memory TEXT, "
+            "event TEXT, created_at DATETIME, updated_at DATETIME, is_deleted INTEGER, actor_id TEXT, role TEXT)"
+        )
+        connection.executemany(
+            "INSERT INTO history (id, memory_id, new_memory, event, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ("1", "m", "c", "UPDATE", BEFORE_FALL_BACK, AFTER_FALL_BACK),
+                ("2", "m", "b", "UPDATE", BEFORE_FALL_BACK, BEFORE_FALL_BACK),
+            ],
+        )
+    connection.close()
+
+    manager = SQLiteManager(db_path)
+    assert [row["new_memory"] for row in manager.get_history("m")] == ["b", "c"]
+    assert manager.get_history("m")[0]["created_at"] == "2026-11-01T08:30:00.000000+00:00"
+    manager.close()
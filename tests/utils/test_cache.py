@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+
+from mem0.utils.cache import TieredCache
+
+
+def test_lru_hits_misses_and_eviction():
+    cache = TieredCache(max_size=2)
+    cache.set_many({"a": [1.0], "b": [2.0]})
+    assert cache.get_many(["a"]) == {"a": [1.0]}
+
+    # "b" is now the least recently used entry.
+    cache.set_many({"c": [3.0]})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (3, 3, 2)
+
+
+def test_persistent_tier_survives_restart_and_is_promoted(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = TieredCache(max_size=10, path=path, table="test_cache")
+    cache.set_many({"a": {"text": "A"}})
+    cache.close()
+
+    reopened = TieredCache(max_size=10, path=path, table="test_cache")
+    assert reopened.get_many(["a", "b"]) == {"a": {"text": "A"}}
+    assert reopened.get_many(["a"]) == {"a": {"text": "A"}}
+    stats = reopened.stats()
+    assert (stats["persistent_hits"], stats["hits"]) == (1, 1)
+
+
+def test_ttl_expires_entries_in_both_tiers(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mem0.utils.cache.time.time", lambda: now[0])
+    cache = TieredCache(max_size=10, path=str(tmp_path / "cache.db"), ttl=60)
+    cache.set_many({"a": "A"})
+
+    now[0] += 61
+    assert cache.get_many(["a"]) == {}
+    assert cache.store.get_many(["a"]) == {}
+    assert cache.stats()["expired"] == 1
+
+
+@pytest.mark.parametrize("path", [None, "cache.db"])
+def test_clear_drops_entries_and_counters(tmp_path, path):
+    cache = TieredCache(max_size=10, path=str(tmp_path / path) if path else None)
+    cache.set_many({"a": "A"})
+    cache.clear()
+
+    assert cache.get_many(["a"]) == {}
+    assert cache.stats()["misses"] == 0
+
+
+def test_table_with_an_outdated_layout_is_replaced(tmp_path):
+    path = str(tmp_path / "cache.db")
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE embedding_cache (key TEXT PRIMARY KEY, embedding TEXT)")
+        connection.execute("INSERT INTO embedding_cache VALUES ('a', '[1.0]')")
+    connection.close()
+
+    cache = TieredCache(max_size=10, path=path, table="embedding_cache")
+    assert cache.get_many(["a"]) == {}
+    cache.set_many({"a": [2.0]})
+    assert TieredCache(max_size=10, path=path, table="embedding_cache").get_many(["a"]) == {"a": [2.0]}
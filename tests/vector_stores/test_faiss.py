@@ -0,0 +1,324 @@
+import logging
+import os
+
+import faiss
+import numpy as np
+import pytest
+
+from mem0.vector_stores.faiss import FAISS, _SnapshotColumn
+
+DIMS = 16
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).random((1000, DIMS)).astype(np.float32)
+
+
+def make_store(path, **kwargs):
+    kwargs.setdefault("embedding_model_dims", DIMS)
+    return FAISS(collection_name="test", path=str(path), **kwargs)
+
+
+def fill(store, vectors, start=0):
+    ids = [str(i) for i in range(start, start + len(vectors))]
+    payloads = [{"data": f"memory {i}", "user_id": f"user-{int(i) % 4}"} for i in ids]
+    store.insert(vectors, payloads, ids)
+    return ids
+
+
+@pytest.mark.parametrize(
+    "index_type, kind, options",
+    [
+        ("flat", "flat", {}),
+        ("hnsw", "hnsw", {}),
+        ("ivf_flat", "ivf", {"nlist": 8}),
+        ("ivf_pq", "ivf", {"nlist": 8, "pq_m": 4, "pq_nbits": 4}),
+        ("auto", "ivf", {"nlist": 8, "upgrade_threshold": 500}),
+    ],
+)
+def test_index_type_save_and_reload(tmp_path, vectors, caplog, index_type, kind, options):
+    store = make_store(tmp_path, index_type=index_type, **options)
+    fill(store, vectors)
+    assert store.col_info()["index_type"] == kind
+    index_ids = np.array(sorted(store.index_to_id), dtype=np.int64)
+    reconstructed = store.index.reconstruct_batch(index_ids)
+    expected = [result.id for result in store.search("", vectors[3].tolist(), limit=5)]
+    store.close()
+
+    with caplog.at_level(logging.INFO, logger="mem0.vector_stores.faiss"):
+        reloaded = make_store(tmp_path, index_type=index_type, **options)
+
+    assert "Migrated" not in caplog.text
+    assert "Rebuilt" not in caplog.text
+    assert reloaded.col_info()["index_type"] == kind
+    assert reloaded.col_info()["count"] == len(vectors)
+    np.testing.assert_array_equal(reloaded.index.reconstruct_batch(index_ids), reconstructed)
+    assert [result.id for result in reloaded.search("", vectors[3].tolist(), limit=5)] == expected
+
+
+def snapshot(store):
+    return {vector_id: store.docstore[vector_id] for vector_id in store.id_to_index}
+
+
+def write_some(store, vectors):
+    """Insert, update and delete, so the write log holds every kind of record."""
+    fill(store, vectors[:300])
+    store.update("1", vector=vectors[500].tolist(), payload={"data": "updated", "user_id": "user-9"})
+    store.delete("2")
+
+
+def test_write_log_replayed_after_unclean_exit(tmp_path, vectors):
+    store = make_store(tmp_path, write_log=True)
+    write_some(store, vectors)
+    expected = snapshot(store)
+    # No close(): the process dies with the writes only in the log.
+
+    reloaded = make_store(tmp_path, write_log=True)
+    assert snapshot(reloaded) == expected
+    assert reloaded.get("1").payload["data"] == "updated"
+    assert reloaded.get("2") is None
+    assert reloaded.search("", vectors[500].tolist(), limit=1)[0].id == "1"
+
+
+def test_write_log_torn_tail_is_truncated(tmp_path, vectors):
+    store = make_store(tmp_path, write_log=True)
+    write_some(store, vectors)
+    expected = snapshot(store)
+    log_path = store._log_path
+    valid_length = store._log.size
+    with open(log_path, "ab") as f:
+        f.write(b"\x00\x01torn record")
+
+    reloaded = make_store(tmp_path, write_log=True)
+    assert snapshot(reloaded) == expected
+    assert reloaded._log.size == valid_length
+
+    # Records appended after the truncation are not hidden behind the torn one.
+    reloaded.delete("3")
+    assert "3" not in snapshot(make_store(tmp_path, write_log=True))
+
+
+def test_interrupted_checkpoint_is_replayed_and_completed(tmp_path, vectors, monkeypatch):
+    store = make_store(tmp_path, write_log=True)
+    fill(store, vectors[:300])
+    with monkeypatch.context() as patch:
+        # The process dies after rotating the log, before the snapshot is written.
+        patch.setattr(FAISS, "_write_checkpoint", lambda self, builder: None)
+        store._start_checkpoint()
+    fill(store, vectors[300:600], start=300)
+    store.delete("4")
+    expected = snapshot(store)
+    assert os.path.exists(store._checkpoint_log_path) and os.path.getsize(store._log_path)
+
+    reloaded = make_store(tmp_path, write_log=True)
+    assert snapshot(reloaded) == expected
+
+    reloaded._start_checkpoint()
+    reloaded.close()
+    assert not os.path.exists(reloaded._checkpoint_log_path)
+    # The previous generation of the index is gone once the new snapshot is committed.
+    assert sorted(os.listdir(tmp_path)) == [f"test.{reloaded._generation}.faiss", "test.log", "test.pkl"]
+    assert snapshot(make_store(tmp_path)) == expected
+
+
+def test_uncommitted_snapshot_is_ignored(tmp_path, vectors):
+    store = make_store(tmp_path)
+    fill(store, vectors[:100])
+    expected = snapshot(store)
+    # A crash after writing the next generation's index, before the docstore switched to it.
+    faiss.write_index(faiss.IndexFlatL2(DIMS), str(tmp_path / f"test.{store._generation + 1}.faiss"))
+
+    reloaded = make_store(tmp_path)
+    assert snapshot(reloaded) == expected
+    fill(reloaded, vectors[100:200], start=100)
+    assert reloaded.col_info()["count"] == 200
+    assert make_store(tmp_path).col_info()["count"] == 200
+
+
+def test_write_log_with_auto_upgrade(tmp_path, vectors, caplog):
+    options = {"index_type": "auto", "nlist": 8, "upgrade_threshold": 500, "write_log": True}
+    store = make_store(tmp_path, **options)
+    fill(store, vectors)
+    assert store.col_info()["index_type"] == "ivf"
+    expected = [result.id for result in store.search("", vectors[3].tolist(), limit=5)]
+
+    # The snapshot on disk is still flat; replaying the log on it upgrades it again.
+    reloaded = make_store(tmp_path, **options)
+    assert reloaded.col_info()["index_type"] == "ivf"
+    assert snapshot(reloaded) == snapshot(store)
+    assert [result.id for result in reloaded.search("", vectors[3].tolist(), limit=5)] == expected
+
+    # A checkpoint writes the upgraded index, so the next load does not rebuild it.
+    reloaded._start_checkpoint()
+    reloaded.close()
+    with caplog.at_level(logging.INFO, logger="mem0.vector_stores.faiss"):
+        checkpointed = make_store(tmp_path, **options)
+    assert "Rebuilt" not in caplog.text
+    assert checkpointed.col_info()["index_type"] == "ivf"
+    assert [result.id for result in checkpointed.search("", vectors[3].tolist(), limit=5)] == expected
+
+
+def test_mmap_converts_pickle_collection_on_first_save(tmp_path, vectors):
+    store = make_store(tmp_path)
+    fill(store, vectors[:200])
+    expected = snapshot(store)
+    store.close()
+
+    mapped = make_store(tmp_path, mmap=True)
+    assert mapped._mapped
+    assert snapshot(mapped) == expected
+    assert os.path.exists(tmp_path / "test.pkl") and not os.path.exists(tmp_path / "test.docstore.db")
+
+    mapped.delete("0")
+    assert not os.path.exists(tmp_path / "test.pkl") and os.path.exists(tmp_path / "test.docstore.db")
+    del expected["0"]
+    assert snapshot(make_store(tmp_path, mmap=True)) == expected
+
+
+def test_mmap_reads_from_snapshot_database(tmp_path, vectors):
+    store = make_store(tmp_path, mmap=True)
+    fill(store, vectors[:200])
+    filters = {"user_id": "user-3"}
+    expected = [result.id for result in store.search("", vectors[3].tolist(), limit=5, filters=filters)]
+    store.close()
+
+    mapped = make_store(tmp_path, mmap=True)
+    assert mapped._mapped
+    assert isinstance(mapped.docstore, _SnapshotColumn)
+    assert isinstance(mapped.index_to_id, _SnapshotColumn)
+    assert mapped.get("7").payload == {"data": "memory 7", "user_id": "user-3"}
+    assert mapped.get("missing") is None
+    assert [result.id for result in mapped.search("", vectors[3].tolist(), limit=5, filters=filters)] == expected
+    assert len(mapped.list(filters={"user_id": "user-1"})[0]) == 50
+    # Reads never copy the snapshot into memory.
+    assert mapped._mapped and isinstance(mapped.docstore, _SnapshotColumn)
+
+
+def test_mmap_first_write_materializes_index_and_docstore(tmp_path, vectors):
+    store = make_store(tmp_path, mmap=True)
+    fill(store, vectors[:200])
+    store.close()
+
+    mapped = make_store(tmp_path, mmap=True)
+    fill(mapped, vectors[200:300], start=200)
+    assert not mapped._mapped
+    assert mapped._snapshot_db is None
+    assert isinstance(mapped.docstore, dict) and isinstance(mapped.index_to_id, dict)
+    assert mapped.col_info()["count"] == 300
+    assert mapped.get("250").payload["data"] == "memory 250"
+    assert make_store(tmp_path, mmap=True).col_info()["count"] == 300
+
+
+def test_store_without_mmap_reads_snapshot_database(tmp_path, vectors):
+    store = make_store(tmp_path, mmap=True)
+    fill(store, vectors[:200])
+    expected = snapshot(store)
+    store.close()
+
+    eager = make_store(tmp_path)
+    assert not eager._mapped
+    assert isinstance(eager.docstore, dict)
+    assert snapshot(eager) == expected
+
+    # Saving without mmap writes the pickle format back.
+    eager.delete("0")
+    assert os.path.exists(tmp_path / "test.pkl") and not os.path.exists(tmp_path / "test.docstore.db")
+
+
+def expected_filter_index(store):
+    expected = {key: {} for key in ("user_id", "agent_id", "run_id")}
+    for vector_id, payload in store.docstore.items():
+        for key in expected:
+            if key in payload:
+                expected[key].setdefault(payload[key], set()).add(vector_id)
+    return expected
+
+
+def exact_ids(vectors, query, ids, limit):
+    distances = ((vectors[[int(i) for i in ids]] - query) ** 2).sum(axis=1)
+    return [ids[position] for position in np.argsort(distances)[:limit]]
+
+
+def test_filter_index_follows_writes(tmp_path, vectors):
+    store = make_store(tmp_path)
+    fill(store, vectors[:100])
+    store.search("", vectors[0].tolist(), filters={"user_id": "user-1"})
+    assert store._filter_index == expected_filter_index(store)
+
+    fill(store, vectors[100:110], start=100)
+    store.update("1", payload={"data": "moved", "user_id": "user-2", "agent_id": "agent"})
+    store.update("5", vector=vectors[500].tolist())
+    store.delete("9")
+    store.update_many(["13", "17"], payloads=[{"data": "moved", "user_id": "user-9"}, None])
+    assert store._filter_index == expected_filter_index(store)
+
+    user_1 = {result.id for result in store.search("", vectors[0].tolist(), limit=100, filters={"user_id": "user-1"})}
+    assert user_1 == {str(i) for i in range(110) if i % 4 == 1} - {"1", "9", "13"}
+    assert [result.id for result in store.search("", vectors[0].tolist(), filters={"agent_id": "agent"})] == ["1"]
+
+
+@pytest.mark.parametrize("slice_scan_max_size", [10_000, 0], ids=["slice", "selector"])
+def test_filtered_search_is_exact_on_flat_index(tmp_path, vectors, monkeypatch, slice_scan_max_size):
+    monkeypatch.setattr("mem0.vector_stores.faiss._SLICE_SCAN_MAX_SIZE", slice_scan_max_size)
+    store = make_store(tmp_path)
+    ids = fill(store, vectors)
+    user_ids = [vector_id for vector_id in ids if int(vector_id) % 4 == 2]
+
+    for query in vectors[:5] + 0.1:
+        results = store.search("", query.tolist(), limit=10, filters={"user_id": "user-2"})
+        assert [result.id for result in results] == exact_ids(vectors, query, user_ids, 10)
+    batched = store.search_many(["", ""], (vectors[:2] + 0.1).tolist(), limit=10, filters={"user_id": "user-2"})
+    assert [[result.id for result in results] for results in batched] == [
+        exact_ids(vectors, query, user_ids, 10) for query in vectors[:2] + 0.1
+    ]
+
+
+@pytest.mark.parametrize(
+    "index_type, options",
+    [("flat", {}), ("hnsw", {}), ("ivf_flat", {"nlist": 8}), ("ivf_pq", {"nlist": 8, "pq_m": 4, "pq_nbits": 4})],
+)
+def test_small_tenant_gets_all_its_memories(tmp_path, vectors, index_type, options):
+    store = make_store(tmp_path, index_type=index_type, **options)
+    fill(store, vectors)
+    store.insert(vectors[:3] + 0.5, [{"data": "small", "user_id": "small"}] * 3, ["s0", "s1", "s2"])
+
+    for query in vectors[:10]:
+        results = store.search("", query.tolist(), limit=5, filters={"user_id": "small"})
+        assert sorted(result.id for result in results) == ["s0", "s1", "s2"]
+
+
+@pytest.mark.parametrize("widen", [True, False], ids=["widened", "slice-fallback"])
+@pytest.mark.parametrize("index_type, options", [("hnsw", {}), ("ivf_flat", {"nlist": 8, "nprobe": 1})])
+def test_selector_search_on_approximate_index_returns_limit(tmp_path, vectors, monkeypatch, index_type, options, widen):
+    monkeypatch.setattr("mem0.vector_stores.faiss._SLICE_SCAN_MAX_SIZE", 0)
+    store = make_store(tmp_path, index_type=index_type, **options)
+    fill(store, vectors)
+    if not widen:
+        search_parameters = store._search_parameters
+        monkeypatch.setattr(store, "_search_parameters", lambda selector, coverage=0.0: search_parameters(selector))
+
+    # Each user holds 250 vectors; most of the slice must be returned.
+    for query in vectors[:5]:
+        results = store.search("", query.tolist(), limit=200, filters={"user_id": "user-1"})
+        assert len(results) == 200
+        assert all(result.payload["user_id"] == "user-1" for result in results)
+
+
+def test_filters_on_keys_without_filter_index(tmp_path, vectors):
+    store = make_store(tmp_path)
+    fill(store, vectors)
+    rare = ["10", "500", "990"]
+    for vector_id in rare:
+        store.update(vector_id, payload={"data": "rare", "user_id": "user-2", "category": "rare"})
+
+    # Only a few vectors pass, far from the query: the search widens until it has found them all.
+    results = store.search("", vectors[0].tolist(), limit=5, filters={"category": "rare"})
+    assert sorted(result.id for result in results) == sorted(rare)
+
+    results = store.search("", vectors[0].tolist(), limit=5, filters={"category": "rare", "user_id": "user-2"})
+    assert sorted(result.id for result in results) == sorted(rare)
+    assert store.search("", vectors[0].tolist(), limit=5, filters={"category": "rare", "user_id": "user-1"}) == []
+
+    results = store.search("", vectors[0].tolist(), limit=10, filters={"data": ["memory 1", "memory 2"]})
+    assert sorted(result.id for result in results) == ["1", "2"]